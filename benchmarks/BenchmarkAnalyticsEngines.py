@@ -0,0 +1,95 @@
+"""
+Speed of the python and numpy analytics engines on years of daily data.
+
+Seeds a fresh database with tasks and habit tracking rows for every day of the
+period, checks both engines agree (see tools/CheckEngineParity.py), then times the
+all_time trend methods with the result cache bypassed.
+
+Run from the repository root:  python benchmarks/BenchmarkAnalyticsEngines.py
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+Root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(Root, "src"))
+sys.path.insert(0, os.path.join(Root, "tools"))
+
+from CheckEngineParity import CompareEngines  # noqa: E402
+from core.AnalyticsProcessor import AnalyticsProcessor  # noqa: E402
+from core.HabitManager import HabitManager  # noqa: E402
+from core.TaskManager import TaskManager  # noqa: E402
+from utils.AuthenticationWrapper import GetDBConnection  # noqa: E402
+
+USERNAME = "benchuser"
+YEARS = (1, 5, 10)
+HABITS = 5
+REPEATS = 3
+
+
+def _Seed(DBPath, Days):
+    TaskManager(DBPath)
+    Habits = HabitManager(DBPath)
+    Today = datetime.date.today()
+    HabitIDs = [
+        Habits.AddHabit(USERNAME, f"Habit {Index}", 1, "increase", 1, 10, "2099-01-01")
+        for Index in range(HABITS)
+    ]
+
+    with GetDBConnection(DBPath) as Conn:
+        Cursor = Conn.cursor()
+        for Offset in range(Days):
+            Day = (Today - datetime.timedelta(days=Offset)).isoformat()
+            Cursor.executemany(
+                "INSERT INTO tasks (username, title, status, created_at) VALUES (?, ?, ?, ?)",
+                [
+                    (USERNAME, "Task", random.choice(("pending", "completed")), f"{Day} 12:00:00")
+                    for _ in range(random.randint(0, 3))
+                ],
+            )
+            Cursor.executemany(
+                "INSERT OR REPLACE INTO habit_tracking (habit_id, date, count, suggested_target) VALUES (?, ?, ?, ?)",
+                [
+                    (HabitID, Day, random.randint(0, 12), random.randint(0, 10))
+                    for HabitID in HabitIDs
+                    if random.random() < 0.8
+                ],
+            )
+        Conn.commit()
+
+
+def _Time(Analytics, Method):
+    Func = getattr(AnalyticsProcessor, Method).__wrapped__  # skip the result cache
+    Best = float("inf")
+    for _ in range(REPEATS):
+        Start = time.perf_counter()
+        Func(Analytics, USERNAME, "all_time")
+        Best = min(Best, time.perf_counter() - Start)
+    return Best
+
+
+def main():
+    random.seed(0)
+    print(f"{'years':>5} {'method':<18} {'python ms':>10} {'numpy ms':>10} {'speedup':>8}")
+    for Years in YEARS:
+        DBPath = os.path.join(tempfile.mkdtemp(), "bench.db")
+        _Seed(DBPath, Years * 365)
+        assert not CompareEngines(DBPath, [USERNAME]), "engines disagree"
+
+        Python = AnalyticsProcessor(DBPath, engine="python")
+        Numpy = AnalyticsProcessor(DBPath, engine="numpy")
+        for Method in ("get_task_trends", "get_habit_trends"):
+            PythonTime = _Time(Python, Method)
+            NumpyTime = _Time(Numpy, Method)
+            print(
+                f"{Years:>5} {Method:<18} {PythonTime * 1000:>10.2f} {NumpyTime * 1000:>10.2f}"
+                f" {PythonTime / NumpyTime:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Throughput of TaskManager.BulkImport / BulkExport against one AddTask call per task.
+
+Imports a backlog of tasks (each with two subtasks) into a fresh database with
+BulkImport, times a smaller run through AddTask for comparison, then streams the
+backlog back out with BulkExport and checks it round-trips.
+
+Run from the repository root:  python benchmarks/BenchmarkBulkTasks.py [--tasks 50000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.TaskManager import TaskManager  # noqa: E402
+
+USERNAME = "benchuser"
+ADD_TASK_SAMPLE = 2000  # AddTask is slow enough that a sample gives its rate
+
+
+def _Backlog(Count):
+    # A generator, so BulkImport has to stream it
+    for Index in range(Count):
+        yield {
+            "title": f"Imported task {Index}",
+            "description": f"Description {Index}",
+            "status": "completed" if Index % 3 == 0 else "pending",
+            "created_at": f"2024-{Index % 12 + 1:02d}-{Index % 28 + 1:02d} 09:00:00",
+            "subtasks": [f"Step {Index}.1", {"title": f"Step {Index}.2", "status": "completed"}],
+        }
+
+
+def main():
+    Parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    Parser.add_argument("--tasks", type=int, default=50000)
+    Args = Parser.parse_args()
+
+    TempDir = tempfile.mkdtemp()
+    Tasks = TaskManager(os.path.join(TempDir, "addtask.db"))
+    Start = time.perf_counter()
+    for Record in _Backlog(ADD_TASK_SAMPLE):
+        Tasks.AddTask(USERNAME, Record["title"], Record["description"], [Sub if isinstance(Sub, str) else Sub["title"] for Sub in Record["subtasks"]])
+    AddTaskRate = ADD_TASK_SAMPLE / (time.perf_counter() - Start)
+
+    Tasks = TaskManager(os.path.join(TempDir, "bulk.db"))
+    Start = time.perf_counter()
+    Imported = Tasks.BulkImport(USERNAME, _Backlog(Args.tasks))
+    Elapsed = time.perf_counter() - Start
+    ImportRate = Imported / Elapsed
+    print(f"AddTask:     {AddTaskRate:>9.0f} tasks/s  ({Args.tasks / AddTaskRate:.1f} s for {Args.tasks} tasks)")
+    print(f"BulkImport:  {ImportRate:>9.0f} tasks/s  ({Elapsed:.1f} s, {ImportRate / AddTaskRate:.0f}x)")
+
+    Start = time.perf_counter()
+    Exported = 0
+    for Expected, Record in zip(_Backlog(Args.tasks), Tasks.BulkExport(USERNAME)):
+        if (Record["title"], Record["status"], Record["created_at"]) != (Expected["title"], Expected["status"], Expected["created_at"]) \
+                or len(Record["subtasks"]) != 2:
+            raise SystemExit(f"export mismatch at task {Exported}")
+        Exported += 1
+    Elapsed = time.perf_counter() - Start
+    if Exported != Args.tasks:
+        raise SystemExit(f"exported {Exported} of {Args.tasks} tasks")
+    print(f"BulkExport:  {Exported / Elapsed:>9.0f} tasks/s  ({Elapsed:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
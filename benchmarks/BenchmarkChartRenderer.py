@@ -0,0 +1,67 @@
+"""
+Per-chart render latency with a new figure per chart vs a reused ChartRenderer.
+
+Renders each kind of chart the dashboard uses a number of times with fresh data,
+first through a new ChartRenderer per chart (a new figure every time, as before),
+then through one shared renderer that updates its figures in place.
+
+Run from the repository root:  python benchmarks/BenchmarkChartRenderer.py
+"""
+
+import datetime
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.ChartGenerator import ChartRenderer  # noqa: E402
+
+ROUNDS = 10
+DAYS = 30
+
+
+def _Charts():
+    Today = datetime.date.today()
+    Dates = [(Today - datetime.timedelta(days=Offset)).isoformat() for Offset in range(DAYS, 0, -1)]
+    Series = lambda: [random.uniform(0, 100) for _ in Dates]  # noqa: E731
+    Habits = {f"Habit {Index}": random.uniform(0, 100) for Index in range(8)}
+    return [
+        ("line", [Series(), "Task Completion Rate Trend", "Date", "Completion Rate (%)", Dates]),
+        ("bar", [Habits, "Habit Completion Rates", "Habit", "Completion Rate (%)"]),
+        ("pie", [{"Completed": random.randint(1, 50), "Pending": random.randint(1, 50)}, "Task Status Distribution"]),
+        ("multi_line", [{"Productivity": Series(), "Tasks": Series(), "Habits": Series()},
+                        "Productivity Trends", "Date", "Completion Rate (%)", Dates]),
+    ]
+
+
+def _Time(Render, Rounds):
+    "Median ms per chart kind over the rounds."
+    Timings = {}
+    for Round in Rounds:
+        for Kind, Args in Round:
+            Start = time.perf_counter()
+            Render(Kind, Args)
+            Timings.setdefault(Kind, []).append((time.perf_counter() - Start) * 1000)
+    return {Kind: statistics.median(Values) for Kind, Values in Timings.items()}
+
+
+def main():
+    random.seed(0)
+    Rounds = [_Charts() for _ in range(ROUNDS)]
+
+    Fresh = _Time(lambda Kind, Args: ChartRenderer().render(Kind, *Args), Rounds)
+    Shared = ChartRenderer()
+    for Kind, Args in Rounds[0]:
+        Shared.render(Kind, *Args)  # the first chart of each kind builds its figure either way
+    Reused = _Time(lambda Kind, Args: Shared.render(Kind, *Args), Rounds)
+
+    print(f"{'chart':<12}{'new figure':>12}{'reused':>10}")
+    for Kind in Fresh:
+        print(f"{Kind:<12}{Fresh[Kind]:>9.1f} ms{Reused[Kind]:>7.1f} ms  ({Fresh[Kind] / Reused[Kind]:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Sequential vs process-pool rendering of a dashboard's worth of charts.
+
+Builds seven chart specs shaped like AnalyticsWindow's (a year of daily trend data
+plus bar and pie charts), renders them one after another in-process, then through
+a warmed ChartRenderService, and reports time to first chart and total wall time.
+The same specs are then submitted again, which should all come from the chart cache.
+
+Run from the repository root:  python benchmarks/BenchmarkChartRendering.py
+"""
+
+import datetime
+import os
+import random
+import sys
+import time
+from concurrent.futures import as_completed, wait
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from utils.ChartRenderService import ChartRenderService, RenderChartSpec  # noqa: E402
+
+DAYS = 365
+
+
+def _Specs():
+    Today = datetime.date.today()
+    Dates = [(Today - datetime.timedelta(days=Offset)).isoformat() for Offset in range(DAYS, 0, -1)]
+    Series = lambda: [random.uniform(0, 100) for _ in Dates]  # noqa: E731
+    Habits = {f"Habit {Index}": random.uniform(0, 100) for Index in range(8)}
+    return [
+        {"name": "task_trends", "title": "Task Completion Trends", "kind": "line",
+         "args": [Series(), "Task Completion Rate Trend", "Date", "Completion Rate (%)", Dates]},
+        {"name": "task_status", "title": "Task Status Distribution", "kind": "pie",
+         "args": [{"Completed": 40, "Pending": 60}, "Task Status Distribution"]},
+        {"name": "habit_performance", "title": "Habit Performance", "kind": "bar",
+         "args": [Habits, "Habit Completion Rates", "Habit", "Completion Rate (%)"]},
+        {"name": "habit_streaks", "title": "Habit Streaks", "kind": "bar",
+         "args": [Habits, "Current Habit Streaks", "Habit", "Days"]},
+        {"name": "week_comparison", "title": "Week-over-Week Comparison", "kind": "bar",
+         "args": [{"Last Week": 40.0, "This Week": 55.0}, "Week-over-Week Task Completion", "Period", "Completion Rate (%)"]},
+        {"name": "productivity_trend", "title": "Productivity Trends", "kind": "multi_line",
+         "args": [{"Productivity": Series(), "Tasks": Series(), "Habits": Series()},
+                  "Productivity Trends", "Date", "Completion Rate (%)", Dates]},
+        {"name": "goal_forecast", "title": "Goal Achievement Forecast", "kind": "bar",
+         "args": [{Name: random.randint(0, 1) for Name in Habits}, "Habit Goal Achievement Status",
+                  "Habit", "Status (1=On Track, 0=Behind)"]},
+    ]
+
+
+def main():
+    random.seed(0)
+    Specs = _Specs()
+
+    Start = time.perf_counter()
+    First = None
+    for Spec in Specs:
+        RenderChartSpec(Spec)
+        First = First or time.perf_counter() - Start
+    Sequential = time.perf_counter() - Start
+    print(f"sequential:   first chart {First * 1000:7.0f} ms, all charts {Sequential * 1000:7.0f} ms")
+
+    Service = ChartRenderService()
+    wait(Service.Warmup())
+    try:
+        Start = time.perf_counter()
+        First = None
+        for Future in as_completed(Service.SubmitAll(Specs)):
+            Future.result()
+            First = First or time.perf_counter() - Start
+        Parallel = time.perf_counter() - Start
+        print(
+            f"{Service.MaxProcesses} processes:  first chart {First * 1000:7.0f} ms,"
+            f" all charts {Parallel * 1000:7.0f} ms ({Sequential / Parallel:.1f}x)"
+        )
+
+        Start = time.perf_counter()
+        for Future in Service.SubmitAll(Specs):
+            Future.result()
+        Cached = time.perf_counter() - Start
+        Stats = Service.Cache.GetStats()
+        print(
+            f"cached:       all charts {Cached * 1000:7.1f} ms"
+            f" (hit ratio {Stats['hit_ratio']}%, {Stats['bytes'] / 1024 / 1024:.1f} MB cached)"
+        )
+    finally:
+        Service.Shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Per-habit vs batched generation of the day's habit goals.
+
+Seeds users with hundreds of habits that were tracked yesterday but not yet today,
+then times HabitManager.CheckAndGenerateDailyGoals (one query for all habits, one
+executemany) against the previous loop (two SELECTs and an INSERT per habit).
+Both must produce the same targets.
+
+Run from the repository root:  python benchmarks/BenchmarkDailyGoals.py
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.HabitManager import HabitManager  # noqa: E402
+from utils.AuthenticationWrapper import GetDBConnection  # noqa: E402
+
+HABIT_COUNTS = (100, 300, 1000)
+REPEATS = 3
+
+
+def _Seed(DBPath, Username, Count):
+    Habits = HabitManager(DBPath)
+    Yesterday = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+    with GetDBConnection(DBPath) as Conn:
+        Cursor = Conn.cursor()
+        for Index in range(Count):
+            GoalType = random.choice(("increase", "decrease"))
+            Cursor.execute(
+                """INSERT INTO habits (username, habit_name, is_positive, goal_type, baseline_count, target_count, target_date)
+                VALUES (?, ?, 1, ?, ?, ?, '2099-01-01')""",
+                (Username, f"Habit {Index}", GoalType, 5, 50 if GoalType == "increase" else 0),
+            )
+            Cursor.execute(
+                "INSERT INTO habit_tracking (habit_id, date, count, suggested_target) VALUES (?, ?, ?, ?)",
+                (Cursor.lastrowid, Yesterday, random.randint(0, 10), random.randint(1, 10)),
+            )
+        Conn.commit()
+    return Habits
+
+
+def _PerHabitGenerate(Habits, Username):
+    "The previous implementation, two SELECTs and one INSERT per habit."
+    Today = datetime.date.today()
+    Yesterday = (Today - datetime.timedelta(days=1)).isoformat()
+    Discipline = Habits._GetUserStats(Username)["discipline"]
+    with GetDBConnection(Habits.DBPath) as Conn:
+        Cursor = Conn.cursor()
+        for Habit in Habits.GetUserHabits(Username):
+            Cursor.execute(
+                "SELECT count, suggested_target FROM habit_tracking WHERE habit_id = ? AND date = ?",
+                (Habit["id"], Today.isoformat()),
+            )
+            if Cursor.fetchone() is not None:
+                continue
+            Cursor.execute(
+                "SELECT count, suggested_target FROM habit_tracking WHERE habit_id = ? AND date = ?",
+                (Habit["id"], Yesterday),
+            )
+            Target = Habits._CalculateNewTarget(Habit, Discipline, Cursor.fetchone(), Today)
+            Cursor.execute(
+                "INSERT INTO habit_tracking (habit_id, date, count, suggested_target) VALUES (?, ?, 0, ?)",
+                (Habit["id"], Today.isoformat(), Target),
+            )
+        Conn.commit()
+
+
+def _TodaysTargets(DBPath, Username):
+    with GetDBConnection(DBPath) as Conn:
+        Cursor = Conn.cursor()
+        Cursor.execute(
+            """SELECT habit_tracking.habit_id, suggested_target FROM habit_tracking
+            JOIN habits ON habits.id = habit_tracking.habit_id
+            WHERE habits.username = ? AND date = ?""",
+            (Username, datetime.date.today().isoformat()),
+        )
+        return dict(Cursor.fetchall())
+
+
+def _ClearToday(DBPath, Username):
+    with GetDBConnection(DBPath) as Conn:
+        Conn.execute(
+            """DELETE FROM habit_tracking WHERE date = ?
+            AND habit_id IN (SELECT id FROM habits WHERE username = ?)""",
+            (datetime.date.today().isoformat(), Username),
+        )
+        Conn.commit()
+
+
+def _Time(Generate, DBPath, Username):
+    Best = None
+    for _ in range(REPEATS):
+        _ClearToday(DBPath, Username)
+        Start = time.perf_counter()
+        Generate(Username)
+        Elapsed = time.perf_counter() - Start
+        Best = Elapsed if Best is None else min(Best, Elapsed)
+    return Best, _TodaysTargets(DBPath, Username)
+
+
+def main():
+    random.seed(0)
+    DBPath = os.path.join(tempfile.mkdtemp(), "bench.db")
+    print(f"{'habits':>7}{'per habit':>12}{'batched':>10}")
+    for Count in HABIT_COUNTS:
+        Username = f"bench{Count}"
+        Habits = _Seed(DBPath, Username, Count)
+        Old, OldTargets = _Time(lambda Name: _PerHabitGenerate(Habits, Name), DBPath, Username)
+        New, NewTargets = _Time(Habits.CheckAndGenerateDailyGoals, DBPath, Username)
+        if OldTargets != NewTargets or len(NewTargets) != Count:
+            raise SystemExit(f"targets differ for {Count} habits")
+        print(f"{Count:>7}{Old * 1000:>9.1f} ms{New * 1000:>7.1f} ms  ({Old / New:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
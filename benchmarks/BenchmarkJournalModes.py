@@ -0,0 +1,90 @@
+"""
+Read/write concurrency benchmark for the SQLite connection profiles.
+
+One writer thread increments habits (like clicking +1 in the Habit Tracker) while
+reader threads fetch task stats (like the Analytics dashboard). Each profile runs
+against a fresh database so journal modes don't leak between runs.
+
+Run from the repository root:  python benchmarks/BenchmarkJournalModes.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.AnalyticsProcessor import AnalyticsProcessor  # noqa: E402
+from core.HabitManager import HabitManager  # noqa: E402
+from core.TaskManager import TaskManager  # noqa: E402
+from utils.AuthenticationWrapper import SetConnectionProfile  # noqa: E402
+
+USERNAME = "benchuser"
+DURATION = 3.0
+READERS = 3
+
+
+def _Seed(DBPath):
+    Tasks = TaskManager(DBPath)
+    Habits = HabitManager(DBPath)
+    for Index in range(2000):
+        Tasks.AddTask(USERNAME, f"Task {Index}")
+    return [
+        Habits.AddHabit(USERNAME, f"Habit {Index}", 1, "increase", 1, 10, "2099-01-01")
+        for Index in range(10)
+    ]
+
+
+def _Run(Profile):
+    SetConnectionProfile(Profile)
+    DBPath = os.path.join(tempfile.mkdtemp(), "bench.db")
+    HabitIDs = _Seed(DBPath)
+    # Unbuffered, so every increment is its own write transaction
+    Habits = HabitManager(DBPath, SyncIncrements=True)
+    Analytics = AnalyticsProcessor(DBPath)
+
+    Stop = threading.Event()
+    Counts = {"writes": 0, "reads": 0}
+    Lock = threading.Lock()
+
+    def Writer():
+        Index = 0
+        while not Stop.is_set():
+            Habits.IncrementHabit(HabitIDs[Index % len(HabitIDs)])
+            Index += 1
+        with Lock:
+            Counts["writes"] += Index
+
+    def Reader():
+        Done = 0
+        while not Stop.is_set():
+            Analytics.get_task_stats(USERNAME, "this_month")
+            Done += 1
+        with Lock:
+            Counts["reads"] += Done
+
+    Threads = [threading.Thread(target=Writer)] + [
+        threading.Thread(target=Reader) for _ in range(READERS)
+    ]
+    for Thread in Threads:
+        Thread.start()
+    time.sleep(DURATION)
+    Stop.set()
+    for Thread in Threads:
+        Thread.join()
+
+    return Counts["writes"] / DURATION, Counts["reads"] / DURATION
+
+
+def main():
+    print(f"{'profile':<10} {'writes/s':>10} {'reads/s':>10}")
+    for Profile in (None, "durable", "balanced", "fast"):
+        Writes, Reads = _Run(Profile)
+        print(f"{Profile or 'default':<10} {Writes:>10.0f} {Reads:>10.0f}")
+    SetConnectionProfile("balanced")
+
+
+if __name__ == "__main__":
+    main()
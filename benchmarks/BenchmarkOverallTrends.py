@@ -0,0 +1,101 @@
+"""
+Scaling benchmark for merging task and habit trends in get_overall_trends.
+
+Feeds synthetic daily series (1 to 10 years) into the old list.index() merge and the
+current dict join, and prints the time per date so the growth of each is visible.
+Half the days have task data and two thirds have habit data, so the date lists
+only partly overlap, as they do for real users.
+
+Run from the repository root:  python benchmarks/BenchmarkOverallTrends.py
+"""
+
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.AnalyticsProcessor import AnalyticsProcessor  # noqa: E402
+
+USERNAME = "benchuser"
+YEARS = (1, 2, 5, 10)
+REPEATS = 3
+
+
+def _Series(Days, Every):
+    Start = datetime.date.today() - datetime.timedelta(days=Days)
+    Dates = [
+        (Start + datetime.timedelta(days=Offset)).strftime("%Y-%m-%d")
+        for Offset in range(Days)
+        if Offset % Every
+    ]
+    return Dates, [random.uniform(0, 100) for _ in Dates]
+
+
+class _SyntheticAnalytics(AnalyticsProcessor):
+    """Serves fixed trend series so only the merge is measured."""
+
+    def __init__(self, DBPath, Days):
+        super().__init__(DBPath)
+        self.TaskDates, self.TaskRates = _Series(Days, 2)
+        self.HabitDates, self.HabitRates = _Series(Days, 3)
+
+    def get_task_trends(self, username, time_range="all_time"):
+        return {"dates": self.TaskDates, "completion_rates": self.TaskRates}
+
+    def get_habit_trends(self, username, time_range="all_time", include_habit_data=True):
+        return {"dates": self.HabitDates, "completion_percentages": self.HabitRates}
+
+
+def _QuadraticMerge(TaskTrends, HabitTrends):
+    # The previous implementation, kept here for comparison
+    AllDates = sorted(set(TaskTrends["dates"] + HabitTrends["dates"]))
+    Combined = []
+    for Date in AllDates:
+        TaskScore = 0
+        HabitScore = 0
+        if Date in TaskTrends["dates"]:
+            TaskScore = TaskTrends["completion_rates"][TaskTrends["dates"].index(Date)]
+        if Date in HabitTrends["dates"]:
+            HabitScore = HabitTrends["completion_percentages"][HabitTrends["dates"].index(Date)]
+        Combined.append(TaskScore * 0.5 + HabitScore * 0.5)
+    return Combined
+
+
+def _Time(Func):
+    Best = float("inf")
+    for _ in range(REPEATS):
+        Start = time.perf_counter()
+        Result = Func()
+        Best = min(Best, time.perf_counter() - Start)
+    return Best, Result
+
+
+def main():
+    random.seed(0)
+    DBPath = os.path.join(tempfile.mkdtemp(), "bench.db")
+    # Skip the result cache, every call should do the full merge
+    OverallTrends = AnalyticsProcessor.get_overall_trends.__wrapped__
+
+    print(f"{'years':>5} {'dates':>7} {'old ms':>10} {'new ms':>10} {'old us/date':>12} {'new us/date':>12}")
+    for Years in YEARS:
+        Analytics = _SyntheticAnalytics(DBPath, Years * 365)
+        TaskTrends = Analytics.get_task_trends(USERNAME)
+        HabitTrends = Analytics.get_habit_trends(USERNAME)
+
+        OldTime, OldScores = _Time(lambda: _QuadraticMerge(TaskTrends, HabitTrends))
+        NewTime, Result = _Time(lambda: OverallTrends(Analytics, USERNAME))
+        assert Result["productivity_scores"] == OldScores, "merge results differ"
+
+        Dates = len(Result["dates"])
+        print(
+            f"{Years:>5} {Dates:>7} {OldTime * 1000:>10.2f} {NewTime * 1000:>10.2f}"
+            f" {OldTime / Dates * 1e6:>12.2f} {NewTime / Dates * 1e6:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,89 @@
 import datetime
-from typing import Any
+import functools
+import inspect
+import threading
+from collections import OrderedDict
 from core.TaskManager import TaskManager
 from core.HabitManager import HabitManager
+from core.StreakEngine import StreakEngine
+from core import NumpyTrends
 from utils.AuthenticationWrapper import GetDBConnection
+from utils.DataVersion import GetDataVersion
+
+
+def _cached(method):
+    """
+    Memoize an analytics method per (method, username, arguments, day, data version).
+    TaskManager/HabitManager bump the user's data version on every write, so any
+    write makes the old entries unreachable and they age out of the LRU.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, username, *args, **kwargs):
+        # Bind against the signature so f(u) and f(u, "all_time") share an entry
+        bound = signature.bind(self, username, *args, **kwargs)
+        bound.apply_defaults()
+        key = (
+            method.__name__,
+            tuple(bound.arguments.items())[1:],
+            datetime.date.today(),  # time ranges are relative to today
+            GetDataVersion(username),
+        )
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+            self.cache_misses += 1
+
+        result = method(self, username, *args, **kwargs)
+
+        with self._cache_lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    return wrapper
 
 
 class AnalyticsProcessor:
-    def __init__(self, DBPath="src/core/UsersDatabase.db"):
+    ENGINES = ("python", "numpy")
+
+    def __init__(self, DBPath="src/core/UsersDatabase.db", cache_size=256, engine="python",
+                 task_manager=None, habit_manager=None):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown analytics engine: {engine}")
         self.DBPath = DBPath
-        self.TaskManager = TaskManager(DBPath)
-        self.HabitManager = HabitManager(DBPath)
+        self.engine = engine  # "numpy" builds the trend series with vectorised NumPy code
+        # Shared managers can be passed in (see ServiceContainer) instead of building new ones
+        self.TaskManager = task_manager or TaskManager(DBPath)
+        self.HabitManager = habit_manager or HabitManager(DBPath)
+
+        # Results are shared with callers, so they must treat them as read-only
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # username -> (habit definitions, global data version, StreakEngine)
+        self._streak_engines = {}
+        self._streak_lock = threading.Lock()
+
+    def get_cache_stats(self):
+        total = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "entries": len(self._cache),
+            "hit_rate": round(self.cache_hits / total * 100, 1) if total else 0,
+        }
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
 
     def _get_date_range(self, time_range):
         today = datetime.date.today()
@@ -54,53 +128,95 @@ class AnalyticsProcessor:
         return start_date <= date_obj <= end_date
 
 
-    def get_task_stats(self, username, time_range="all_time"): # defaults to all time if no time range is provided
-        start_date, end_date = self._get_date_range(time_range)
-        
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-            
-            if start_date is None: # MEANS IT'S ALL TIME
-                Cursor.execute(
-                    "SELECT COUNT(*) FROM tasks WHERE username = ?",
-                    (username,)
-                )
-                total = Cursor.fetchone()[0]
-                
-                Cursor.execute(
-                    "SELECT COUNT(*) FROM tasks WHERE username = ? AND status = 'completed'",
-                    (username,)
-                )
-                completed = Cursor.fetchone()[0]
+    def _get_comparison_ranges(self):
+        """Returns (start, end) dates for this/last week and this/last month"""
+        today = datetime.date.today()
+
+        this_week_start = today - datetime.timedelta(days=today.weekday())
+        last_week_end = this_week_start - datetime.timedelta(days=1)
+        last_week_start = last_week_end - datetime.timedelta(days=6)
+
+        this_month_start = today.replace(day=1)
+        last_month_end = this_month_start - datetime.timedelta(days=1)
+        last_month_start = last_month_end.replace(day=1)
+
+        return {
+            "this_week": (this_week_start, today),
+            "last_week": (last_week_start, last_week_end),
+            "this_month": (this_month_start, today),
+            "last_month": (last_month_start, last_month_end),
+        }
+
+    def _count_tasks_by_bucket(self, username, buckets):
+        """
+        Count total and completed tasks for several date buckets in a single scan.
+        buckets maps a name to (start_date, end_date); (None, None) means all time.
+        Buckets may overlap (this week sits inside this month), so each one gets its
+        own SUM(CASE ...) column rather than a GROUP BY.
+        """
+        columns = []
+        params = []
+        for start_date, end_date in buckets.values():
+            if start_date is None:
+                columns.append("COUNT(*)")
+                columns.append("SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END)")
             else:
-                start_str = start_date.isoformat()
-                end_str = end_date.isoformat()
-                
-                Cursor.execute(
-                    """SELECT COUNT(*) FROM tasks 
-                    WHERE username = ? AND created_at >= ? AND created_at <= ?""",
-                    (username, start_str, end_str + " 23:59:59")
+                bounds = (start_date.isoformat(), end_date.isoformat() + " 23:59:59")
+                columns.append("SUM(CASE WHEN created_at >= ? AND created_at <= ? THEN 1 ELSE 0 END)")
+                columns.append(
+                    "SUM(CASE WHEN created_at >= ? AND created_at <= ? AND status = 'completed' THEN 1 ELSE 0 END)"
                 )
-                total = Cursor.fetchone()[0]
-                
-                Cursor.execute(
-                    """SELECT COUNT(*) FROM tasks 
-                    WHERE username = ? AND status = 'completed' 
-                    AND created_at >= ? AND created_at <= ?""",
-                    (username, start_str, end_str + " 23:59:59")
-                )
-                completed = Cursor.fetchone()[0]
-            
-            pending = max(0, total - completed)
-            completion_rate = (completed / total * 100) if total > 0 else 0 #precaution to default completion rate to 0 if no tasks are found
-            
-            return {
-                "total": total,
-                "completed": completed,
-                "pending": pending,
-                "completion_rate": round(completion_rate, 1)
-            }
+                params.extend(bounds * 2)
+
+        query = f"SELECT {', '.join(columns)} FROM tasks WHERE username = ?"
+        params.append(username)
+
+        # Only scan the rows the buckets can match
+        if all(start is not None for start, _ in buckets.values()):
+            query += " AND created_at >= ? AND created_at <= ?"
+            params.append(min(start for start, _ in buckets.values()).isoformat())
+            params.append(max(end for _, end in buckets.values()).isoformat() + " 23:59:59")
+
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            Cursor.execute(query, params)
+            row = Cursor.fetchone()
 
+        counts = {}
+        for index, name in enumerate(buckets):
+            total = row[index * 2] or 0
+            completed = row[index * 2 + 1] or 0
+            counts[name] = (total, completed)
+        return counts
+
+    def _build_task_stats(self, total, completed):
+        pending = max(0, total - completed)
+        completion_rate = (completed / total * 100) if total > 0 else 0 #precaution to default completion rate to 0 if no tasks are found
+
+        return {
+            "total": total,
+            "completed": completed,
+            "pending": pending,
+            "completion_rate": round(completion_rate, 1)
+        }
+
+    @_cached
+    def get_task_stats(self, username, time_range="all_time"): # defaults to all time if no time range is provided
+        start_date, end_date = self._get_date_range(time_range)
+        counts = self._count_tasks_by_bucket(username, {time_range: (start_date, end_date)})
+        total, completed = counts[time_range]
+        return self._build_task_stats(total, completed)
+
+    @_cached
+    def get_task_summary(self, username):
+        """Returns task stats for this week, last week, this month and last month from one query"""
+        counts = self._count_tasks_by_bucket(username, self._get_comparison_ranges())
+        return {
+            name: self._build_task_stats(total, completed)
+            for name, (total, completed) in counts.items()
+        }
+
+    @_cached
     def get_task_trends(self, username, time_range="all_time"):
         start_date, end_date = self._get_date_range(time_range)
         
@@ -109,7 +225,7 @@ class AnalyticsProcessor:
             with GetDBConnection(self.DBPath) as Conn:
                 Cursor = Conn.cursor()
                 Cursor.execute(
-                    """SELECT MIN(created_at) FROM tasks WHERE username = ?""",
+                    """SELECT MIN(date) FROM daily_task_rollup WHERE username = ? AND created > 0""",
                     (username,)
                 )
                 result = Cursor.fetchone()[0]
@@ -121,21 +237,25 @@ class AnalyticsProcessor:
                     start_date = datetime.date.today()
                 end_date = datetime.date.today()
         
-        # Get all tasks in range
+        # Daily totals come pre-aggregated from the rollup table
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
-            start_str = start_date.isoformat()
-            end_str = end_date.isoformat()
-            
-            # Get all tasks in range
             Cursor.execute(
-                """SELECT created_at, status
-                FROM tasks 
-                WHERE username = ? AND created_at >= ? AND created_at <= ?""",
-                (username, start_str, end_str + " 23:59:59")
+                """SELECT date, created, completed
+                FROM daily_task_rollup
+                WHERE username = ? AND date >= ? AND date <= ?""",
+                (username, start_date.isoformat(), end_date.isoformat())
             )
             all_rows = Cursor.fetchall()
-        
+
+        if self.engine == "numpy":
+            try:
+                return NumpyTrends.build_task_trends(start_date, end_date, all_rows)
+            except ValueError:
+                pass  # a malformed date string, the python engine skips those rows
+        return self._build_task_trends(start_date, end_date, all_rows)
+
+    def _build_task_trends(self, start_date, end_date, all_rows):
         # Organize data by date
         daily_data = {}
         current_date = start_date
@@ -143,15 +263,10 @@ class AnalyticsProcessor:
             daily_data[current_date.isoformat()] = {"created": 0, "completed": 0}
             current_date += datetime.timedelta(days=1)
         
-        # Process rows and group by date
-        for row in all_rows:
-            created_at_str, status = row
-            date_obj = self._parse_date(created_at_str)
-            if date_obj and date_obj.isoformat() in daily_data:
-                date_iso = date_obj.isoformat()
-                daily_data[date_iso]["created"] += 1
-                if status == "completed":
-                    daily_data[date_iso]["completed"] += 1
+        for date_str, created, completed in all_rows:
+            if date_str in daily_data:
+                daily_data[date_str]["created"] += created
+                daily_data[date_str]["completed"] += completed
         
         # Calculate completion rates
         dates = sorted(daily_data.keys())
@@ -176,90 +291,32 @@ class AnalyticsProcessor:
             "daily_created": [daily_data[d]["created"] for d in dates]
         }
 
+    @_cached
     def get_task_comparison(self, username):
         """Returns week-over-week and month-over-month comparisons"""
-        today = datetime.date.today()
-        
-        # This week
-        days_since_monday = today.weekday()
-        this_week_start = today - datetime.timedelta(days=days_since_monday)
-        this_week_stats = self.get_task_stats(username, "this_week")
-        
-        # Last week
-        last_week_end = this_week_start - datetime.timedelta(days=1)
-        last_week_start = last_week_end - datetime.timedelta(days=6)
-        
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-            Cursor.execute(
-                """SELECT COUNT(*) FROM tasks 
-                WHERE username = ? AND created_at >= ? AND created_at <= ?""",
-                (username, last_week_start.isoformat(), last_week_end.isoformat() + " 23:59:59")
-            )
-            last_week_total = Cursor.fetchone()[0] or 0
-            
-            Cursor.execute(
-                """SELECT COUNT(*) FROM tasks 
-                WHERE username = ? AND status = 'completed' 
-                AND created_at >= ? AND created_at <= ?""",
-                (username, last_week_start.isoformat(), last_week_end.isoformat() + " 23:59:59")
-            )
-            last_week_completed = Cursor.fetchone()[0] or 0
-        
-        last_week_rate = (last_week_completed / last_week_total * 100) if last_week_total > 0 else 0
-        
-        # This month
-        this_month_start = today.replace(day=1)
-        this_month_stats = self.get_task_stats(username, "this_month")
-        
-        # Last month
-        if today.month == 1:
-            last_month_start = datetime.date(today.year - 1, 12, 1)
-        else:
-            last_month_start = datetime.date(today.year, today.month - 1, 1)
-        
-        if today.month == 1:
-            last_month_end = datetime.date(today.year - 1, 12, 31)
-        else:
-            if today.month == 3:  # March
-                last_month_end = datetime.date(today.year, 2, 28)
-            elif today.month in [5, 7, 10, 12]:  # Months with 31 days before
-                last_month_end = datetime.date(today.year, today.month - 1, 30)
-            else:
-                last_month_end = datetime.date(today.year, today.month - 1, 31)
-        
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-            Cursor.execute(
-                """SELECT COUNT(*) FROM tasks 
-                WHERE username = ? AND created_at >= ? AND created_at <= ?""",
-                (username, last_month_start.isoformat(), last_month_end.isoformat() + " 23:59:59")
-            )
-            last_month_total = Cursor.fetchone()[0] or 0
-            
-            Cursor.execute(
-                """SELECT COUNT(*) FROM tasks 
-                WHERE username = ? AND status = 'completed' 
-                AND created_at >= ? AND created_at <= ?""",
-                (username, last_month_start.isoformat(), last_month_end.isoformat() + " 23:59:59")
-            )
-            last_month_completed = Cursor.fetchone()[0] or 0
-        
-        last_month_rate = (last_month_completed / last_month_total * 100) if last_month_total > 0 else 0
-        
+        counts = self._count_tasks_by_bucket(username, self._get_comparison_ranges())
+
+        rates = {}
+        for name, (total, completed) in counts.items():
+            rates[name] = (completed / total * 100) if total > 0 else 0
+
+        this_week_rate = round(rates["this_week"], 1)
+        this_month_rate = round(rates["this_month"], 1)
+
         return {
             "week_over_week": {
-                "this_week": this_week_stats["completion_rate"],
-                "last_week": round(last_week_rate, 1),
-                "change": round(this_week_stats["completion_rate"] - last_week_rate, 1)
+                "this_week": this_week_rate,
+                "last_week": round(rates["last_week"], 1),
+                "change": round(this_week_rate - rates["last_week"], 1)
             },
             "month_over_month": {
-                "this_month": this_month_stats["completion_rate"],
-                "last_month": round(last_month_rate, 1),
-                "change": round(this_month_stats["completion_rate"] - last_month_rate, 1)
+                "this_month": this_month_rate,
+                "last_month": round(rates["last_month"], 1),
+                "change": round(this_month_rate - rates["last_month"], 1)
             }
         }
 
+    @_cached
     def get_task_forecast(self, username):
         today = datetime.date.today()
         week_ago = today - datetime.timedelta(days=7)
@@ -299,6 +356,7 @@ class AnalyticsProcessor:
                 "days_remaining": None
             }
 
+    @_cached
     def get_habit_stats(self, username, time_range="all_time"):
         start_date, end_date = self._get_date_range(time_range)
         habits = self.HabitManager.GetUserHabits(username)
@@ -310,42 +368,35 @@ class AnalyticsProcessor:
                 "habits_with_streaks": 0}
 
         total_habits = len(habits)
+        streaks = self.get_habit_streaks(username)
+        streaks_count = sum(
+            1 for habit in habits
+            if habit["id"] in streaks and streaks[habit["id"]]["current_streak"] > 0
+        )
+
+        # The average is per habit, so it needs per-habit counts rather than the
+        # per-user daily rollup - one grouped query instead of one per habit
+        habit_ids = [h["id"] for h in habits]
+        placeholders = ",".join("?" * len(habit_ids))
+        query = f"""SELECT habit_id, COUNT(*), SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
+            FROM habit_tracking WHERE habit_id IN ({placeholders})"""
+        params = list(habit_ids)
+        if start_date is not None:
+            query += " AND date >= ? AND date <= ?"
+            params += [start_date.isoformat(), end_date.isoformat()]
+        query += " GROUP BY habit_id"
+
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            Cursor.execute(query, params)
+            rows = {row[0]: row for row in Cursor.fetchall()}
+
         completion_rates = []
-        streaks_count = 0
-        
-        for habit in habits:
-            habit_id = habit["id"]
-            streaks = self.get_habit_streaks(username)
-            if habit_id in streaks and streaks[habit_id]["current_streak"] > 0:
-                streaks_count += 1
-            
-            if start_date is None: # all time
-                with GetDBConnection(self.DBPath) as Conn:
-                    Cursor = Conn.cursor()
-                    Cursor.execute(
-                        """SELECT COUNT(*), SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
-                        FROM habit_tracking WHERE habit_id = ?""",
-                        (habit_id,)
-                    )
-                    row = Cursor.fetchone()
-                    if row and row[0] and row[0] > 0:
-                        rate = (row[1] or 0) / row[0] * 100
-                        completion_rates.append(rate)
-            else:
-                start_str = start_date.isoformat()
-                end_str = end_date.isoformat()
-                with GetDBConnection(self.DBPath) as Conn:
-                    Cursor = Conn.cursor()
-                    Cursor.execute(
-                        """SELECT COUNT(*), SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
-                        FROM habit_tracking 
-                        WHERE habit_id = ? AND date >= ? AND date <= ?""",
-                        (habit_id, start_str, end_str)
-                    )
-                    row = Cursor.fetchone()
-                    if row and row[0] and row[0] > 0:
-                        rate = (row[1] or 0) / row[0] * 100
-                        completion_rates.append(rate)
+        for habit_id in habit_ids:
+            row = rows.get(habit_id)
+            if row and row[1] and row[1] > 0:
+                rate = (row[2] or 0) / row[1] * 100
+                completion_rates.append(rate)
         
         avg_completion_rate = sum(completion_rates) / len(completion_rates) if completion_rates else 0
         
@@ -356,14 +407,18 @@ class AnalyticsProcessor:
             "habits_with_streaks": streaks_count
         }
 
-    def get_habit_trends(self, username, time_range="all_time"):
+    @_cached
+    def get_habit_trends(self, username, time_range="all_time", include_habit_data=True):
         start_date, end_date = self._get_date_range(time_range)
         habits = self.HabitManager.GetUserHabits(username)
         
         if start_date is None:
             with GetDBConnection(self.DBPath) as Conn:
                 Cursor = Conn.cursor()
-                Cursor.execute("""SELECT MIN(date) FROM habit_tracking""")
+                Cursor.execute(
+                    """SELECT MIN(date) FROM daily_habit_rollup WHERE username = ? AND tracked > 0""",
+                    (username,)
+                )
                 result = Cursor.fetchone()[0]
                 if result:
                     start_date = self._parse_date(result)
@@ -373,46 +428,68 @@ class AnalyticsProcessor:
                     start_date = datetime.date.today()
                 end_date = datetime.date.today()
         
-        # Get tracking data
         habit_ids = [h["id"] for h in habits]
         if not habit_ids:
             return {"dates": [], "completion_percentages": [], "habit_data": {}}
         
+        start_str = start_date.isoformat()
+        end_str = end_date.isoformat()
+
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
-            placeholders = ",".join("?" * len(habit_ids))
-            start_str = start_date.isoformat()
-            end_str = end_date.isoformat()
-            
+            # Overall daily totals come pre-aggregated from the rollup table
             Cursor.execute(
-                f"""SELECT habit_id, date, count, suggested_target
-                FROM habit_tracking
-                WHERE habit_id IN ({placeholders}) AND date >= ? AND date <= ?
-                ORDER BY date""",
-                (*habit_ids, start_str, end_str)
+                """SELECT date, tracked, completed
+                FROM daily_habit_rollup
+                WHERE username = ? AND date >= ? AND date <= ?""",
+                (username, start_str, end_str)
             )
-            rows = Cursor.fetchall()
-        
+            daily_rows = Cursor.fetchall()
+
+            # Per-habit series still need the raw rows, so skip them when the caller doesn't
+            rows = []
+            if include_habit_data:
+                placeholders = ",".join("?" * len(habit_ids))
+                Cursor.execute(
+                    f"""SELECT habit_id, date, count, suggested_target
+                    FROM habit_tracking
+                    WHERE habit_id IN ({placeholders}) AND date >= ? AND date <= ?
+                    ORDER BY date""",
+                    (*habit_ids, start_str, end_str)
+                )
+                rows = Cursor.fetchall()
+
+        if self.engine == "numpy":
+            try:
+                return NumpyTrends.build_habit_trends(start_date, end_date, habit_ids, daily_rows, rows)
+            except ValueError:
+                pass
+        return self._build_habit_trends(start_date, end_date, habit_ids, daily_rows, rows)
+
+    def _build_habit_trends(self, start_date, end_date, habit_ids, daily_rows, rows):
         daily_data = {}
         current_date = start_date
         while current_date <= end_date:
             daily_data[current_date.isoformat()] = {"completed": 0, "total": 0}
             current_date += datetime.timedelta(days=1)
-        
+
+        for date_str, tracked, completed in daily_rows:
+            if date_str in daily_data:
+                daily_data[date_str]["total"] += tracked
+                daily_data[date_str]["completed"] += completed
+
         habit_data = {hid: {"dates": [], "completion_rates": []} for hid in habit_ids}
-        
+        seen_dates = {hid: set() for hid in habit_ids}  # habit_data's dates, for O(1) lookups
+
         for row in rows:
             habit_id, date_str, count, target = row
             date_obj = self._parse_date(date_str)
             if date_obj and date_obj.isoformat() in daily_data:
                 date_iso = date_obj.isoformat()
-                daily_data[date_iso]["total"] += 1
-                if target > 0 and count >= target:
-                    daily_data[date_iso]["completed"] += 1
-                
                 # Per-habit data
                 if habit_id in habit_data:
-                    if date_iso not in habit_data[habit_id]["dates"]:
+                    if date_iso not in seen_dates[habit_id]:
+                        seen_dates[habit_id].add(date_iso)
                         habit_data[habit_id]["dates"].append(date_iso)
                         rate = (count / target * 100) if target > 0 else 0
                         habit_data[habit_id]["completion_rates"].append(min(rate, 100))
@@ -434,93 +511,79 @@ class AnalyticsProcessor:
             "habit_data": habit_data
         }
 
-    def get_habit_streaks(self, username):
-        habits = self.HabitManager.GetUserHabits(username)
-        streaks_data = {}
-        
-        for habit in habits:
-            habit_id = habit["id"]
-            target_count = habit["target_count"]
-            goal_type = habit["goal_type"]
-            
-            with GetDBConnection(self.DBPath) as Conn:
-                Cursor = Conn.cursor()
+    def _get_streak_engine(self, username, habits):
+        """
+        Return a StreakEngine for the user's habits. The engine built by the last call is
+        reused while the day, the habit definitions and the global data version are
+        unchanged (the app only ever writes today's rows), refreshing just today's rows.
+        """
+        today = datetime.date.today()
+        habit_key = tuple((h["id"], h["goal_type"], h["target_count"]) for h in habits)
+        global_version = GetDataVersion(username)[0]
+
+        with self._streak_lock:
+            entry = self._streak_engines.get(username)
+        reusable = (
+            entry is not None
+            and entry[0] == habit_key
+            and entry[1] == global_version
+            and entry[2].Today == today
+        )
+
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            if not reusable:
                 Cursor.execute(
-                    """SELECT date, count, suggested_target
+                    """SELECT habit_tracking.habit_id, habit_tracking.date, habit_tracking.count, habit_tracking.suggested_target
                     FROM habit_tracking
-                    WHERE habit_id = ?
-                    ORDER BY date DESC""",
-                    (habit_id,)
+                    JOIN habits ON habits.id = habit_tracking.habit_id
+                    WHERE habits.username = ?
+                    ORDER BY habit_tracking.habit_id, habit_tracking.date""",
+                    (username,)
                 )
-                rows = Cursor.fetchall()
-            
-            if not rows:
-                streaks_data[habit_id] = {
+                engine = StreakEngine(habits, Cursor, today)
+                with self._streak_lock:
+                    self._streak_engines[username] = (habit_key, global_version, engine)
+                return engine
+
+            Cursor.execute(
+                """SELECT habit_tracking.habit_id, habit_tracking.count, habit_tracking.suggested_target
+                FROM habit_tracking
+                JOIN habits ON habits.id = habit_tracking.habit_id
+                WHERE habits.username = ? AND habit_tracking.date = ?""",
+                (username, today.isoformat())
+            )
+            today_rows = {row[0]: row for row in Cursor.fetchall()}
+
+        engine = entry[2]
+        with self._streak_lock:
+            for habit in habits:
+                row = today_rows.get(habit["id"])
+                if row:
+                    engine.ApplyToday(habit["id"], row[1], row[2])
+                else:
+                    engine.ApplyToday(habit["id"], None, None)
+        return engine
+
+    @_cached
+    def get_habit_streaks(self, username):
+        habits = self.HabitManager.GetUserHabits(username)
+        if not habits:
+            return {}
+
+        engine = self._get_streak_engine(username, habits)
+        streaks_data = {}
+        with self._streak_lock:
+            for habit in habits:
+                current_streak, longest_streak = engine.GetStreak(habit["id"])
+                streaks_data[habit["id"]] = {
                     "habit_name": habit["habit_name"],
-                    "current_streak": 0,
-                    "longest_streak": 0
+                    "current_streak": current_streak,
+                    "longest_streak": longest_streak
                 }
-                continue
-            
-            current_streak = 0
-            longest_streak = 0
-            temp_streak = 0
-            
-            # Process from most recent backwards (today first)
-            today = datetime.date.today()
-            
-            # Sort rows by date descending
-            sorted_rows = sorted(rows, key=lambda x: self._parse_date(x[0]) or datetime.date.min, reverse=True)
-            
-            for row in sorted_rows:
-                date_str, count, suggested_target = row
-                date_obj = self._parse_date(date_str)
-                if date_obj is None or date_obj > today:
-                    continue
-                
-                # Check if goal was met
-                goal_met = False
-                target_to_check = suggested_target if suggested_target > 0 else target_count
-                if goal_type == "increase":
-                    goal_met = count >= target_to_check
-                else:  # decrease
-                    goal_met = count <= target_to_check
-                
-                if goal_met:
-                    current_streak += 1
-                else:
-                    # Streak broken
-                    break
-            
-            # Calculate longest streak (process all dates)
-            sorted_rows_asc = sorted(rows, key=lambda x: self._parse_date(x[0]) or datetime.date.min)
-            temp_streak = 0
-            for row in sorted_rows_asc:
-                date_str, count, suggested_target = row
-                date_obj = self._parse_date(date_str)
-                if date_obj is None or date_obj > today:
-                    continue
-                
-                target_to_check = suggested_target if suggested_target > 0 else target_count
-                if goal_type == "increase":
-                    goal_met = count >= target_to_check
-                else:  # decrease
-                    goal_met = count <= target_to_check
-                
-                if goal_met:
-                    temp_streak += 1
-                    longest_streak = max(longest_streak, temp_streak)
-                else:
-                    temp_streak = 0
-            
-            streaks_data[habit_id] = {
-                "habit_name": habit["habit_name"],
-                "current_streak": current_streak,
-                "longest_streak": longest_streak
-            }
-        
         return streaks_data
 
+    @_cached
     def get_habit_comparison(self, username):
         this_week_stats = self.get_habit_stats(username, "this_week")
         
@@ -556,6 +619,7 @@ class AnalyticsProcessor:
             "change": round(this_week_stats["avg_completion_rate"] - last_week_avg, 1)
         }
 
+    @_cached
     def get_habit_forecast(self, username):
         habits = self.HabitManager.GetUserHabits(username)
         forecasts = []
@@ -617,6 +681,7 @@ class AnalyticsProcessor:
         
         return forecasts
 
+    @_cached
     def get_productivity_score(self, username, time_range="all_time"):
         task_stats = self.get_task_stats(username, time_range)
         habit_stats = self.get_habit_stats(username, time_range)
@@ -628,31 +693,30 @@ class AnalyticsProcessor:
         
         return round(productivity_score, 1)
 
+    @_cached
     def get_overall_trends(self, username, time_range="all_time"):
         task_trends = self.get_task_trends(username, time_range)
-        habit_trends = self.get_habit_trends(username, time_range)
+        habit_trends = self.get_habit_trends(username, time_range, include_habit_data=False)
         
-        all_dates = sorted(set[Any](task_trends["dates"] + habit_trends["dates"])) # concatenates dates, set removes ANY duplicates (however sets aren't ordered). sorted sorts the dates in ascending order.
+        all_dates = sorted(set(task_trends["dates"]) | set(habit_trends["dates"])) # union of both date lists, sorted ascending
         
-        # Normalize to same date range
-        combined_scores = []
-        for date_str in all_dates:
-            task_idx = task_trends["dates"].index(date_str) if date_str in task_trends["dates"] else -1 # .index() returns the first index of said value, but checks if date_str is in task_trends["dates"] first, if not returns -1 (so not found)
-            task_score = task_trends["completion_rates"][task_idx] if task_idx >= 0 else 0 # if task_idx is not found, returns 0, otherwise returns the completion rate at the index of task_idx
-            # SAME PROCESS FOR habits
-            habit_idx = habit_trends["dates"].index(date_str) if date_str in habit_trends["dates"] else -1
-            habit_score = habit_trends["completion_percentages"][habit_idx] if habit_idx >= 0 else 0
-            
-            # Combined score (50/50 weight)
-            combined = (task_score * 0.5) + (habit_score * 0.5)
-            combined_scores.append(combined)
+        # Look scores up by date in O(1) instead of list.index(), which made this quadratic
+        task_by_date = dict(zip(task_trends["dates"], task_trends["completion_rates"]))
+        habit_by_date = dict(zip(habit_trends["dates"], habit_trends["completion_percentages"]))
+
+        task_scores = [task_by_date.get(d, 0) for d in all_dates] # 0 when there is no task data for that date
+        habit_scores = [habit_by_date.get(d, 0) for d in all_dates]
+        
+        # Combined score (50/50 weight)
+        combined_scores = [
+            (task_score * 0.5) + (habit_score * 0.5)
+            for task_score, habit_score in zip(task_scores, habit_scores)
+        ]
         
         return {
             "dates": all_dates,
             "productivity_scores": combined_scores,
-            "task_scores": [task_trends["completion_rates"][task_trends["dates"].index(d)] if d in task_trends["dates"] else 0 for d in all_dates], # if d (or could be any variable) is in task_trends["dates"], returns the completion rate at the index of d, otherwise returns 0
-            "habit_scores": [habit_trends["completion_percentages"][habit_trends["dates"].index(d)] if d in habit_trends["dates"] else 0 for d in all_dates]
-
-            # can freely use index d for both completion rates and dates as they are in the same order!
+            "task_scores": task_scores,
+            "habit_scores": habit_scores,
         }
 
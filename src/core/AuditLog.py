@@ -0,0 +1,247 @@
+import atexit
+import datetime
+import logging
+import queue
+import threading
+import time
+from utils.AuthenticationWrapper import DEFAULT_DB_PATH, GetDBConnection
+
+#* Audit events are queued in memory and written by a background thread, many rows per
+#* transaction, instead of each login attempt committing its own audit_log row.
+#* Log never blocks or writes itself: when the queue is full the event goes on the retry
+#* list instead. A batch that fails to write (e.g. "database is locked" during a burst of
+#* logins) is kept there too and retried with backoff ahead of the queue. The retry list
+#* is bounded, past MaxRetry the oldest events are dropped and a single record says how
+#* many were lost. Every writer is flushed when the process exits.
+
+MAX_QUEUED = 10000
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.25  # seconds the writer waits for more events before writing a batch
+MAX_RETRY = 10000  # events kept for retrying while writes fail, the oldest are dropped past it
+RETRY_DELAY = 0.1  # seconds before retrying a failed write, doubled per failure
+MAX_RETRY_DELAY = 5.0
+CLOSE_ATTEMPTS = 3  # synchronous tries when closing, with the same backoff
+
+_Logger = logging.getLogger(__name__)
+
+_STOP = object()
+_FLUSH = object()
+
+INSERT_SQL = "INSERT INTO audit_log (username, action, timestamp) VALUES (?, ?, ?)"
+
+
+class AuditLogWriter:
+    "Batched audit_log writer for one database, see the module comment."
+
+    def __init__(self, DBPath=DEFAULT_DB_PATH, MaxQueued=MAX_QUEUED, BatchSize=BATCH_SIZE,
+                 FlushInterval=FLUSH_INTERVAL, MaxRetry=MAX_RETRY):
+        self.DBPath = DBPath
+        self.BatchSize = BatchSize
+        self.FlushInterval = FlushInterval
+        self.MaxRetry = MaxRetry
+        self._Queue = queue.Queue(maxsize=MaxQueued)
+        self._Unwritten = 0  # events logged but not yet committed
+        self._Written = threading.Condition()
+        self._Retry = []  # failed batch and overflow, written before anything still queued
+        self._Dropped = 0  # events dropped from _Retry since the last record of it
+        self._RetryLock = threading.Lock()
+        self._Stopping = threading.Event()
+        self._Closed = False
+        self._Thread = threading.Thread(target=self._Run, name="OrganiseUAuditLog", daemon=True)
+        self._Thread.start()
+
+    def Log(self, Username, Action):
+        Event = (Username, Action, datetime.datetime.now().isoformat())
+        with self._Written:
+            self._Unwritten += 1
+        if not self._Closed:
+            try:
+                self._Queue.put_nowait(Event)
+                return
+            except queue.Full:
+                pass  # the writer is too far behind
+        # Picked up by the writer thread, or by the next Flush once it has stopped
+        self._Requeue([Event], Newer=True)
+
+    def Flush(self, Timeout=5.0):
+        "Write everything logged so far. Returns False if that took longer than Timeout."
+        if not self._Thread.is_alive():
+            return self._WriteRemaining()
+        try:
+            self._Queue.put(_FLUSH, timeout=Timeout)  # ends the batch being collected
+        except queue.Full:
+            return False
+        with self._Written:
+            return self._Written.wait_for(lambda: self._Unwritten == 0, Timeout)
+
+    def Close(self, Timeout=5.0):
+        "Flush, stop the writer thread and write any later events synchronously."
+        if self._Closed:
+            return
+        self._Closed = True
+        self._Stopping.set()  # cuts a retry backoff short, the retry is then done below
+        try:
+            self._Queue.put(_STOP, timeout=Timeout)
+        except queue.Full:
+            pass
+        self._Thread.join(Timeout)
+        self._WriteRemaining()
+
+    def _Run(self):
+        Delay = RETRY_DELAY
+        while True:
+            Batch = self._TakeRetry()
+            if Batch:
+                # Delay has grown if the last write failed, back off before trying again
+                if Delay > RETRY_DELAY and self._Stopping.wait(Delay):
+                    self._Requeue(Batch)  # Close writes it synchronously
+                    return
+                Stop = self._Collect(Batch, 0)
+            else:
+                Item = self._Queue.get()
+                if Item is _STOP:
+                    return
+                if Item is _FLUSH:
+                    continue
+                Batch = [Item]
+                Stop = self._Collect(Batch, self.FlushInterval)
+
+            try:
+                self._Write(Batch)
+            except Exception as Error:
+                self._ReportFailure(Batch, Error, Retrying=Delay == RETRY_DELAY)
+                self._Requeue(Batch)
+                Delay = min(Delay * 2, MAX_RETRY_DELAY)
+                if Stop:
+                    return
+                continue
+            self._MarkWritten(len(Batch))
+            Delay = RETRY_DELAY
+            if Stop:
+                return
+
+    def _Collect(self, Batch, Wait):
+        """
+        Add queued events to Batch for up to Wait seconds, or until it is full or a
+        flush is requested. Returns True if the writer was told to stop.
+        """
+        Deadline = time.monotonic() + Wait
+        while len(Batch) < self.BatchSize:
+            try:
+                Remaining = Deadline - time.monotonic()
+                if Remaining > 0:
+                    Item = self._Queue.get(timeout=Remaining)
+                else:
+                    Item = self._Queue.get_nowait()
+            except queue.Empty:
+                break
+            if Item is _STOP:
+                return True
+            if Item is _FLUSH:
+                break
+            Batch.append(Item)
+        return False
+
+    def _Requeue(self, Events, Newer=False):
+        "Put events on the retry list, dropping the oldest ones past MaxRetry."
+        with self._RetryLock:
+            if Newer:
+                self._Retry.extend(Events)
+            else:
+                self._Retry[:0] = Events
+            Excess = len(self._Retry) - self.MaxRetry
+            if Excess <= 0:
+                return
+            del self._Retry[:Excess]
+            FirstDrop = self._Dropped == 0
+            self._Dropped += Excess
+        if FirstDrop:
+            _Logger.warning("Audit log retry list is full, dropping the oldest events")
+        self._MarkWritten(Excess)
+
+    def _TakeRetry(self):
+        "Empty the retry list, led by a record of any events dropped from it."
+        with self._RetryLock:
+            Events, self._Retry = self._Retry, []
+            Dropped, self._Dropped = self._Dropped, 0
+        if Dropped:
+            Events.insert(0, (None, f"{Dropped} audit events dropped, writes kept failing", datetime.datetime.now().isoformat()))
+            with self._Written:
+                self._Unwritten += 1
+        return Events
+
+    def _ReportFailure(self, Events, Error, Retrying=True):
+        _Logger.warning("Audit log write of %d events failed: %s", len(Events), Error)
+        if Retrying:
+            # First failure of a run, keep a record of it with the events it held up
+            Events.append((None, f"Audit log write failed, retrying: {Error}", datetime.datetime.now().isoformat()))
+            with self._Written:
+                self._Unwritten += 1
+
+    def _Write(self, Events):
+        with GetDBConnection(self.DBPath) as Conn:
+            Conn.executemany(INSERT_SQL, Events)
+            Conn.commit()
+
+    def _WriteSync(self, Events):
+        "Write on the calling thread, retrying with backoff CLOSE_ATTEMPTS times."
+        Delay = RETRY_DELAY
+        for Attempt in range(CLOSE_ATTEMPTS):
+            try:
+                self._Write(Events)
+                return
+            except Exception as Error:
+                self._ReportFailure(Events, Error, Retrying=Attempt == 0)
+                if Attempt == CLOSE_ATTEMPTS - 1:
+                    raise
+                time.sleep(Delay)
+                Delay = min(Delay * 2, MAX_RETRY_DELAY)
+
+    def _MarkWritten(self, Count):
+        with self._Written:
+            self._Unwritten -= Count
+            self._Written.notify_all()
+
+    def _WriteRemaining(self):
+        "Write the failed batch and drain the queue on the calling thread, for when the writer thread has stopped."
+        Events = self._TakeRetry()
+        while True:
+            try:
+                Item = self._Queue.get_nowait()
+            except queue.Empty:
+                break
+            if Item is not _STOP and Item is not _FLUSH:
+                Events.append(Item)
+        if Events:
+            try:
+                self._WriteSync(Events)
+            except Exception:
+                self._Requeue(Events)  # still failing, keep them for another Flush/Close
+                return False
+            self._MarkWritten(len(Events))
+        return True
+
+
+_Writers = {}  # DBPath -> AuditLogWriter
+_WritersLock = threading.Lock()
+
+
+def GetAuditLogWriter(DBPath=DEFAULT_DB_PATH):
+    "Return the audit log writer for a database, creating it on first use."
+    with _WritersLock:
+        Writer = _Writers.get(DBPath)
+        if Writer is None:
+            Writer = _Writers[DBPath] = AuditLogWriter(DBPath)
+        return Writer
+
+
+def CloseAuditLogWriters():
+    with _WritersLock:
+        Writers = list(_Writers.values())
+        _Writers.clear()
+    for Writer in Writers:
+        Writer.Close()
+
+
+# Registered after AuthenticationWrapper's CloseAllConnections, so it runs first
+atexit.register(CloseAuditLogWriters)
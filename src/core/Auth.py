@@ -2,7 +2,11 @@ import bcrypt
 import re
 import datetime
 import sqlite3
+import threading
+import time
 
+from core.AuditLog import GetAuditLogWriter
+from core.Migrations import EnsureMigrated
 from utils.AuthenticationWrapper import GetDBConnection
 
 
@@ -48,43 +52,79 @@ def HashingFunction(input_string: str) -> str:
         
     return final_hash
 
+#* bcrypt's cost doubles the hashing time per step, so the right value depends on the
+#* hardware. CalibrateBcryptCost picks the highest cost whose hash fits the latency
+#* budget on this machine, new and reset passwords use it, and LoginUser rehashes any
+#* password stored with a lower cost the next time it is checked. Hashes are never
+#* rehashed downwards, and the cost never goes below bcrypt's own default of 12.
+HASH_LATENCY_BUDGET = 0.25  # seconds per hash
+MIN_BCRYPT_COST = 12  # bcrypt.gensalt()'s default, which older hashes were made with
+MAX_BCRYPT_COST = 16
+
+_CalibratedCosts = {}  # budget -> cost
+_CalibrateLock = threading.Lock()
+
+
+def CalibrateBcryptCost(budget: float = HASH_LATENCY_BUDGET, min_cost: int = MIN_BCRYPT_COST,
+                        max_cost: int = MAX_BCRYPT_COST) -> int:
+    """
+    Highest cost between min_cost and max_cost that hashes within budget seconds here.
+    Only min_cost is timed (best of two), each step above it is assumed to double that.
+    """
+    password = b"calibration-Passw0rd!"
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter()
+        bcrypt.hashpw(password, bcrypt.gensalt(rounds=min_cost))
+        timings.append(time.perf_counter() - start)
+
+    cost, estimate = min_cost, min(timings)
+    while cost < max_cost and estimate * 2 <= budget:
+        cost += 1
+        estimate *= 2
+    return cost
+
+
+def GetBcryptCost(budget: float = HASH_LATENCY_BUDGET) -> int:
+    "CalibrateBcryptCost(budget), measured once per process."
+    with _CalibrateLock:
+        if budget not in _CalibratedCosts:
+            _CalibratedCosts[budget] = CalibrateBcryptCost(budget)
+        return _CalibratedCosts[budget]
+
+
 class Auth:
-    def __init__(self, DBPath: str = "src/core/UsersDatabase.db"):
+    def __init__(self, DBPath: str = "src/core/UsersDatabase.db", HashBudget: float = HASH_LATENCY_BUDGET,
+                 BcryptCost: int = None):
+        """
+        Passwords are hashed with BcryptCost, or by default the cost calibrated for
+        HashBudget seconds per hash on this machine (measured on first use).
+        A BcryptCost outside MIN_BCRYPT_COST..MAX_BCRYPT_COST raises ValueError.
+        """
+        if BcryptCost is not None and not MIN_BCRYPT_COST <= BcryptCost <= MAX_BCRYPT_COST:
+            raise ValueError(
+                f"BcryptCost must be between {MIN_BCRYPT_COST} and {MAX_BCRYPT_COST}, got {BcryptCost}"
+            )
         self.DBPath = DBPath
-        self.MaxAttempts = 10  # lock account after 5 failed attempts
+        self.MaxAttempts = 10  # lock account after 10 failed attempts
         self.LockoutMinutes = 1
-        self._InitialiseDB()
+        self.HashBudget = HashBudget
+        self._BcryptCost = BcryptCost
+        EnsureMigrated(self.DBPath)
+        self.AuditLog = GetAuditLogWriter(self.DBPath)
+
+    @property
+    def BcryptCost(self) -> int:
+        if self._BcryptCost is None:
+            self._BcryptCost = GetBcryptCost(self.HashBudget)
+        return self._BcryptCost
+
+    def _HashPassword(self, password: str):
+        "Returns (hash, salt, cost) for storing in the users table."
+        cost = self.BcryptCost
+        salt = bcrypt.gensalt(rounds=cost)
+        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8"), salt, cost
 
-    # Database initialisation
-    def _InitialiseDB(self) -> None:
-        with GetDBConnection(self.DBPath) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    salt BLOB NOT NULL,
-                    failed_attempts INTEGER DEFAULT 0,
-                    lockout_until TEXT DEFAULT NULL,
-    
-                    concentration INTEGER DEFAULT NULL,
-                    discipline INTEGER DEFAULT NULL,
-                    motivation INTEGER DEFAULT NULL,
-                    energy INTEGER DEFAULT NULL,
-                    is_onboarded INTEGER DEFAULT 0
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS audit_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT,
-                    action TEXT,
-                    timestamp TEXT
-                )
-            """)
-            conn.commit()
-    
     def _ValidateUsername(self, username: str) -> bool:
         "Check that the username is alphanumeric and between 5–15 characters."
         return bool(re.match(r"^[A-Za-z0-9_]{5,15}$", username))
@@ -102,74 +142,57 @@ class Auth:
             return False
         return True
 
-    def _LogAction(self, username: str, action: str, conn=None) -> None:
-        "Record an event in the audit log."
-        close_after = False
-        if conn is None:
-            conn = sqlite3.connect(self.DBPath)
-            close_after = True
+    def _LogAction(self, username: str, action: str) -> None:
+        "Record an event in the audit log. It is queued and written in a batch shortly after."
+        self.AuditLog.Log(username, action)
 
+    def _GetLoginRow(self, username: str, conn):
+        """
+        Fetch everything a login needs in one query:
+        (password_hash, failed_attempts, lockout_until, bcrypt_cost), or None.
+        """
         cursor = conn.cursor()
         cursor.execute(
-            "INSERT INTO audit_log (username, action, timestamp) VALUES (?, ?, ?)",
-            (username, action, datetime.datetime.now().isoformat())
+            "SELECT password_hash, failed_attempts, lockout_until, bcrypt_cost FROM users WHERE username = ?",
+            (username,),
         )
-        conn.commit()
-
-        if close_after:
-            conn.close()
-
-    def _IsAccountLocked(self, username: str) -> bool:
-        "Check if an account is currently locked out."
-        with GetDBConnection(self.DBPath) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT lockout_until FROM users WHERE username = ?", (username,)
-            )
-            result = cursor.fetchone()
+        return cursor.fetchone()
 
-        if result and result[0]:
-            lockout_until = datetime.datetime.fromisoformat(result[0])
-            if datetime.datetime.now() < lockout_until:
-                return True
+    def _IsLockedUntil(self, lockout_until) -> bool:
+        "Check a lockout_until value from the users table against the current time."
+        if lockout_until:
+            return datetime.datetime.now() < datetime.datetime.fromisoformat(lockout_until)
         return False
 
     def _IncrementFaileds(self, username: str, conn=None) -> None:
         """Increase failed login attempts, lock account if necessary."""
-        close_after = False
         if conn is None:
-            conn = sqlite3.connect(self.DBPath)
-            close_after = True
+            with GetDBConnection(self.DBPath) as conn:
+                return self._IncrementFaileds(username, conn)
 
         cursor = conn.cursor()
-        cursor.execute("SELECT failed_attempts FROM users WHERE username = ?", (username,))
+        # Incremented in SQL rather than from a count read before the bcrypt check, so
+        # wrong passwords tried in parallel can't overwrite each other's attempts
+        cursor.execute(
+            "UPDATE users SET failed_attempts = COALESCE(failed_attempts, 0) + 1 WHERE username = ? RETURNING failed_attempts",
+            (username,),
+        )
         result = cursor.fetchone()
 
-        if result:
-            failed_attempts = result[0] + 1
-            if failed_attempts >= self.MaxAttempts:
-                lockout_until = datetime.datetime.now() + datetime.timedelta(minutes=self.LockoutMinutes)
-                cursor.execute(
-                    "UPDATE users SET failed_attempts = 0, lockout_until = ? WHERE username = ?",
-                    (lockout_until.isoformat(), username),
-                )
-                self._LogAction(username, "Account locked", conn)
-            else:
-                cursor.execute(
-                    "UPDATE users SET failed_attempts = ? WHERE username = ?",
-                    (failed_attempts, username),
-                )
+        if result and result[0] >= self.MaxAttempts:
+            lockout_until = datetime.datetime.now() + datetime.timedelta(minutes=self.LockoutMinutes)
+            cursor.execute(
+                "UPDATE users SET failed_attempts = 0, lockout_until = ? WHERE username = ?",
+                (lockout_until.isoformat(), username),
+            )
+            self._LogAction(username, "Account locked")
         conn.commit()
 
-        if close_after:
-            conn.close()
-
     def _ResetFailedAttempts(self, username: str, conn=None) -> None:
         "Reset failed login attempts after a successful login."
-        close_after = False
         if conn is None:
-            conn = sqlite3.connect(self.DBPath)
-            close_after = True
+            with GetDBConnection(self.DBPath) as conn:
+                return self._ResetFailedAttempts(username, conn)
 
         cursor = conn.cursor()
         cursor.execute(
@@ -178,11 +201,8 @@ class Auth:
         )
         conn.commit()
 
-        if close_after:
-            conn.close()
-
     def RegisterUser(self, username: str, password: str, concentration, discipline, motivation, energy) -> bool:
-        "Register a new user after validation and hashing."
+        "Register a new user after validation and hashing. Like LoginUser, call it off the GUI thread."
         if not self._ValidateUsername(username):
             raise ValueError("Invalid username. Use 3–20 letters, numbers, or underscores.")
 
@@ -192,21 +212,25 @@ class Auth:
         if self.UserExists(username):
             raise UserExistsError("Username already exists.")
 
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode("utf-8"), salt)
+        hashed_password, salt, cost = self._HashPassword(password)
 
         with GetDBConnection(self.DBPath) as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO users (
-                    username, password_hash, salt,
-                    concentration, discipline, motivation, energy, is_onboarded
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (username, hashed_password.decode("utf-8"), salt,
-                concentration, discipline, motivation, energy, 1) #? The 1 stands for IsOnboarded
-            )   
+            try:
+                cursor.execute(
+                    """
+                    INSERT INTO users (
+                        username, password_hash, salt, bcrypt_cost,
+                        concentration, discipline, motivation, energy, is_onboarded
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (username, hashed_password, salt, cost,
+                    concentration, discipline, motivation, energy, 1) #? The 1 stands for IsOnboarded
+                )
+            except sqlite3.IntegrityError:
+                # Someone registered the same name while the password was being hashed
+                conn.rollback()
+                raise UserExistsError("Username already exists.")
             conn.commit()
 
         self._LogAction(username, "User registered")
@@ -245,33 +269,50 @@ class Auth:
         return True 
     
     def LoginUser(self, username: str, password: str) -> bool:
-        """Attempt to log in a user, with lockout and logging."""
-        if not self.UserExists(username):
-            raise InvalidCredentialsError("User not found.")
-
-        if self._IsAccountLocked(username):
-            raise AuthError("Account is temporarily locked due to too many failed attempts.")
-
+        """
+        Attempt to log in a user, with lockout and logging.
+        bcrypt is deliberately slow, so GUI code should call this from a worker thread.
+        """
         with GetDBConnection(self.DBPath) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT password_hash, salt FROM users WHERE username = ?", (username,)
-            )
-            result = cursor.fetchone()
-
+            result = self._GetLoginRow(username, conn)
             if result is None:
-                raise InvalidCredentialsError("Invalid login attempt.")
+                raise InvalidCredentialsError("User not found.")
+
+            stored_hash, failed_attempts, lockout_until, stored_cost = result
+            if self._IsLockedUntil(lockout_until):
+                raise AuthError("Account is temporarily locked due to too many failed attempts.")
 
-            stored_hash, stored_salt = result
             if bcrypt.checkpw(password.encode("utf-8"), stored_hash.encode("utf-8")):
-                self._ResetFailedAttempts(username, conn)
-                self._LogAction(username, "Successful login", conn)
+                if failed_attempts or lockout_until:
+                    self._ResetFailedAttempts(username, conn)
+                if self._NeedsRehash(stored_cost):
+                    # Only possible now, while we have the plain password
+                    self._Rehash(username, password, conn)
+                self._LogAction(username, "Successful login")
                 return True
             else:
                 self._IncrementFaileds(username, conn)
-                self._LogAction(username, "Failed login", conn)
+                self._LogAction(username, "Failed login")
                 raise InvalidCredentialsError("Incorrect password.")
 
+    def _NeedsRehash(self, stored_cost) -> bool:
+        """
+        Only ever upgrade: a hash stored with a higher cost than this host calibrated
+        (e.g. made on a faster machine) is kept as it is.
+        """
+        return stored_cost is None or stored_cost < self.BcryptCost
+
+    def _Rehash(self, username: str, password: str, conn) -> None:
+        "Store the password again with the current cost."
+        hashed_password, salt, cost = self._HashPassword(password)
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE users SET password_hash = ?, salt = ?, bcrypt_cost = ? WHERE username = ?",
+            (hashed_password, salt, cost, username),
+        )
+        conn.commit()
+        self._LogAction(username, f"Password rehashed with cost {cost}")
+
     def UserExists(self, username: str) -> bool:
         "Check if a username is already registered."
         with GetDBConnection(self.DBPath) as conn:
@@ -285,14 +326,17 @@ class Auth:
         if not self._ValidatePassword(new_password):
             raise WeakPasswordError("Password does not meet complexity requirements.")
 
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(new_password.encode("utf-8"), salt)
+        hashed_password, salt, cost = self._HashPassword(new_password)
 
         with GetDBConnection(self.DBPath) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "UPDATE users SET password_hash = ?, salt = ?, failed_attempts = 0, lockout_until = NULL WHERE username = ?",
-                (hashed_password.decode("utf-8"), salt, username),
+                """
+                UPDATE users SET password_hash = ?, salt = ?, bcrypt_cost = ?,
+                    failed_attempts = 0, lockout_until = NULL
+                WHERE username = ?
+                """,
+                (hashed_password, salt, cost, username),
             )
             conn.commit()
 
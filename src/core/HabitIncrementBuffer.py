@@ -0,0 +1,143 @@
+import atexit
+import threading
+import weakref
+from utils.AuthenticationWrapper import DEFAULT_DB_PATH, GetDBConnection
+from utils.DataVersion import BumpDataVersion
+
+#* Collects +1 clicks in memory and writes them in batches. Clicks on the same habit on
+#* the same day are merged into one count, and a flush writes every pending count as an
+#* UPSERT in a single transaction, so ten quick clicks cost one commit instead of ten.
+#* Pending counts are flushed FlushDelay seconds after the first one, when a window
+#* closes (Flush) and when the process exits.
+
+# Seconds between the first buffered increment and the write
+FLUSH_DELAY = 0.5
+# A failed flush is retried after this long, doubling per failure up to MAX_RETRY_DELAY
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+
+_Buffers = weakref.WeakSet()
+
+
+class HabitIncrementBuffer:
+    """
+    Pending habit_tracking increments keyed by (habit_id, date). With Sync=True every
+    Add is written straight away (one transaction per click, nothing is lost on a crash).
+    A failed flush keeps its counts pending and schedules a retry with backoff.
+    """
+
+    def __init__(self, DBPath=DEFAULT_DB_PATH, FlushDelay=FLUSH_DELAY, Sync=False):
+        self.DBPath = DBPath
+        self.FlushDelay = FlushDelay
+        self.Sync = Sync
+        self._Pending = {}  # (habit_id, date) -> count not yet written
+        self._Lock = threading.Lock()
+        self._FlushLock = threading.Lock()  # one flush at a time, so writes stay in order
+        self._Timer = None
+        self._RetryDelay = RETRY_DELAY
+        _Buffers.add(self)
+
+    def Add(self, HabitID, Date, Amount=1):
+        with self._Lock:
+            Key = (HabitID, Date)
+            self._Pending[Key] = self._Pending.get(Key, 0) + Amount
+        if self.Sync:
+            self.Flush()
+        else:
+            self._Schedule(self.FlushDelay)
+
+    def _Schedule(self, Delay):
+        "Start the flush timer, unless one is already waiting."
+        with self._Lock:
+            if self._Timer is not None:
+                return
+            self._Timer = threading.Timer(Delay, self._OnTimer)
+            self._Timer.daemon = True  # the atexit flush covers whatever it would have written
+            self._Timer.start()
+
+    def GetPending(self, HabitID, Date):
+        "Count added for a habit on a date that hasn't been written yet."
+        with self._Lock:
+            return self._Pending.get((HabitID, Date), 0)
+
+    def Discard(self, HabitID):
+        "Drop a habit's pending counts, e.g. because it is being deleted."
+        with self._Lock:
+            for Key in [Key for Key in self._Pending if Key[0] == HabitID]:
+                del self._Pending[Key]
+
+    def Flush(self):
+        "Write every pending count now. Returns the number of (habit, date) rows written."
+        with self._FlushLock:
+            with self._Lock:
+                Pending, self._Pending = self._Pending, {}
+                Timer, self._Timer = self._Timer, None
+            if Timer is not None:
+                Timer.cancel()
+            if not Pending:
+                return 0
+            try:
+                Owners = self._Write(Pending)
+            except Exception:
+                self._Requeue(Pending)
+                if not self.Sync:
+                    self._Schedule(self._RetryDelay)
+                    self._RetryDelay = min(self._RetryDelay * 2, MAX_RETRY_DELAY)
+                raise
+            self._RetryDelay = RETRY_DELAY
+        for Owner in Owners:
+            BumpDataVersion(Owner)
+        return len(Pending)
+
+    def _Write(self, Pending):
+        "UPSERT the counts in one transaction, returning the usernames that own them."
+        HabitIDs = sorted({HabitID for HabitID, _ in Pending})
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            Placeholders = ", ".join("?" * len(HabitIDs))
+            Cursor.execute(
+                f"SELECT id, username FROM habits WHERE id IN ({Placeholders})", HabitIDs
+            )
+            Owners = dict(Cursor.fetchall())
+
+            # Habits deleted since the click have nothing left to count towards
+            Rows = [
+                (HabitID, Date, Amount)
+                for (HabitID, Date), Amount in Pending.items()
+                if HabitID in Owners
+            ]
+            # Missing rows (the daily goal hasn't been generated yet) start with target 0,
+            # like the old insert fallback. The rollup triggers see the UPDATE as before.
+            Cursor.executemany(
+                """
+                INSERT INTO habit_tracking (habit_id, date, count, suggested_target)
+                VALUES (?, ?, ?, 0)
+                ON CONFLICT(habit_id, date) DO UPDATE SET count = count + excluded.count
+            """,
+                Rows,
+            )
+            Conn.commit()
+        return set(Owners.values())
+
+    def _Requeue(self, Pending):
+        with self._Lock:
+            for Key, Amount in Pending.items():
+                self._Pending[Key] = self._Pending.get(Key, 0) + Amount
+
+    def _OnTimer(self):
+        try:
+            self.Flush()
+        except Exception:
+            pass  # still pending, Flush has scheduled a retry
+
+
+def FlushAllIncrementBuffers():
+    for Buffer in list(_Buffers):
+        try:
+            Buffer.Flush()
+        except Exception:
+            pass
+
+
+# Registered after AuthenticationWrapper's CloseAllConnections, so it runs first
+atexit.register(FlushAllIncrementBuffers)
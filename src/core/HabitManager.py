@@ -1,55 +1,19 @@
 import datetime
+from core.HabitIncrementBuffer import FLUSH_DELAY, HabitIncrementBuffer
+from core.Migrations import EnsureMigrated
 from utils.AuthenticationWrapper import GetDBConnection
+from utils.DataVersion import BumpDataVersion
 
 
 class HabitManager:
-    def __init__(self, DBPath="src/core/UsersDatabase.db"):
+    def __init__(self, DBPath="src/core/UsersDatabase.db", FlushDelay=FLUSH_DELAY, SyncIncrements=False):
+        """
+        IncrementHabit is buffered and written FlushDelay seconds later (see
+        HabitIncrementBuffer). SyncIncrements=True writes every increment immediately.
+        """
         self.DBPath = DBPath
-        self._InitialiseDB()
-
-    def _InitialiseDB(self):
-        """Initialize the habits and habit_tracking tables"""
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-
-            # Habits table - stores habit definitions
-            Cursor.execute("""
-                CREATE TABLE IF NOT EXISTS habits (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT NOT NULL,
-                    habit_name TEXT NOT NULL,
-                    is_positive INTEGER DEFAULT 1,
-                    goal_type TEXT DEFAULT 'increase',
-                    baseline_count INTEGER DEFAULT 0,
-                    target_count INTEGER DEFAULT 0,
-                    target_date TEXT NOT NULL
-                )
-            """)
-
-            # Habit tracking table - stores daily counts and targets
-            Cursor.execute("""
-                CREATE TABLE IF NOT EXISTS habit_tracking (
-                    habit_id INTEGER NOT NULL,
-                    date TEXT NOT NULL,
-                    count INTEGER DEFAULT 0,
-                    suggested_target INTEGER DEFAULT 0,
-                    PRIMARY KEY (habit_id, date),
-                    FOREIGN KEY (habit_id) REFERENCES habits(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Index for faster queries
-            Cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_habits_username 
-                ON habits(username)
-            """)
-
-            Cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_tracking_date 
-                ON habit_tracking(date)
-            """)
-
-            Conn.commit()
+        EnsureMigrated(self.DBPath)
+        self.Increments = HabitIncrementBuffer(DBPath, FlushDelay, Sync=SyncIncrements)
 
     def AddHabit(
         self,
@@ -90,7 +54,14 @@ class HabitManager:
             )
 
             Conn.commit()
-            return habit_id
+        BumpDataVersion(username)
+        return habit_id
+
+    def _GetHabitOwner(self, Cursor, habit_id):
+        """Username that owns a habit, so writes by id can invalidate that user's cached analytics"""
+        Cursor.execute("SELECT username FROM habits WHERE id = ?", (habit_id,))
+        row = Cursor.fetchone()
+        return row[0] if row else None
 
     def GetUserHabits(self, username):
         with GetDBConnection(self.DBPath) as Conn:
@@ -136,51 +107,30 @@ class HabitManager:
             )
 
             row = Cursor.fetchone()
-            if row:
-                return {"count": row[0], "suggested_target": row[1]}
-            return None
+        # Include clicks that haven't been written yet
+        pending = self.Increments.GetPending(habit_id, today)
+        if row:
+            return {"count": row[0] + pending, "suggested_target": row[1]}
+        if pending:
+            return {"count": pending, "suggested_target": 0}  # what the flush will insert
+        return None
 
     def IncrementHabit(self, habit_id):
-        today = datetime.date.today().isoformat()
-
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-
-            Cursor.execute(
-                """
-                SELECT count FROM habit_tracking
-                WHERE habit_id = ? AND date = ?
-            """,
-                (habit_id, today),
-            )
-
-            row = Cursor.fetchone()
-            if row:
-                Cursor.execute(
-                    """
-                    UPDATE habit_tracking
-                    SET count = count + 1
-                    WHERE habit_id = ? AND date = ?
-                """,
-                    (habit_id, today),
-                )
-            else:
-                # safety measure in case the row doesn't exist
-                Cursor.execute(
-                    """
-                    INSERT INTO habit_tracking (habit_id, date, count, suggested_target)
-                    VALUES (?, ?, 1, 0)
-                """,
-                    (habit_id, today),
-                )
+        """Add 1 to today's count. Quick clicks are merged and written together"""
+        self.Increments.Add(habit_id, datetime.date.today().isoformat())
 
-            Conn.commit()
+    def FlushIncrements(self):
+        """Write buffered increments now, e.g. when the habit tracker closes"""
+        return self.Increments.Flush()
 
     def DeleteHabit(self, habit_id):
+        self.Increments.Discard(habit_id)
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
+            owner = self._GetHabitOwner(Cursor, habit_id)
             Cursor.execute("DELETE FROM habits WHERE id = ?", (habit_id,))
             Conn.commit()
+        BumpDataVersion(owner)
 
     def _GetUserStats(self, username):
         """Fetch user stats (discipline, motivation, concentration, energy) from users table"""
@@ -242,61 +192,76 @@ class HabitManager:
             return f"Error: {str(e)}"
 
     def CheckAndGenerateDailyGoals(self, username):
-        today = datetime.date.today().isoformat()
+        """Add today's tracking row, with an adapted target, for every habit that lacks one"""
+        today = datetime.date.today()
+        today_str = today.isoformat()
+        yesterday_str = (today - datetime.timedelta(days=1)).isoformat()
         habits = self.GetUserHabits(username)
+        if not habits:
+            return
         stats = self._GetUserStats(username)
         discipline = stats["discipline"]
 
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
 
-            for habit in habits:
-                habit_id = habit["id"]
-                Cursor.execute(
-                    """
-                    SELECT count, suggested_target FROM habit_tracking
-                    WHERE habit_id = ? AND date = ?
-                """,
-                    (habit_id, today),
-                )
-
-                row = Cursor.fetchone()
-                if row is not None:
-                    # Entry exists, skip
-                    continue
-
-                new_target = self._CalculateNewTarget(habit, discipline, Cursor)
+            # Today's and yesterday's rows for all of the user's habits in one query
+            Cursor.execute(
+                """
+                SELECT habit_tracking.habit_id, habit_tracking.date,
+                       habit_tracking.count, habit_tracking.suggested_target
+                FROM habit_tracking
+                JOIN habits ON habits.id = habit_tracking.habit_id
+                WHERE habits.username = ? AND habit_tracking.date IN (?, ?)
+            """,
+                (username, today_str, yesterday_str),
+            )
+            tracked_today = set()
+            yesterday_rows = {}
+            for habit_id, date, count, suggested_target in Cursor.fetchall():
+                if date == today_str:
+                    tracked_today.add(habit_id)
+                else:
+                    yesterday_rows[habit_id] = (count, suggested_target)
 
-                Cursor.execute(
-                    """
-                    INSERT INTO habit_tracking (habit_id, date, count, suggested_target)
-                    VALUES (?, ?, 0, ?)
-                """,
-                    (habit_id, today, new_target),
+            new_rows = [
+                (
+                    habit["id"],
+                    today_str,
+                    self._CalculateNewTarget(habit, discipline, yesterday_rows.get(habit["id"]), today),
                 )
-
+                for habit in habits
+                if habit["id"] not in tracked_today
+            ]
+            if not new_rows:
+                return  # nothing changed, so cached analytics stay valid
+
+            # OR IGNORE in case another window added today's row in the meantime
+            Cursor.executemany(
+                """
+                INSERT OR IGNORE INTO habit_tracking (habit_id, date, count, suggested_target)
+                VALUES (?, ?, 0, ?)
+            """,
+                new_rows,
+            )
             Conn.commit()
-
-    def _CalculateNewTarget(self, habit, discipline, cursor):
-        today = datetime.date.today()
-        habit_id = habit["id"]
+        BumpDataVersion(username)
+
+    def _CalculateNewTarget(self, habit, discipline, yesterday_row, today=None):
+        """
+        Today's suggested target for a habit. yesterday_row is yesterday's
+        (count, suggested_target), or None if the habit wasn't tracked yesterday.
+        """
+        today = today or datetime.date.today()
         goal_type = habit["goal_type"]
         target_count = habit["target_count"]
-        target_date = datetime.datetime.strptime(
-            habit["target_date"], "%Y-%m-%d"
-        ).date()
-
-        # retrieving yesterday's data
-        yesterday = (today - datetime.timedelta(days=1)).isoformat()
-        cursor.execute(
-            """
-            SELECT count, suggested_target FROM habit_tracking
-            WHERE habit_id = ? AND date = ?
-        """,
-            (habit_id, yesterday),
-        )
-
-        yesterday_row = cursor.fetchone()
+        try:
+            # Much cheaper than strptime, which matters when generating hundreds of goals
+            target_date = datetime.date.fromisoformat(habit["target_date"])
+        except ValueError:
+            target_date = datetime.datetime.strptime(
+                habit["target_date"], "%Y-%m-%d"
+            ).date()
 
         if yesterday_row:
             yesterday_count = yesterday_row[0]
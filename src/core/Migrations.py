@@ -0,0 +1,204 @@
+import datetime
+import os
+import threading
+from core.RollupManager import RollupManager
+from utils.AuthenticationWrapper import DEFAULT_DB_PATH, GetDBConnection
+
+#* Numbered schema migrations. schema_version records which ones a database has had,
+#* so each runs once per database and opening a window doesn't re-run any DDL.
+#* Append new migrations to the end of MIGRATIONS, never edit or reorder applied ones.
+#* The early ones use IF NOT EXISTS so databases created before this existed (which
+#* already have those tables) are adopted without errors.
+
+
+def _CreateUsers(Cursor):
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            salt BLOB NOT NULL,
+            failed_attempts INTEGER DEFAULT 0,
+            lockout_until TEXT DEFAULT NULL,
+
+            concentration INTEGER DEFAULT NULL,
+            discipline INTEGER DEFAULT NULL,
+            motivation INTEGER DEFAULT NULL,
+            energy INTEGER DEFAULT NULL,
+            is_onboarded INTEGER DEFAULT 0
+        )
+    """)
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS audit_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT,
+            action TEXT,
+            timestamp TEXT
+        )
+    """)
+
+
+def _CreateTasks(Cursor):
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT DEFAULT NULL,
+            status TEXT DEFAULT 'pending',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS subtasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            status TEXT DEFAULT 'pending',
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
+        )
+    """)
+    Cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_username ON tasks(username)")
+    Cursor.execute("CREATE INDEX IF NOT EXISTS idx_subtasks_task_id ON subtasks(task_id)")
+
+
+def _CreateHabits(Cursor):
+    # Habit definitions
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS habits (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            habit_name TEXT NOT NULL,
+            is_positive INTEGER DEFAULT 1,
+            goal_type TEXT DEFAULT 'increase',
+            baseline_count INTEGER DEFAULT 0,
+            target_count INTEGER DEFAULT 0,
+            target_date TEXT NOT NULL
+        )
+    """)
+    # Daily counts and targets
+    Cursor.execute("""
+        CREATE TABLE IF NOT EXISTS habit_tracking (
+            habit_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            count INTEGER DEFAULT 0,
+            suggested_target INTEGER DEFAULT 0,
+            PRIMARY KEY (habit_id, date),
+            FOREIGN KEY (habit_id) REFERENCES habits(id) ON DELETE CASCADE
+        )
+    """)
+    Cursor.execute("CREATE INDEX IF NOT EXISTS idx_habits_username ON habits(username)")
+    Cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracking_date ON habit_tracking(date)")
+
+
+def _CreateRollups(Cursor):
+    # Daily per-user aggregates for analytics, kept current by triggers
+    Rollups = RollupManager()
+    Rollups.InitialiseTaskRollup(Cursor)
+    Rollups.InitialiseHabitRollup(Cursor)
+
+
+def _CreateCoveringIndexes(Cursor):
+    # Analytics counts read (username, created_at, status) straight from the index
+    Cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_username_created_status ON tasks(username, created_at, status)"
+    )
+    # Per-habit date range queries read count and suggested_target from the index
+    Cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tracking_habit_date_counts
+        ON habit_tracking(habit_id, date, count, suggested_target)
+    """)
+
+
+def _AddBcryptCost(Cursor):
+    # Work factor each password was hashed with, so logins can spot hashes to upgrade.
+    # Existing bcrypt hashes carry it in their prefix ($2b$12$...)
+    Cursor.execute("ALTER TABLE users ADD COLUMN bcrypt_cost INTEGER DEFAULT NULL")
+    Cursor.execute("""
+        UPDATE users SET bcrypt_cost = CAST(substr(password_hash, 5, 2) AS INTEGER)
+        WHERE password_hash LIKE '$2_$__$%'
+    """)
+
+
+# (version, description, apply(cursor))
+MIGRATIONS = [
+    (1, "users and audit_log tables", _CreateUsers),
+    (2, "tasks and subtasks tables", _CreateTasks),
+    (3, "habits and habit_tracking tables", _CreateHabits),
+    (4, "daily task and habit rollups", _CreateRollups),
+    (5, "covering indexes for analytics queries", _CreateCoveringIndexes),
+    (6, "per-user bcrypt cost", _AddBcryptCost),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+_MigratedPaths = set()
+_MigrateLock = threading.Lock()
+
+
+def GetSchemaVersion(Cursor):
+    Cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    )
+    if Cursor.fetchone() is None:
+        return 0
+    Cursor.execute("SELECT MAX(version) FROM schema_version")
+    return Cursor.fetchone()[0] or 0
+
+
+def ApplyMigrations(DBPath=DEFAULT_DB_PATH):
+    """
+    Bring the database up to LATEST_VERSION, returning the versions applied.
+    Each migration commits together with its schema_version row, so a failed one
+    leaves the database at the previous version.
+    """
+    Applied = []
+    with GetDBConnection(DBPath) as Conn:
+        Cursor = Conn.cursor()
+        # IMMEDIATE takes the write lock up front, so two processes opening the same
+        # database can't both decide to run the same migration
+        Cursor.execute("BEGIN IMMEDIATE")
+        try:
+            Cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INTEGER PRIMARY KEY,
+                    description TEXT NOT NULL,
+                    applied_at TEXT NOT NULL
+                )
+            """)
+            Current = GetSchemaVersion(Cursor)
+            Conn.commit()
+
+            for Version, Description, Apply in MIGRATIONS:
+                if Version <= Current:
+                    continue
+                Cursor.execute("BEGIN IMMEDIATE")
+                if GetSchemaVersion(Cursor) >= Version:
+                    Conn.rollback()  # another process got here first
+                    continue
+                Apply(Cursor)
+                Cursor.execute(
+                    "INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                    (Version, Description, datetime.datetime.now().isoformat()),
+                )
+                Conn.commit()
+                Applied.append(Version)
+        except Exception:
+            Conn.rollback()
+            raise
+    return Applied
+
+
+def EnsureMigrated(DBPath=DEFAULT_DB_PATH):
+    """
+    Run ApplyMigrations the first time a database is opened in this process.
+    Later calls for the same file return straight away without touching it.
+    """
+    Key = os.path.abspath(DBPath)
+    if Key in _MigratedPaths:
+        return
+    with _MigrateLock:
+        if Key not in _MigratedPaths:
+            ApplyMigrations(DBPath)
+            _MigratedPaths.add(Key)
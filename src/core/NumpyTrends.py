@@ -0,0 +1,100 @@
+import numpy as np
+
+#* Vectorised builders for AnalyticsProcessor's trend series (engine="numpy").
+#* They take the same rows as the python builders and return the same dicts,
+#* with dates bucketed as datetime64 day offsets instead of per-day dict lookups.
+#* Malformed date strings raise ValueError, and the caller falls back to the python engine.
+
+
+def _day_range(start_date, end_date):
+    """Every day from start_date to end_date as datetime64[D]"""
+    return np.arange(
+        np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1, dtype="datetime64[D]"
+    )
+
+
+def _day_offsets(date_strs, start_date, days):
+    """Offset of each date from start_date, and a mask of the ones inside the range"""
+    # U10 keeps the YYYY-MM-DD part, like _parse_date does with date_str[:10]
+    dates = np.asarray(date_strs, dtype="U10").astype("datetime64[D]")
+    offsets = (dates - np.datetime64(start_date, "D")).astype(np.int64)
+    return offsets, (offsets >= 0) & (offsets < days)
+
+
+def _daily_sums(offsets, mask, values, days):
+    return np.bincount(offsets[mask], weights=values[mask], minlength=days).astype(np.int64)
+
+
+def _percentages(part, whole):
+    """part / whole * 100 where whole > 0, else 0"""
+    result = np.zeros(len(whole), dtype=np.float64)
+    np.divide(part, whole, out=result, where=whole > 0)
+    return result * 100
+
+
+def build_task_trends(start_date, end_date, rows):
+    """rows: (date, created, completed) from daily_task_rollup"""
+    days = _day_range(start_date, end_date)
+    created = np.zeros(len(days), dtype=np.int64)
+    completed = np.zeros(len(days), dtype=np.int64)
+
+    if rows:
+        date_strs, created_col, completed_col = zip(*rows)
+        offsets, mask = _day_offsets(date_strs, start_date, len(days))
+        created = _daily_sums(offsets, mask, np.asarray(created_col, dtype=np.int64), len(days))
+        completed = _daily_sums(offsets, mask, np.asarray(completed_col, dtype=np.int64), len(days))
+
+    # Completion rate so far, over every task created up to that day
+    completion_rates = _percentages(np.cumsum(completed), np.cumsum(created))
+
+    return {
+        "dates": days.astype(str).tolist(),
+        "completion_rates": completion_rates.tolist(),
+        "daily_completed": completed.tolist(),
+        "daily_created": created.tolist(),
+    }
+
+
+def build_habit_trends(start_date, end_date, habit_ids, daily_rows, rows):
+    """
+    daily_rows: (date, tracked, completed) from daily_habit_rollup.
+    rows: (habit_id, date, count, suggested_target) from habit_tracking, ordered by date.
+    """
+    days = _day_range(start_date, end_date)
+    total = np.zeros(len(days), dtype=np.int64)
+    completed = np.zeros(len(days), dtype=np.int64)
+
+    if daily_rows:
+        date_strs, tracked_col, completed_col = zip(*daily_rows)
+        offsets, mask = _day_offsets(date_strs, start_date, len(days))
+        total = _daily_sums(offsets, mask, np.asarray(tracked_col, dtype=np.int64), len(days))
+        completed = _daily_sums(offsets, mask, np.asarray(completed_col, dtype=np.int64), len(days))
+
+    habit_data = {hid: {"dates": [], "completion_rates": []} for hid in habit_ids}
+
+    if rows:
+        ids_col, date_strs, count_col, target_col = zip(*rows)
+        ids = np.asarray(ids_col, dtype=np.int64)
+        dates = np.asarray(date_strs, dtype="U10")
+        offsets, mask = _day_offsets(dates, start_date, len(days))
+
+        counts = np.asarray(count_col, dtype=np.float64)
+        targets = np.asarray(target_col, dtype=np.float64)
+        rates = np.minimum(_percentages(counts, targets), 100)
+
+        # Group by habit while keeping each habit's rows in date order
+        order = np.argsort(ids[mask], kind="stable")
+        ids, dates, rates = ids[mask][order], dates[mask][order], rates[mask][order]
+        unique_ids, starts = np.unique(ids, return_index=True)
+        for hid, group_dates, group_rates in zip(
+            unique_ids.tolist(), np.split(dates, starts[1:]), np.split(rates, starts[1:])
+        ):
+            if hid in habit_data:
+                habit_data[hid]["dates"] = group_dates.tolist()
+                habit_data[hid]["completion_rates"] = group_rates.tolist()
+
+    return {
+        "dates": days.astype(str).tolist(),
+        "completion_percentages": _percentages(completed, total).tolist(),
+        "habit_data": habit_data,
+    }
@@ -0,0 +1,216 @@
+from utils.AuthenticationWrapper import GetDBConnection
+from utils.DataVersion import BumpAllDataVersions, BumpDataVersion
+
+#* Per-user daily aggregates so analytics doesn't rescan every task and tracking row.
+#* Triggers keep them current on every write path (including FK cascades and raw SQL).
+
+TASK_ROLLUP_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_task_rollup (
+        username TEXT NOT NULL,
+        date TEXT NOT NULL,
+        created INTEGER NOT NULL DEFAULT 0,
+        completed INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (username, date)
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO daily_task_rollup (username, date, created, completed)
+        VALUES (
+            NEW.username, substr(NEW.created_at, 1, 10), 1,
+            CASE WHEN NEW.status = 'completed' THEN 1 ELSE 0 END
+        )
+        ON CONFLICT(username, date) DO UPDATE SET
+            created = created + 1,
+            completed = completed + excluded.completed;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE daily_task_rollup SET
+            created = created - 1,
+            completed = completed - CASE WHEN OLD.status = 'completed' THEN 1 ELSE 0 END
+        WHERE username = OLD.username AND date = substr(OLD.created_at, 1, 10);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tasks_rollup_update
+    AFTER UPDATE OF username, status, created_at ON tasks
+    BEGIN
+        UPDATE daily_task_rollup SET
+            created = created - 1,
+            completed = completed - CASE WHEN OLD.status = 'completed' THEN 1 ELSE 0 END
+        WHERE username = OLD.username AND date = substr(OLD.created_at, 1, 10);
+
+        INSERT INTO daily_task_rollup (username, date, created, completed)
+        VALUES (
+            NEW.username, substr(NEW.created_at, 1, 10), 1,
+            CASE WHEN NEW.status = 'completed' THEN 1 ELSE 0 END
+        )
+        ON CONFLICT(username, date) DO UPDATE SET
+            created = created + 1,
+            completed = completed + excluded.completed;
+    END
+    """,
+]
+
+# completed = target reached (habit trends), met = count >= suggested_target (habit stats)
+HABIT_ROLLUP_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_habit_rollup (
+        username TEXT NOT NULL,
+        date TEXT NOT NULL,
+        tracked INTEGER NOT NULL DEFAULT 0,
+        completed INTEGER NOT NULL DEFAULT 0,
+        met INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (username, date)
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tracking_rollup_insert AFTER INSERT ON habit_tracking
+    BEGIN
+        INSERT INTO daily_habit_rollup (username, date, tracked, completed, met)
+        SELECT
+            username, NEW.date, 1,
+            CASE WHEN NEW.suggested_target > 0 AND NEW.count >= NEW.suggested_target THEN 1 ELSE 0 END,
+            CASE WHEN NEW.count >= NEW.suggested_target THEN 1 ELSE 0 END
+        FROM habits WHERE id = NEW.habit_id
+        ON CONFLICT(username, date) DO UPDATE SET
+            tracked = tracked + 1,
+            completed = completed + excluded.completed,
+            met = met + excluded.met;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tracking_rollup_delete AFTER DELETE ON habit_tracking
+    BEGIN
+        UPDATE daily_habit_rollup SET
+            tracked = tracked - 1,
+            completed = completed - CASE WHEN OLD.suggested_target > 0 AND OLD.count >= OLD.suggested_target THEN 1 ELSE 0 END,
+            met = met - CASE WHEN OLD.count >= OLD.suggested_target THEN 1 ELSE 0 END
+        WHERE username = (SELECT username FROM habits WHERE id = OLD.habit_id)
+        AND date = OLD.date;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tracking_rollup_update AFTER UPDATE ON habit_tracking
+    BEGIN
+        UPDATE daily_habit_rollup SET
+            tracked = tracked - 1,
+            completed = completed - CASE WHEN OLD.suggested_target > 0 AND OLD.count >= OLD.suggested_target THEN 1 ELSE 0 END,
+            met = met - CASE WHEN OLD.count >= OLD.suggested_target THEN 1 ELSE 0 END
+        WHERE username = (SELECT username FROM habits WHERE id = OLD.habit_id)
+        AND date = OLD.date;
+
+        INSERT INTO daily_habit_rollup (username, date, tracked, completed, met)
+        SELECT
+            username, NEW.date, 1,
+            CASE WHEN NEW.suggested_target > 0 AND NEW.count >= NEW.suggested_target THEN 1 ELSE 0 END,
+            CASE WHEN NEW.count >= NEW.suggested_target THEN 1 ELSE 0 END
+        FROM habits WHERE id = NEW.habit_id
+        ON CONFLICT(username, date) DO UPDATE SET
+            tracked = tracked + 1,
+            completed = completed + excluded.completed,
+            met = met + excluded.met;
+    END
+    """,
+    # The habit row is gone by the time a cascade deletes its tracking rows, so the
+    # delete trigger above can't find the owner. Take the habit's rows out here instead.
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_habits_rollup_delete BEFORE DELETE ON habits
+    BEGIN
+        UPDATE daily_habit_rollup SET
+            tracked = tracked - (
+                SELECT COUNT(*) FROM habit_tracking
+                WHERE habit_id = OLD.id AND date = daily_habit_rollup.date
+            ),
+            completed = completed - (
+                SELECT COUNT(*) FROM habit_tracking
+                WHERE habit_id = OLD.id AND date = daily_habit_rollup.date
+                AND suggested_target > 0 AND count >= suggested_target
+            ),
+            met = met - (
+                SELECT COUNT(*) FROM habit_tracking
+                WHERE habit_id = OLD.id AND date = daily_habit_rollup.date
+                AND count >= suggested_target
+            )
+        WHERE username = OLD.username
+        AND date IN (SELECT date FROM habit_tracking WHERE habit_id = OLD.id);
+    END
+    """,
+]
+
+
+class RollupManager:
+    def __init__(self, DBPath="src/core/UsersDatabase.db"):
+        self.DBPath = DBPath
+
+    def _TableExists(self, Cursor, Table):
+        Cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (Table,)
+        )
+        return Cursor.fetchone() is not None
+
+    def InitialiseTaskRollup(self, Cursor):
+        """Create daily_task_rollup and its triggers, backfilling it if it is new"""
+        IsNew = not self._TableExists(Cursor, "daily_task_rollup")
+        for Statement in TASK_ROLLUP_SCHEMA:
+            Cursor.execute(Statement)
+        if IsNew:
+            self.RebuildTaskRollup(Cursor)
+
+    def InitialiseHabitRollup(self, Cursor):
+        """Create daily_habit_rollup and its triggers, backfilling it if it is new"""
+        IsNew = not self._TableExists(Cursor, "daily_habit_rollup")
+        for Statement in HABIT_ROLLUP_SCHEMA:
+            Cursor.execute(Statement)
+        if IsNew:
+            self.RebuildHabitRollup(Cursor)
+
+    def RebuildTaskRollup(self, Cursor, Username=None):
+        Filter, Params = ("WHERE username = ?", (Username,)) if Username else ("", ())
+        Cursor.execute(f"DELETE FROM daily_task_rollup {Filter}", Params)
+        Cursor.execute(
+            f"""
+            INSERT INTO daily_task_rollup (username, date, created, completed)
+            SELECT username, substr(created_at, 1, 10), COUNT(*),
+                   SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END)
+            FROM tasks {Filter}
+            GROUP BY username, substr(created_at, 1, 10)
+            """,
+            Params,
+        )
+
+    def RebuildHabitRollup(self, Cursor, Username=None):
+        Filter, Params = ("WHERE habits.username = ?", (Username,)) if Username else ("", ())
+        Cursor.execute(
+            f"DELETE FROM daily_habit_rollup {Filter.replace('habits.', '')}", Params
+        )
+        Cursor.execute(
+            f"""
+            INSERT INTO daily_habit_rollup (username, date, tracked, completed, met)
+            SELECT habits.username, habit_tracking.date, COUNT(*),
+                   SUM(CASE WHEN suggested_target > 0 AND count >= suggested_target THEN 1 ELSE 0 END),
+                   SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
+            FROM habit_tracking
+            JOIN habits ON habits.id = habit_tracking.habit_id
+            {Filter}
+            GROUP BY habits.username, habit_tracking.date
+            """,
+            Params,
+        )
+
+    def Rebuild(self, Username=None):
+        """Recompute both rollup tables from the raw tasks and habit_tracking rows"""
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            self.RebuildTaskRollup(Cursor, Username)
+            self.RebuildHabitRollup(Cursor, Username)
+            Conn.commit()
+        if Username:
+            BumpDataVersion(Username)
+        else:
+            BumpAllDataVersions()
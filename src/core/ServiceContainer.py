@@ -0,0 +1,40 @@
+import threading
+from core.AnalyticsProcessor import AnalyticsProcessor
+from core.Auth import Auth
+from core.HabitManager import HabitManager
+from core.Migrations import EnsureMigrated
+from core.TaskManager import TaskManager
+from utils.AuthenticationWrapper import DEFAULT_DB_PATH, GetConnectionPool
+from utils.ChartRenderService import GetChartRenderService
+
+#* One instance of each manager for the whole app. main.InitialiseApp creates it and
+#* passes it down to the windows, so opening a window reuses the managers (and the
+#* analytics caches) instead of building new ones every time.
+
+
+class ServiceContainer:
+    def __init__(self, DBPath=DEFAULT_DB_PATH):
+        self.DBPath = DBPath
+        EnsureMigrated(DBPath)
+
+        self.ConnectionPool = GetConnectionPool(DBPath)
+        self.Auth = Auth(DBPath)
+        self.TaskManager = TaskManager(DBPath)
+        self.HabitManager = HabitManager(DBPath)
+        self.AnalyticsProcessor = AnalyticsProcessor(
+            DBPath, task_manager=self.TaskManager, habit_manager=self.HabitManager
+        )
+        self.ChartRenderService = GetChartRenderService()
+
+
+_Services = None
+_ServicesLock = threading.Lock()
+
+
+def GetServices():
+    "Return the app's shared ServiceContainer, creating it on first use."
+    global _Services
+    with _ServicesLock:
+        if _Services is None:
+            _Services = ServiceContainer()
+        return _Services
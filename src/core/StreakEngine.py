@@ -0,0 +1,76 @@
+import datetime
+
+#* Single-pass streak calculation over habit_tracking rows.
+#* Rows before today are folded into a fixed prefix per habit, so changes to today's
+#* row (IncrementHabit, the daily goal insert) only need ApplyToday, not a rescan.
+
+
+class StreakEngine:
+    """
+    Current and longest streak for each of a user's habits as of Today.
+    A tracked day counts towards a streak when its goal was met, and a missed day
+    ends it. Rows dated after Today are ignored.
+    """
+
+    def __init__(self, Habits, Rows, Today=None):
+        """
+        Habits: the dicts from HabitManager.GetUserHabits.
+        Rows: (habit_id, date, count, suggested_target) ordered by (habit_id, date).
+        """
+        self.Today = Today or datetime.date.today()
+        self._TodayStr = self.Today.isoformat()
+        self._Habits = {}
+
+        for habit in Habits:
+            self._Habits[habit["id"]] = {
+                "goal_type": habit["goal_type"],
+                "target_count": habit["target_count"],
+                "prefix_longest": 0,  # longest streak among rows before today
+                "prefix_run": 0,  # streak still running at the end of yesterday
+                "today_met": None,  # None while there is no row for today
+            }
+
+        for habit_id, date_str, count, suggested_target in Rows:
+            state = self._Habits.get(habit_id)
+            if state is None:
+                continue
+            day = date_str[:10]
+            if day > self._TodayStr:
+                continue
+            met = self._GoalMet(state, count, suggested_target)
+            if day == self._TodayStr:
+                state["today_met"] = met
+            elif met:
+                state["prefix_run"] += 1
+                if state["prefix_run"] > state["prefix_longest"]:
+                    state["prefix_longest"] = state["prefix_run"]
+            else:
+                state["prefix_run"] = 0
+
+    def _GoalMet(self, state, count, suggested_target):
+        target = suggested_target if suggested_target > 0 else state["target_count"]
+        if state["goal_type"] == "increase":
+            return count >= target
+        return count <= target  # decrease
+
+    def ApplyToday(self, habit_id, count, suggested_target):
+        """Update a habit with its current row for today, or drop it when count is None"""
+        state = self._Habits.get(habit_id)
+        if state is None:
+            return
+        if count is None:
+            state["today_met"] = None
+        else:
+            state["today_met"] = self._GoalMet(state, count, suggested_target)
+
+    def GetStreak(self, habit_id):
+        """Return (current_streak, longest_streak) for a habit"""
+        state = self._Habits.get(habit_id)
+        if state is None:
+            return 0, 0
+        if state["today_met"] is None:
+            return state["prefix_run"], state["prefix_longest"]
+        if state["today_met"]:
+            current = state["prefix_run"] + 1
+            return current, max(state["prefix_longest"], current)
+        return 0, state["prefix_longest"]
@@ -1,47 +1,25 @@
+import itertools
+from core.Migrations import EnsureMigrated
 from utils.AuthenticationWrapper import GetDBConnection
+from utils.DataVersion import BumpDataVersion
+
+BULK_CHUNK_SIZE = 1000
+
+
+def _Chunks(Iterable, Size):
+    # * Lists of up to Size items, pulled from Iterable as they are needed
+    Iterator = iter(Iterable)
+    while True:
+        Chunk = list(itertools.islice(Iterator, Size))
+        if not Chunk:
+            return
+        yield Chunk
 
 
 class TaskManager:
     def __init__(self, DBPath="src/core/UsersDatabase.db"):
         self.DBPath = DBPath
-        self._InitialiseDB()
-
-    def _InitialiseDB(self):
-        with GetDBConnection(self.DBPath) as Conn:
-            Cursor = Conn.cursor()
-            Cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    description TEXT DEFAULT NULL,
-                    status TEXT DEFAULT 'pending',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            # Subtasks table
-            Cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS subtasks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    task_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending',
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE
-                )
-                """
-            )
-            # Indexes
-            Cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_tasks_username ON tasks(username)"
-            )
-            Cursor.execute(
-                "CREATE INDEX IF NOT EXISTS idx_subtasks_task_id ON subtasks(task_id)"
-            )
-            Conn.commit()
+        EnsureMigrated(self.DBPath)
 
     def AddTask(self, Username, Title, Description=None, Subtasks=None):
         if not Username or not Title:
@@ -64,7 +42,14 @@ class TaskManager:
                         )
 
             Conn.commit()
-            return TaskID
+        BumpDataVersion(Username)
+        return TaskID
+
+    def _GetTaskOwner(self, Cursor, TaskID):
+        # * Username that owns a task, so writes by id can invalidate that user's cached analytics
+        Cursor.execute("SELECT username FROM tasks WHERE id = ?", (TaskID,))
+        Row = Cursor.fetchone()
+        return Row[0] if Row else None
 
     def GetTasks(self, Username):
         # * Return list of (id, title, status, description) for a user's tasks
@@ -91,6 +76,79 @@ class TaskManager:
             Rows = Cursor.fetchall() or []
         return [(int(Row[0]), str(Row[1]), str(Row[2])) for Row in Rows]
 
+    def _AttachSubtasks(self, TaskRows, SubtaskRows):
+        # * Group (task_id, id, title, status) subtask rows under their task rows
+        SubtasksByTask = {}
+        for TaskID, SubtaskID, SubtaskTitle, SubtaskStatus in SubtaskRows:
+            SubtasksByTask.setdefault(int(TaskID), []).append(
+                (int(SubtaskID), str(SubtaskTitle), str(SubtaskStatus))
+            )
+
+        return [
+            (
+                int(Row[0]),
+                str(Row[1]),
+                str(Row[2]),
+                str(Row[3]) if Row[3] else None,
+                SubtasksByTask.get(int(Row[0]), []),
+            )
+            for Row in TaskRows
+        ]
+
+    def GetTasksWithSubtasks(self, Username):
+        # * Return list of (id, title, status, description, subtasks) for a user's tasks
+        # * Subtasks for every task are fetched in one query and grouped here,
+        # * instead of calling GetSubtasks once per task
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            Cursor.execute(
+                "SELECT id, title, status, description FROM tasks WHERE username = ? ORDER BY id DESC",
+                (Username,),
+            )
+            TaskRows = Cursor.fetchall() or []
+            Cursor.execute(
+                """
+                SELECT subtasks.task_id, subtasks.id, subtasks.title, subtasks.status
+                FROM subtasks
+                JOIN tasks ON tasks.id = subtasks.task_id
+                WHERE tasks.username = ?
+                ORDER BY subtasks.id ASC
+                """,
+                (Username,),
+            )
+            SubtaskRows = Cursor.fetchall() or []
+
+        return self._AttachSubtasks(TaskRows, SubtaskRows)
+
+    def GetTasksPage(self, Username, BeforeID=None, Limit=50):
+        # * Keyset pagination - return the next Limit tasks (newest first) with id < BeforeID,
+        # * in the same shape as GetTasksWithSubtasks. Pass the last id seen to get the next page.
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            if BeforeID is None:
+                Cursor.execute(
+                    "SELECT id, title, status, description FROM tasks WHERE username = ? ORDER BY id DESC LIMIT ?",
+                    (Username, Limit),
+                )
+            else:
+                Cursor.execute(
+                    "SELECT id, title, status, description FROM tasks WHERE username = ? AND id < ? ORDER BY id DESC LIMIT ?",
+                    (Username, BeforeID, Limit),
+                )
+            TaskRows = Cursor.fetchall() or []
+            if not TaskRows:
+                return []
+
+            TaskIDs = [Row[0] for Row in TaskRows]
+            Placeholders = ",".join("?" * len(TaskIDs))
+            Cursor.execute(
+                f"SELECT task_id, id, title, status FROM subtasks WHERE task_id IN ({Placeholders}) ORDER BY id ASC",
+                TaskIDs,
+            )
+            SubtaskRows = Cursor.fetchall() or []
+
+        return self._AttachSubtasks(TaskRows, SubtaskRows)
+
     def GetTaskWithSubtasks(self, TaskID):
         # * Return task details with all its subtasks
         with GetDBConnection(self.DBPath) as Conn:
@@ -118,15 +176,15 @@ class TaskManager:
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
             Cursor.execute(
-                "SELECT COUNT(*) FROM tasks WHERE username = ?",
-                (Username,),
-            )
-            Total = int(Cursor.fetchone()[0] or 0)
-            Cursor.execute(
-                "SELECT COUNT(*) FROM tasks WHERE username = ? AND status = 'completed'",
+                """
+                SELECT COUNT(*), SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END)
+                FROM tasks WHERE username = ?
+                """,
                 (Username,),
             )
-            Completed = int(Cursor.fetchone()[0] or 0)
+            Row = Cursor.fetchone()
+            Total = int(Row[0] or 0)
+            Completed = int(Row[1] or 0)
             Pending = max(0, Total - Completed)
         return Total, Completed, Pending
 
@@ -142,6 +200,7 @@ class TaskManager:
                 return False
 
             TaskID = Result[0]
+            Owner = self._GetTaskOwner(Cursor, TaskID)
 
             Cursor.execute(
                 "UPDATE subtasks SET status = 'completed' WHERE id = ?", (SubtaskID,)
@@ -155,16 +214,18 @@ class TaskManager:
 
             if PendingCount == 0:
                 Cursor.execute(
-                    "UPDATE tasks SET status = 'completed' WHERE id = ?", (TaskID)
+                    "UPDATE tasks SET status = 'completed' WHERE id = ?", (TaskID,)
                 )
 
             Conn.commit()
-            return True
+        BumpDataVersion(Owner)
+        return True
 
     def CompleteTask(self, TaskID):
         # * Mark task and all its subtasks as complete
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
+            Owner = self._GetTaskOwner(Cursor, TaskID)
 
             Cursor.execute(
                 "UPDATE tasks SET status = 'completed' WHERE id = ?", (TaskID,)
@@ -175,19 +236,22 @@ class TaskManager:
             )
 
             Conn.commit()
-            return True
+        BumpDataVersion(Owner)
+        return True
 
     def DeleteTask(self, TaskID):
         # * Delete task and all its subtasks
         with GetDBConnection(self.DBPath) as Conn:
             Cursor = Conn.cursor()
+            Owner = self._GetTaskOwner(Cursor, TaskID)
 
             Cursor.execute("DELETE FROM subtasks WHERE task_id = ?", (TaskID,))
 
             Cursor.execute("DELETE FROM tasks WHERE id = ?", (TaskID,))
 
             Conn.commit()
-            return True
+        BumpDataVersion(Owner)
+        return True
 
     def AddSubtask(self, TaskID, SubtaskTitle):
         with GetDBConnection(self.DBPath) as Conn:
@@ -196,8 +260,114 @@ class TaskManager:
                 "INSERT INTO subtasks (task_id, title) VALUES (?, ?)",
                 (TaskID, SubtaskTitle),
             )
+            SubtaskID = int(Cursor.lastrowid)
+            Owner = self._GetTaskOwner(Cursor, TaskID)
             Conn.commit()
-            return int(Cursor.lastrowid)
+        BumpDataVersion(Owner)
+        return SubtaskID
+
+    # ========= Bulk import / export =========
+    def BulkImport(self, Username, Tasks, ChunkSize=BULK_CHUNK_SIZE):
+        """
+        Insert many tasks in one transaction, e.g. a backlog from another tool.
+        Tasks is any iterable of dicts shaped like BulkExport's output:
+            {"title": ..., "description": ..., "status": ..., "created_at": ...,
+             "subtasks": [{"title": ..., "status": ...} or "title", ...]}
+        Only title is required. Records are consumed ChunkSize at a time and written
+        with executemany, so a generator never has to be held in memory. Nothing is
+        written if any record is invalid. Returns the number of tasks imported.
+        """
+        if not Username:
+            raise ValueError("username is required")
 
+        Imported = 0
+        with GetDBConnection(self.DBPath) as Conn:
+            Cursor = Conn.cursor()
+            # Take the write lock now, so nobody else can insert tasks while ids are handed out
+            Cursor.execute("BEGIN IMMEDIATE")
+            try:
+                Cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")
+                Row = Cursor.fetchone()
+                NextID = (Row[0] if Row else 0) + 1
+
+                for Chunk in _Chunks(Tasks, ChunkSize):
+                    TaskRows = []
+                    SubtaskRows = []
+                    for Task in Chunk:
+                        Title = (Task.get("title") or "").strip()
+                        if not Title:
+                            raise ValueError(f"task {Imported + len(TaskRows) + 1} has no title")
+                        # Explicit ids, executemany can't report the ids it generated
+                        TaskRows.append(
+                            (NextID, Username, Title, Task.get("description"), Task.get("status"), Task.get("created_at"))
+                        )
+                        for Subtask in Task.get("subtasks") or ():
+                            if isinstance(Subtask, str):
+                                Subtask = {"title": Subtask}
+                            SubtaskTitle = (Subtask.get("title") or "").strip()
+                            if SubtaskTitle:
+                                SubtaskRows.append((NextID, SubtaskTitle, Subtask.get("status")))
+                        NextID += 1
 
+                    Cursor.executemany(
+                        """
+                        INSERT INTO tasks (id, username, title, description, status, created_at)
+                        VALUES (?, ?, ?, ?, COALESCE(?, 'pending'), COALESCE(?, CURRENT_TIMESTAMP))
+                        """,
+                        TaskRows,
+                    )
+                    Cursor.executemany(
+                        "INSERT INTO subtasks (task_id, title, status) VALUES (?, ?, COALESCE(?, 'pending'))",
+                        SubtaskRows,
+                    )
+                    Imported += len(TaskRows)
+
+                Conn.commit()
+            except Exception:
+                Conn.rollback()
+                raise
+
+        BumpDataVersion(Username)
+        return Imported
+
+    def BulkExport(self, Username, ChunkSize=BULK_CHUNK_SIZE):
+        """
+        Yield every task of a user, oldest first, as a dict with its subtasks
+        (the format BulkImport takes). Tasks are read ChunkSize at a time and no
+        connection is held between chunks, so the caller can stream them anywhere.
+        """
+        LastID = 0
+        while True:
+            with GetDBConnection(self.DBPath) as Conn:
+                Cursor = Conn.cursor()
+                Cursor.execute(
+                    """
+                    SELECT id, title, description, status, created_at FROM tasks
+                    WHERE username = ? AND id > ? ORDER BY id ASC LIMIT ?
+                    """,
+                    (Username, LastID, ChunkSize),
+                )
+                TaskRows = Cursor.fetchall()
+                if not TaskRows:
+                    return
+
+                TaskIDs = [Row[0] for Row in TaskRows]
+                Placeholders = ",".join("?" * len(TaskIDs))
+                Cursor.execute(
+                    f"SELECT task_id, title, status FROM subtasks WHERE task_id IN ({Placeholders}) ORDER BY id ASC",
+                    TaskIDs,
+                )
+                SubtasksByTask = {}
+                for TaskID, SubtaskTitle, SubtaskStatus in Cursor.fetchall():
+                    SubtasksByTask.setdefault(TaskID, []).append({"title": SubtaskTitle, "status": SubtaskStatus})
 
+            for TaskID, Title, Description, Status, CreatedAt in TaskRows:
+                yield {
+                    "id": TaskID,
+                    "title": Title,
+                    "description": Description,
+                    "status": Status,
+                    "created_at": CreatedAt,
+                    "subtasks": SubtasksByTask.get(TaskID, []),
+                }
+            LastID = TaskRows[-1][0]
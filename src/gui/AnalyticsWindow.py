@@ -1,25 +1,17 @@
 import customtkinter
-from PIL import Image
-import os
-import tempfile
-from core.AnalyticsProcessor import AnalyticsProcessor
-from utils.ChartGenerator import (
-    create_line_chart,
-    create_bar_chart,
-    create_pie_chart,
-    create_multi_line_chart,
-    get_temp_chart_path,
-)
+from utils.TaskExecutor import TaskExecutor
 
 
 class AnalyticsWindow(customtkinter.CTkToplevel):
-    def __init__(self, parent, username):
+    def __init__(self, parent, username, services):
         super().__init__(parent)
 
         self.username = username
-        self.processor = AnalyticsProcessor()
+        # Shared with every other window, so the analytics cache outlives this one
+        self.processor = services.AnalyticsProcessor
         self.current_time_range = "all_time"
-        self.chart_paths = []  # Track chart files for cleanup
+        self.Executor = TaskExecutor(self)
+        self.ChartService = services.ChartRenderService
 
         self.title("Analytics Dashboard")
         self.geometry("1200x800")
@@ -39,18 +31,6 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         self._CreateUI()
 
-        # Cleanup chart files on window close
-        self.protocol("WM_DELETE_WINDOW", self._on_closing)
-
-    def _on_closing(self):
-        for path in self.chart_paths:
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-            except:
-                pass
-        self.destroy()
-
     def _CreateUI(self):
         HeaderFrame = customtkinter.CTkFrame(
             self, fg_color=self.Colors["Primary"], corner_radius=0
@@ -119,21 +99,57 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         self._update_dashboard()
 
     def _update_dashboard(self):
+        # Charts still rendering for the old dashboard would land in destroyed frames
+        self.Executor.CancelAll("chart:")
+        for widget in self.ContentFrame.winfo_children():
+            widget.destroy()
+
+        LoadingLabel = customtkinter.CTkLabel(
+            self.ContentFrame,
+            text="⏳ Loading analytics...",
+            text_color=self.Colors["TextDark"],
+            font=("Montserrat", 16),
+        )
+        LoadingLabel.pack(pady=80)
+
+        # Queries run on a worker thread and charts in the render service's processes.
+        # Changing the time range again before they finish drops the older request (same key).
+        self.Executor.Submit(
+            self._load_dashboard,
+            self.current_time_range,
+            OnSuccess=self._show_dashboard,
+            OnError=self._show_dashboard_error,
+            Key="dashboard",
+        )
+
+    def _load_dashboard(self, time_range):
+        """Runs on a worker thread - gathers everything the dashboard shows, no widgets here"""
+        return {
+            "cards": self._get_dashboard_cards_data(time_range),
+            "charts": self._create_charts_section(time_range),
+            "insights": self._generate_insights(time_range),
+        }
+
+    def _show_dashboard(self, data):
         for widget in self.ContentFrame.winfo_children():
             widget.destroy()
 
-        # Clean up old chart files
-        for path in self.chart_paths:
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-            except:
-                pass
-        self.chart_paths.clear()
+        self._create_dashboard_cards(data["cards"])
+
+        # Lay out a placeholder per chart in order, then fill each one in as its
+        # render finishes, so the first charts show up without waiting for the rest
+        for spec in data["charts"]:
+            ChartFrame, LoadingLabel = self._create_chart_placeholder(spec["title"])
+            self.Executor.Watch(
+                self.ChartService.Submit(spec),
+                OnSuccess=lambda result, frame=ChartFrame, label=LoadingLabel: self._display_chart(frame, label, result[1]),
+                OnError=lambda error, label=LoadingLabel: label.configure(
+                    text=f"Error rendering chart: {str(error)}", text_color="red"
+                ),
+                Key=f"chart:{spec['name']}",
+            )
 
-        self._create_dashboard_cards()
-        self._create_charts_section()
-        self._create_insights_section()
+        self._create_insights_section(data["insights"])
 
         CloseBtn = customtkinter.CTkButton(
             self.ContentFrame,
@@ -144,23 +160,26 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             font=("Montserrat", 13, "bold"),
             height=40,
             width=150,
-            command=self._on_closing,
+            command=self.destroy,
         )
         CloseBtn.pack(pady=20)
 
-    def _create_dashboard_cards(self):
-        CardsFrame = customtkinter.CTkFrame(
-            self.ContentFrame, fg_color=self.Colors["Light"]
+    def _show_dashboard_error(self, error):
+        for widget in self.ContentFrame.winfo_children():
+            widget.destroy()
+
+        ErrorLabel = customtkinter.CTkLabel(
+            self.ContentFrame,
+            text=f"Error loading analytics: {str(error)}",
+            text_color="red",
+            font=("Montserrat", 14),
         )
-        CardsFrame.pack(fill="x", pady=10)
-        CardsFrame.grid_columnconfigure(0, weight=1)
-        CardsFrame.grid_columnconfigure(1, weight=1)
-        CardsFrame.grid_columnconfigure(2, weight=1)
-        CardsFrame.grid_columnconfigure(3, weight=1)
+        ErrorLabel.pack(pady=80)
 
-        task_stats = self.processor.get_task_stats(self.username, self.current_time_range)
-        habit_stats = self.processor.get_habit_stats(self.username, self.current_time_range)
-        productivity_score = self.processor.get_productivity_score(self.username, self.current_time_range)
+    def _get_dashboard_cards_data(self, time_range):
+        task_stats = self.processor.get_task_stats(self.username, time_range)
+        habit_stats = self.processor.get_habit_stats(self.username, time_range)
+        productivity_score = self.processor.get_productivity_score(self.username, time_range)
 
         streaks = self.processor.get_habit_streaks(self.username)
 
@@ -171,6 +190,27 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
                 longest_streak = streak_data["current_streak"]
                 longest_streak_habit = streak_data["habit_name"]
 
+        return {
+            "task_stats": task_stats,
+            "habit_stats": habit_stats,
+            "productivity_score": productivity_score,
+            "longest_streak": longest_streak,
+            "longest_streak_habit": longest_streak_habit,
+        }
+
+    def _create_dashboard_cards(self, cards):
+        task_stats = cards["task_stats"]
+        habit_stats = cards["habit_stats"]
+
+        CardsFrame = customtkinter.CTkFrame(
+            self.ContentFrame, fg_color=self.Colors["Light"]
+        )
+        CardsFrame.pack(fill="x", pady=10)
+        CardsFrame.grid_columnconfigure(0, weight=1)
+        CardsFrame.grid_columnconfigure(1, weight=1)
+        CardsFrame.grid_columnconfigure(2, weight=1)
+        CardsFrame.grid_columnconfigure(3, weight=1)
+
         self._CreateDashboardCard(
             CardsFrame,
             "Task Completion",
@@ -179,7 +219,9 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             self.Colors["Primary"],
             0,
             0,
-            lambda: self._show_task_details(),)
+            lambda: self._show_task_details(),
+            progress=task_stats["completion_rate"] / 100.0 if task_stats["total"] > 0 else None,
+        )
 
         self._CreateDashboardCard(
             CardsFrame,
@@ -195,8 +237,8 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         self._CreateDashboardCard(
             CardsFrame,
             "Current Streak",
-            f"{longest_streak} days",
-            longest_streak_habit,
+            f"{cards['longest_streak']} days",
+            cards["longest_streak_habit"],
             self.Colors["Accent"],
             0,
             2,
@@ -206,7 +248,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         self._CreateDashboardCard(
             CardsFrame,
             "Productivity Score",
-            f"{productivity_score}%",
+            f"{cards['productivity_score']}%",
             "Combined tasks + habits",
             self.Colors["Dark"],
             0,
@@ -215,7 +257,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         )
 
     def _CreateDashboardCard(
-        self, parent, title, value, subtitle, color, row, col, command):
+        self, parent, title, value, subtitle, color, row, col, command, progress=None):
         Card = customtkinter.CTkFrame(
             parent, fg_color=color, corner_radius=12, cursor="hand2"
         )
@@ -239,17 +281,12 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         ValueLabel.pack(pady=5)
 
         if "Completion" in title:
-            task_stats = self.processor.get_task_stats(
-                self.username, self.current_time_range
-            )
-            progress = task_stats["completion_rate"] / 100.0
-
             ProgressFrame = customtkinter.CTkFrame(
                 Card, fg_color=self.Colors["Light"], corner_radius=5, height=8
             )
             ProgressFrame.pack(fill="x", padx=20, pady=(5, 10))
 
-            if task_stats["total"] > 0:
+            if progress is not None:
                 ProgressBar = customtkinter.CTkFrame(
                     ProgressFrame,
                     fg_color=self.Colors["Text"],
@@ -272,58 +309,62 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         return Card
 
-    def _create_charts_section(self):
-        self._create_task_completion_trends_chart()
-        self._create_task_status_pie_chart()
-        self._create_habit_performance_chart()
-        self._create_habit_streaks_chart()
-        self._create_week_comparison_chart()
-        self._create_productivity_trend_chart()
-        self._create_goal_forecast_chart()
+    def _create_charts_section(self, time_range):
+        """Build the spec of every chart that has data, see ChartRenderService"""
+        charts = [
+            self._create_task_completion_trends_chart(time_range),
+            self._create_task_status_pie_chart(time_range),
+            self._create_habit_performance_chart(time_range),
+            self._create_habit_streaks_chart(),
+            self._create_week_comparison_chart(),
+            self._create_productivity_trend_chart(time_range),
+            self._create_goal_forecast_chart(),
+        ]
+        return [chart for chart in charts if chart is not None]
 
 
-    def _create_task_completion_trends_chart(self):
-        trends = self.processor.get_task_trends(self.username, self.current_time_range)
+    def _create_task_completion_trends_chart(self, time_range):
+        trends = self.processor.get_task_trends(self.username, time_range)
 
         if not trends["dates"]:
             return
 
-        chart_path = get_temp_chart_path("task_trends")
-        self.chart_paths.append(chart_path)
-
-        create_line_chart(
-            trends["completion_rates"],
-            "Task Completion Rate Trend",
-            "Date",
-            "Completion Rate (%)",
-            chart_path,
-            trends["dates"],
-        )
-
-        self._display_chart(chart_path, "Task Completion Trends")
+        return {
+            "name": "task_trends",
+            "title": "Task Completion Trends",
+            "kind": "line",
+            "args": [
+                trends["completion_rates"],
+                "Task Completion Rate Trend",
+                "Date",
+                "Completion Rate (%)",
+                trends["dates"],
+            ],
+        }
 
-    def _create_task_status_pie_chart(self):
+    def _create_task_status_pie_chart(self, time_range):
         """Task Status Distribution - Pie Chart"""
-        stats = self.processor.get_task_stats(self.username, self.current_time_range)
+        stats = self.processor.get_task_stats(self.username, time_range)
 
         if stats["total"] == 0:
             return
 
         data = {"Completed": stats["completed"], "Pending": stats["pending"]}
 
-        chart_path = get_temp_chart_path("task_status")
-        self.chart_paths.append(chart_path)
-
-        create_pie_chart(data, "Task Status Distribution", chart_path)
-        self._display_chart(chart_path, "Task Status Distribution")
+        return {
+            "name": "task_status",
+            "title": "Task Status Distribution",
+            "kind": "pie",
+            "args": [data, "Task Status Distribution"],
+        }
 
-    def _create_habit_performance_chart(self):
+    def _create_habit_performance_chart(self, time_range):
         habits = self.processor.HabitManager.GetUserHabits(self.username)
 
         if not habits:
             return
 
-        start_date, end_date = self.processor._get_date_range(self.current_time_range)
+        start_date, end_date = self.processor._get_date_range(time_range)
         habit_data = {}
 
         for habit in habits:
@@ -331,7 +372,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             if start_date is None:
                 from utils.AuthenticationWrapper import GetDBConnection
 
-                with GetDBConnection() as Conn:
+                with GetDBConnection(self.processor.DBPath) as Conn:
                     Cursor = Conn.cursor()
                     Cursor.execute(
                         """SELECT COUNT(*), SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
@@ -347,7 +388,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
                 end_str = end_date.isoformat()
                 from utils.AuthenticationWrapper import GetDBConnection
 
-                with GetDBConnection() as Conn:
+                with GetDBConnection(self.processor.DBPath) as Conn:
                     Cursor = Conn.cursor()
                     Cursor.execute(
                         """SELECT COUNT(*), SUM(CASE WHEN count >= suggested_target THEN 1 ELSE 0 END)
@@ -363,17 +404,17 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         if not habit_data:
             return
 
-        chart_path = get_temp_chart_path("habit_performance")
-        self.chart_paths.append(chart_path)
-
-        create_bar_chart(
-            habit_data,
-            "Habit Completion Rates",
-            "Habit",
-            "Completion Rate (%)",
-            chart_path,
-        )
-        self._display_chart(chart_path, "Habit Performance")
+        return {
+            "name": "habit_performance",
+            "title": "Habit Performance",
+            "kind": "bar",
+            "args": [
+                habit_data,
+                "Habit Completion Rates",
+                "Habit",
+                "Completion Rate (%)",
+            ],
+        }
 
     def _create_habit_streaks_chart(self):
         streaks = self.processor.get_habit_streaks(self.username)
@@ -386,11 +427,12 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         if not streak_data:
             return
 
-        chart_path = get_temp_chart_path("habit_streaks")
-        self.chart_paths.append(chart_path)
-
-        create_bar_chart(streak_data, "Current Habit Streaks", "Habit", "Days", chart_path)
-        self._display_chart(chart_path, "Habit Streaks")
+        return {
+            "name": "habit_streaks",
+            "title": "Habit Streaks",
+            "kind": "bar",
+            "args": [streak_data, "Current Habit Streaks", "Habit", "Days"],
+        }
 
     def _create_week_comparison_chart(self):
         comparison = self.processor.get_task_comparison(self.username)
@@ -399,21 +441,22 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             "Last Week": comparison["week_over_week"]["last_week"],
             "This Week": comparison["week_over_week"]["this_week"],
         }
-        chart_path = get_temp_chart_path("week_comparison")
-        self.chart_paths.append(chart_path)
 
-        create_bar_chart(
-            data,
-            "Week-over-Week Task Completion",
-            "Period",
-            "Completion Rate (%)",
-            chart_path,
-        )
-        self._display_chart(chart_path, "Week-over-Week Comparison")
+        return {
+            "name": "week_comparison",
+            "title": "Week-over-Week Comparison",
+            "kind": "bar",
+            "args": [
+                data,
+                "Week-over-Week Task Completion",
+                "Period",
+                "Completion Rate (%)",
+            ],
+        }
 
-    def _create_productivity_trend_chart(self):
+    def _create_productivity_trend_chart(self, time_range):
         trends = self.processor.get_overall_trends(
-            self.username, self.current_time_range
+            self.username, time_range
         )
 
         if not trends["dates"]:
@@ -425,18 +468,18 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             "Habits": trends["habit_scores"],
         }
 
-        chart_path = get_temp_chart_path("productivity_trend")
-        self.chart_paths.append(chart_path)
-
-        create_multi_line_chart(
-            data_dict,
-            "Productivity Trends",
-            "Date",
-            "Completion Rate (%)",
-            chart_path,
-            trends["dates"],
-        )
-        self._display_chart(chart_path, "Productivity Trends")
+        return {
+            "name": "productivity_trend",
+            "title": "Productivity Trends",
+            "kind": "multi_line",
+            "args": [
+                data_dict,
+                "Productivity Trends",
+                "Date",
+                "Completion Rate (%)",
+                trends["dates"],
+            ],
+        }
 
     def _create_goal_forecast_chart(self):
         """Goal Achievement Forecast - Line Chart"""
@@ -455,20 +498,20 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             days_ahead = "On Track" if f["on_track"] else "Behind"
             forecast_data[f["habit_name"]] = 1 if f["on_track"] else 0
 
-        chart_path = get_temp_chart_path("goal_forecast")
-        self.chart_paths.append(chart_path)
-
-        create_bar_chart(
-            forecast_data,
-            "Habit Goal Achievement Status",
-            "Habit",
-            "Status (1=On Track, 0=Behind)",
-            chart_path,
-        )
-        self._display_chart(chart_path, "Goal Achievement Forecast")
+        return {
+            "name": "goal_forecast",
+            "title": "Goal Achievement Forecast",
+            "kind": "bar",
+            "args": [
+                forecast_data,
+                "Habit Goal Achievement Status",
+                "Habit",
+                "Status (1=On Track, 0=Behind)",
+            ],
+        }
 
-    def _display_chart(self, chart_path, title):
-        """Display a chart image in the content frame"""
+    def _create_chart_placeholder(self, title):
+        """Chart frame with a loading label, filled in by _display_chart"""
         ChartFrame = customtkinter.CTkFrame(
             self.ContentFrame, fg_color="white", corner_radius=15
         )
@@ -482,24 +525,26 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         )
         TitleLabel.pack(pady=(15, 10))
 
-        try:
-            ChartImagePIL = Image.open(chart_path)
-            ChartImage = customtkinter.CTkImage(
-                light_image=ChartImagePIL,
-                size=(ChartImagePIL.width, ChartImagePIL.height),
-            )
-            ChartLabel = customtkinter.CTkLabel(ChartFrame, image=ChartImage, text="")
-            ChartLabel.pack(pady=(0, 15))
-        except Exception as e:
-            ErrorLabel = customtkinter.CTkLabel(
-                ChartFrame,
-                text=f"Error loading chart: {str(e)}",
-                text_color="red",
-                font=("Montserrat", 12),
-            )
-            ErrorLabel.pack(pady=15)
+        LoadingLabel = customtkinter.CTkLabel(
+            ChartFrame,
+            text="⏳ Rendering chart...",
+            text_color=self.Colors["TextDark"],
+            font=("Montserrat", 12),
+        )
+        LoadingLabel.pack(pady=(0, 15))
+        return ChartFrame, LoadingLabel
+
+    def _display_chart(self, chart_frame, loading_label, chart_image):
+        """Swap a chart placeholder's loading label for the rendered image"""
+        loading_label.destroy()
+        ChartImage = customtkinter.CTkImage(
+            light_image=chart_image,
+            size=(chart_image.width, chart_image.height),
+        )
+        ChartLabel = customtkinter.CTkLabel(chart_frame, image=ChartImage, text="")
+        ChartLabel.pack(pady=(0, 15))
 
-    def _create_insights_section(self):
+    def _create_insights_section(self, insights):
         """Create dynamic insights section"""
         InsightsFrame = customtkinter.CTkFrame(
             self.ContentFrame, fg_color="white", corner_radius=15
@@ -514,8 +559,6 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         )
         InsightsTitle.pack(pady=(20, 10))
 
-        insights = self._generate_insights()
-
         for insight in insights:
             InsightLabel = customtkinter.CTkLabel(
                 InsightsFrame,
@@ -529,14 +572,12 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         customtkinter.CTkLabel(InsightsFrame, text="").pack(pady=10)
 
-    def _generate_insights(self):
+    def _generate_insights(self, time_range):
         """Generate dynamic insights based on data"""
         insights = []
 
         # Task insights
-        task_stats = self.processor.get_task_stats(
-            self.username, self.current_time_range
-        )
+        task_stats = self.processor.get_task_stats(self.username, time_range)
         if task_stats["total"] > 0:
             insights.append(
                 f"You've completed {task_stats['completed']} out of {task_stats['total']} tasks ({task_stats['completion_rate']}%)"
@@ -582,9 +623,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
             )
 
         # Productivity score
-        productivity = self.processor.get_productivity_score(
-            self.username, self.current_time_range
-        )
+        productivity = self.processor.get_productivity_score(self.username, time_range)
         insights.append(f"Your productivity score is {productivity}%")
 
         if not insights:
@@ -595,19 +634,28 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
     # Drill-down methods
     def _show_task_details(self):
         """Show detailed task breakdown"""
-        self._show_drill_down("Tasks", self._get_task_details_content())
+        self._load_drill_down("Tasks", self._get_task_details_content)
 
     def _show_habit_details(self):
         """Show detailed habit breakdown"""
-        self._show_drill_down("Habits", self._get_habit_details_content())
+        self._load_drill_down("Habits", self._get_habit_details_content)
 
     def _show_streak_details(self):
         """Show detailed streak information"""
-        self._show_drill_down("Streaks", self._get_streak_details_content())
+        self._load_drill_down("Streaks", self._get_streak_details_content)
 
     def _show_productivity_details(self):
         """Show productivity breakdown"""
-        self._show_drill_down("Productivity", self._get_productivity_details_content())
+        self._load_drill_down("Productivity", self._get_productivity_details_content)
+
+    def _load_drill_down(self, title, get_content):
+        """Fetch drill-down content on a worker thread, then open the window"""
+        self.Executor.Submit(
+            get_content,
+            self.current_time_range,
+            OnSuccess=lambda content: self._show_drill_down(title, content),
+            Key="drill_down",
+        )
 
     def _show_drill_down(self, title, content):
         """Display drill-down window with details"""
@@ -653,12 +701,12 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
         )
         CloseBtn.pack(pady=10)
 
-    def _get_task_details_content(self):
+    def _get_task_details_content(self, time_range):
         """Get task details for drill-down"""
         content = []
         tasks = self.processor.TaskManager.GetTasks(self.username)
 
-        stats = self.processor.get_task_stats(self.username, self.current_time_range)
+        stats = self.processor.get_task_stats(self.username, time_range)
         content.append(f"Total Tasks: {stats['total']}")
         content.append(f"Completed: {stats['completed']}")
         content.append(f"Pending: {stats['pending']}")
@@ -673,12 +721,12 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         return content
 
-    def _get_habit_details_content(self):
+    def _get_habit_details_content(self, time_range):
         """Get habit details for drill-down"""
         content = []
         habits = self.processor.HabitManager.GetUserHabits(self.username)
 
-        stats = self.processor.get_habit_stats(self.username, self.current_time_range)
+        stats = self.processor.get_habit_stats(self.username, time_range)
         content.append(f"Active Habits: {stats['active_habits']}")
         content.append(f"Average Completion Rate: {stats['avg_completion_rate']}%")
         content.append("")
@@ -691,7 +739,7 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         return content
 
-    def _get_streak_details_content(self):
+    def _get_streak_details_content(self, time_range):
         """Get streak details for drill-down"""
         content = []
         streaks = self.processor.get_habit_streaks(self.username)
@@ -703,19 +751,13 @@ class AnalyticsWindow(customtkinter.CTkToplevel):
 
         return content
 
-    def _get_productivity_details_content(self):
+    def _get_productivity_details_content(self, time_range):
         """Get productivity details for drill-down"""
         content = []
 
-        task_stats = self.processor.get_task_stats(
-            self.username, self.current_time_range
-        )
-        habit_stats = self.processor.get_habit_stats(
-            self.username, self.current_time_range
-        )
-        productivity = self.processor.get_productivity_score(
-            self.username, self.current_time_range
-        )
+        task_stats = self.processor.get_task_stats(self.username, time_range)
+        habit_stats = self.processor.get_habit_stats(self.username, time_range)
+        productivity = self.processor.get_productivity_score(self.username, time_range)
 
         content.append(f"Overall Productivity Score: {productivity}%")
         content.append("")
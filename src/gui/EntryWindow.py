@@ -3,10 +3,11 @@ from gui.LoginWindow import LoginWindow
 from PIL import Image
 
 class EntryWindow(customtkinter.CTkFrame):
-    def __init__(self, parent):
+    def __init__(self, parent, services):
         super().__init__(parent)
 
         self.parent = parent
+        self.Services = services
 
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -60,7 +61,7 @@ class EntryWindow(customtkinter.CTkFrame):
             self.after(20, self.FadeOut, step)
         else:
             self.destroy()
-            login = LoginWindow(self.parent)
+            login = LoginWindow(self.parent, self.Services)
             login.grid(row=0, column=0, sticky="nsew")
             login.FadeIn()
     def FadeIn(self, step=0.05):
@@ -77,7 +78,7 @@ class EntryWindow(customtkinter.CTkFrame):
             self.after(5, self.SlideOut, x+15)
         else:
             self.destroy()
-            login = LoginWindow(self.parent)
+            login = LoginWindow(self.parent, self.Services)
             login.place(x=750, y=0) 
             login.SlideIn()
 
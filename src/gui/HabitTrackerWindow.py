@@ -1,15 +1,20 @@
 import customtkinter
 import datetime
-from core.HabitManager import HabitManager
+import tkinter
 from gui.AddHabitWindow import AddHabitWindow
+from utils.TaskExecutor import TaskExecutor
 
 
 class HabitTrackerWindow(customtkinter.CTkToplevel):
-    def __init__(self, parent, username):
+    def __init__(self, parent, username, services):
         super().__init__(parent)
 
         self.username = username
-        self.HabitManager = HabitManager()
+        self.HabitManager = services.HabitManager
+        self.Executor = TaskExecutor(self)
+        self._Cards = {}  # habit id -> (habit, today_data, card, progress label) currently shown
+        # Covers the close button and the window manager's close alike
+        tkinter.Misc.bind(self, "<Destroy>", self._OnDestroy, add="+")
 
         # Window configuration
         self.title("Habit Tracker")
@@ -32,10 +37,8 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
 
         self.configure(fg_color=self.Colors["Light"])
 
-        self.HabitManager.CheckAndGenerateDailyGoals(self.username)
-
         self._CreateUI()
-        self._LoadHabits()
+        self._LoadHabits(GenerateGoals=True)
 
     def _CreateUI(self):
         HeaderFrame = customtkinter.CTkFrame(
@@ -98,12 +101,40 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
         )
         CloseBtn.pack(side="right", padx=5)
 
-    def _LoadHabits(self):
-        """Load and display all user habits"""
+    def _LoadHabits(self, GenerateGoals=False):
+        """Load all user habits in the background, then display them"""
         for widget in self.HabitsFrame.winfo_children():
             widget.destroy()
 
+        LoadingLabel = customtkinter.CTkLabel(
+            self.HabitsFrame,
+            text="⏳ Loading habits...",
+            text_color=self.Colors["TextDark"],
+            font=("Montserrat", 14),
+        )
+        LoadingLabel.pack(pady=50)
+
+        self.Executor.Submit(
+            self._FetchHabits,
+            GenerateGoals,
+            OnSuccess=self._ShowHabits,
+            OnError=lambda error: LoadingLabel.configure(
+                text=f"Couldn't load habits: {error}", text_color="red"
+            ),
+            Key="habits",
+        )
+
+    def _FetchHabits(self, GenerateGoals):
+        """Runs on a worker thread - returns (habit, today_data) pairs"""
+        if GenerateGoals:
+            self.HabitManager.CheckAndGenerateDailyGoals(self.username)
         habits = self.HabitManager.GetUserHabits(self.username)
+        return [(habit, self.HabitManager.GetTodayData(habit["id"])) for habit in habits]
+
+    def _ShowHabits(self, habits):
+        self._Cards = {}
+        for widget in self.HabitsFrame.winfo_children():
+            widget.destroy()
 
         if not habits:
             NoHabitsLabel = customtkinter.CTkLabel(
@@ -115,15 +146,36 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
             NoHabitsLabel.pack(pady=50)
             return
 
-        for habit in habits:
-            self._CreateHabitCard(habit)
+        for habit, today_data in habits:
+            # No row for today yet, show what the first +1 will create
+            self._CreateHabitCard(habit, today_data or {"count": 0, "suggested_target": 0})
 
-    def _CreateHabitCard(self, habit):
-        habit_id = habit["id"]
-        today_data = self.HabitManager.GetTodayData(habit_id)
+    def _CardColor(self, goal_type, count, target):
+        if goal_type == "increase":
+            if count >= target:
+                return self.Colors["Success"]
+            elif count >= target * 0.7:
+                return self.Colors["Primary"]
+            else:
+                return self.Colors["Warning"]
+        else:  # decrease
+            if count <= target:
+                return self.Colors["Success"]
+            elif count <= target * 1.3:
+                return self.Colors["Primary"]
+            else:
+                return self.Colors["Danger"]
 
-        if not today_data:
-            return
+    def _ProgressText(self, goal_type, count, target):
+        ProgressText = f"Today: {count} / {target}"
+        if goal_type == "decrease":
+            ProgressText += " (goal: decrease)"
+        else:
+            ProgressText += " (goal: increase)"
+        return ProgressText
+
+    def _CreateHabitCard(self, habit, today_data):
+        habit_id = habit["id"]
 
         count = today_data["count"]
         target = today_data["suggested_target"]
@@ -135,20 +187,7 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
         today = datetime.date.today()
         days_remaining = (target_date - today).days
 
-        if goal_type == "increase":
-            if count >= target:
-                card_color = self.Colors["Success"]  
-            elif count >= target * 0.7:
-                card_color = self.Colors["Primary"]  
-            else:
-                card_color = self.Colors["Warning"]  
-        else:  # decrease
-            if count <= target:
-                card_color = self.Colors["Success"]  
-            elif count <= target * 1.3:
-                card_color = self.Colors["Primary"]  
-            else:
-                card_color = self.Colors["Danger"]  
+        card_color = self._CardColor(goal_type, count, target)
 
         HabitCard = customtkinter.CTkFrame(
             self.HabitsFrame, fg_color=card_color, corner_radius=10
@@ -167,20 +206,15 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
         )
         HabitNameLabel.pack(anchor="w")
 
-        ProgressText = f"Today: {count} / {target}"
-        if goal_type == "decrease":
-            ProgressText += " (goal: decrease)"
-        else:
-            ProgressText += " (goal: increase)"
-
         ProgressLabel = customtkinter.CTkLabel(
             LeftFrame,
-            text=ProgressText,
+            text=self._ProgressText(goal_type, count, target),
             text_color=self.Colors["Text"],
             font=("Montserrat", 12),
             anchor="w",
         )
         ProgressLabel.pack(anchor="w", pady=(3, 0))
+        self._Cards[habit_id] = (habit, today_data, HabitCard, ProgressLabel)
 
         if days_remaining > 0:
             DaysText = f"📅 {days_remaining} days until deadline"
@@ -232,8 +266,29 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
 
     def _IncrementHabit(self, habit_id):
         """Increment habit count by 1"""
-        self.HabitManager.IncrementHabit(habit_id)
-        self._LoadHabits()
+        self.Executor.Submit(
+            self.HabitManager.IncrementHabit,
+            habit_id,
+            OnSuccess=lambda _: self._ShowIncrement(habit_id),
+        )
+
+    def _ShowIncrement(self, habit_id):
+        """Update the clicked card in place, the increment is still buffered so there is nothing to reload"""
+        if habit_id not in self._Cards:
+            return  # the list was reloaded without it in the meantime
+        habit, today_data, HabitCard, ProgressLabel = self._Cards[habit_id]
+        today_data["count"] += 1
+        count, target = today_data["count"], today_data["suggested_target"]
+        ProgressLabel.configure(text=self._ProgressText(habit["goal_type"], count, target))
+        HabitCard.configure(fg_color=self._CardColor(habit["goal_type"], count, target))
+
+    def _OnDestroy(self, event):
+        # <Destroy> also fires for every child widget
+        if event.widget is self:
+            try:
+                self.HabitManager.FlushIncrements()
+            except Exception:
+                pass  # still pending, the buffer retries and the exit flush covers it
 
     def _DeleteHabit(self, habit_id):
         """Delete a habit with confirmation"""
@@ -256,9 +311,12 @@ class HabitTrackerWindow(customtkinter.CTkToplevel):
         BtnFrame.pack(pady=10)
 
         def ConfirmDelete():
-            self.HabitManager.DeleteHabit(habit_id)
-            self._LoadHabits()
             ConfirmDialog.destroy()
+            self.Executor.Submit(
+                self.HabitManager.DeleteHabit,
+                habit_id,
+                OnSuccess=lambda _: self._LoadHabits(),
+            )
 
         YesBtn = customtkinter.CTkButton(
             BtnFrame,
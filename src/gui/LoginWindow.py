@@ -1,16 +1,19 @@
 import customtkinter
 from PIL import Image
-from core.Auth import Auth, InvalidCredentialsError
+from core.Auth import InvalidCredentialsError
 from gui.RegistrationWindow import RegistrationWindow
 from gui.MainMenuWindow import MainMenu
+from utils.TaskExecutor import TaskExecutor
 
 
 class LoginWindow(customtkinter.CTkFrame):
-    def __init__(self, parent):
+    def __init__(self, parent, services):
         super().__init__(parent)
 
         self.parent = parent
-        self.auth = Auth()
+        self.Services = services
+        self.auth = services.Auth
+        self.Executor = TaskExecutor(self)
 
         try:
             BackgroundImagePIL = Image.open("assets/BackgroundNormal.png")
@@ -97,27 +100,39 @@ class LoginWindow(customtkinter.CTkFrame):
         username = self.UsernameEntry.get().strip()
         password = self.PasswordEntry.get().strip()
 
-        authenticated = False
-        try:
-            if self.auth.LoginUser(username, password):
-                authenticated = True
-                self.FeedbackLabel.configure(
-                    text="Login Successful", text_color="green"
-                )
-        except InvalidCredentialsError:
+        # bcrypt takes a few hundred ms, check the password on a worker thread so the
+        # window keeps drawing, and ignore further clicks until it answers
+        self.LoginButton.configure(state="disabled")
+        self.FeedbackLabel.configure(text="Logging in...", text_color="white")
+        self.Executor.Submit(
+            self.auth.LoginUser,
+            username,
+            password,
+            OnSuccess=lambda authenticated: self._OnLoginResult(username, authenticated),
+            OnError=self._OnLoginError,
+            Key="login",
+        )
+
+    def _OnLoginResult(self, username, authenticated):
+        if not authenticated:
+            self.LoginButton.configure(state="normal")
+            return
+        self.FeedbackLabel.configure(text="Login Successful", text_color="green")
+        # store for safe use after widget destruction
+        self.logged_in_username = username
+        self.FadeOut()
+
+    def _OnLoginError(self, error):
+        self.LoginButton.configure(state="normal")
+        if isinstance(error, InvalidCredentialsError):
             self.FeedbackLabel.configure(
                 text="Invalid username or password", text_color="red"
             )
-        except Exception as e:
+        else:
             self.FeedbackLabel.configure(
-                text=f"Unexpected error, {str(e)}", text_color="red"
+                text=f"Unexpected error, {str(error)}", text_color="red"
             )
 
-        if authenticated:
-            # store for safe use after widget destruction
-            self.logged_in_username = username
-            self.FadeOut()
-
     def AttemptRegistration(self):
         self.SlideOut()
 
@@ -130,7 +145,7 @@ class LoginWindow(customtkinter.CTkFrame):
         else:
             username = getattr(self, "logged_in_username", "")
             self.destroy()
-            login = MainMenu(self.parent, username)
+            login = MainMenu(self.parent, username, self.Services)
             login.grid(row=0, column=0, sticky="nsew")
             login.FadeIn()
 
@@ -148,7 +163,7 @@ class LoginWindow(customtkinter.CTkFrame):
             self.after(3, self.SlideOut, x + 15)
         else:
             self.destroy()
-            login = RegistrationWindow(self.parent)
+            login = RegistrationWindow(self.parent, self.Services)
             login.place(x=750, y=0)
             login.SlideIn()
 
@@ -1,6 +1,5 @@
 import customtkinter
 from PIL import Image
-from core.TaskManager import TaskManager
 from gui.TaskManagerWindow import TaskManagerWindow
 from gui.HabitTrackerWindow import HabitTrackerWindow
 from gui.FocusTimerWindow import FocusTimerWindow
@@ -10,15 +9,18 @@ from gui.DailyGoalsWindow import DailyGoalsWindow
 from gui.CalendarWindow import CalendarWindow
 from gui.SettingsWindow import SettingsWindow
 from gui.AddTaskWindow import AddTaskWindow
+from utils.TaskExecutor import TaskExecutor
 
 
 class MainMenu(customtkinter.CTkFrame):
-    def __init__(self, parent, username):
+    def __init__(self, parent, username, services):
         super().__init__(parent)
 
         self.parent = parent
         self.username = username
-        self.TaskManager = TaskManager()
+        self.Services = services
+        self.TaskManager = services.TaskManager
+        self.Executor = TaskExecutor(self)
 
         # Color palette - consistent throughout
         self.Colors = {
@@ -111,29 +113,19 @@ class MainMenu(customtkinter.CTkFrame):
         )
         OverviewTitle.place(relx=0.5, rely=0.3, anchor="center")
 
-        # Stats display
-        Total, Completed, Pending = self.TaskManager.CountTasks(self.username)
-        CompletionRate = int((Completed / Total * 100) if Total > 0 else 0)
-
+        # Stats display - filled in once the counts have loaded in the background
         self.OverviewStats = customtkinter.CTkLabel(
             OverviewFrame,
-            text=f"✅ {Completed}/{Total} Completed  •  ⏳ {Pending} Pending  •  📈 {CompletionRate}%",
+            text="⏳ Loading your stats...",
             text_color=self.Colors["Text"],
             font=("Montserrat", 12),
         )
         self.OverviewStats.place(relx=0.5, rely=0.55, anchor="center")
 
         # Quick task dropdown
-        TaskTitles = [
-            Title
-            for _id, Title, _status, _desc in self.TaskManager.GetTasks(self.username)
-        ]
-        if not TaskTitles:
-            TaskTitles = ["No tasks yet - click 'Add Task' to get started!"]
-
         self.TasksDropdown = customtkinter.CTkOptionMenu(
             OverviewFrame,
-            values=TaskTitles,
+            values=["Loading tasks..."],
             fg_color=self.Colors["Secondary"],
             button_color=self.Colors["Accent"],
             button_hover_color=self.Colors["Warning"],
@@ -144,6 +136,9 @@ class MainMenu(customtkinter.CTkFrame):
         )
         self.TasksDropdown.place(relx=0.5, rely=0.82, anchor="center")
 
+        self._RefreshOverview()
+        self._RefreshDropdown()
+
     def _CreateQuickActions(self):
         # Quick actions section - primary task management
         # Button container frame
@@ -356,16 +351,16 @@ class MainMenu(customtkinter.CTkFrame):
         AddTaskWindow(self, self.username, self.TaskManager, OnSuccess)
 
     def OnOpenTaskManager(self):
-        TaskManagerWindow(self, self.username)
+        TaskManagerWindow(self, self.username, self.Services)
 
     def OnOpenHabits(self):
-        HabitTrackerWindow(self, self.username)
+        HabitTrackerWindow(self, self.username, self.Services)
 
     def OnOpenTimer(self):
         FocusTimerWindow(self, self.username)
 
     def OnOpenAnalytics(self):
-        AnalyticsWindow(self, self.username)
+        AnalyticsWindow(self, self.username, self.Services)
 
     def OnOpenNotes(self):
         QuickNotesWindow(self, self.username)
@@ -381,21 +376,47 @@ class MainMenu(customtkinter.CTkFrame):
 
     # ========= Helper Methods =========
     def _RefreshOverview(self):
-        Total, Completed, Pending = self.TaskManager.CountTasks(self.username)
+        # Counted on a worker thread, a newer refresh replaces one still in flight
+        self.Executor.Submit(
+            self.TaskManager.CountTasks,
+            self.username,
+            OnSuccess=self._ShowOverview,
+            OnError=lambda Error: self.OverviewStats.configure(text=f"Couldn't load your stats: {Error}"),
+            Key="overview",
+        )
+
+    def _ShowOverview(self, Counts):
+        Total, Completed, Pending = Counts
         CompletionRate = int((Completed / Total * 100) if Total > 0 else 0)
         self.OverviewStats.configure(
             text=f"✅ {Completed}/{Total} Completed  •  ⏳ {Pending} Pending  •  📈 {CompletionRate}%"
         )
 
     def _RefreshDropdown(self):
+        self.Executor.Submit(
+            self.TaskManager.GetTasks,
+            self.username,
+            OnSuccess=self._ShowDropdown,
+            OnError=self._ShowDropdownError,
+            Key="dropdown",
+        )
+
+    def _ShowDropdown(self, Tasks):
         Titles = [
             Title
-            for _id, Title, _status, _desc in self.TaskManager.GetTasks(self.username) #GetTasks returns a list of (id, title, status, description)
+            for _id, Title, _status, _desc in Tasks #GetTasks returns a list of (id, title, status, description)
         ]
 
         if not Titles:
             Titles = ["No tasks yet - click 'Add Task' to get started!"]
         self.TasksDropdown.configure(values=Titles)
+        if self.TasksDropdown.get() not in Titles:
+            self.TasksDropdown.set(Titles[0])  # replaces the loading placeholder
+
+    def _ShowDropdownError(self, Error):
+        Titles = [f"Couldn't load tasks: {Error}"]
+        self.TasksDropdown.configure(values=Titles)
+        self.TasksDropdown.set(Titles[0])
 
     def _TickClock(self):
         import datetime as _dt
@@ -1,14 +1,16 @@
 import customtkinter
 from PIL import Image
-from core.Auth import Auth
 from gui.MainMenuWindow import MainMenu
+from utils.TaskExecutor import TaskExecutor
 
 
 class RegistrationWindow(customtkinter.CTkFrame):
-    def __init__(self, parent):
+    def __init__(self, parent, services):
         super().__init__(parent)
         self.parent = parent
-        self.Auth = Auth()
+        self.Services = services
+        self.Auth = services.Auth
+        self.Executor = TaskExecutor(self)
 
         try:
             BackgroundImagePIL = Image.open("assets/BackgroundNormal.png")
@@ -179,20 +181,28 @@ class RegistrationWindow(customtkinter.CTkFrame):
         Motivation = int(self.MotivationSlider.get())
         Energy = int(self.EnergySlider.get())
 
-        try:
-            self.Auth.RegisterUser(
-                Username, Password, Concentration, Discipline, Motivation, Energy
-            )
-        except Exception as e:
-            self.FeedbackLabel.configure(
-                text=f"An error has occured, {e}", text_color="red"
-            )
-            return
+        # Hashing the password is slow on purpose, so register on a worker thread
+        self.RegisterButton.configure(state="disabled")
+        self.FeedbackLabel.configure(text="Creating account...", text_color="black")
+        self.Executor.Submit(
+            self.Auth.RegisterUser,
+            Username, Password, Concentration, Discipline, Motivation, Energy,
+            OnSuccess=lambda _: self._OnRegistered(Username),
+            OnError=self._OnRegisterError,
+            Key="register",
+        )
 
+    def _OnRegistered(self, Username):
         self.FeedbackLabel.configure(text="Registration successful", text_color="green")
         self.registered_username = Username
         self.after(1500, self.FadeOut)
 
+    def _OnRegisterError(self, e):
+        self.RegisterButton.configure(state="normal")
+        self.FeedbackLabel.configure(
+            text=f"An error has occured, {e}", text_color="red"
+        )
+
     def FadeOut(self, step=0.05):
         alpha = self.parent.attributes("-alpha")
         if alpha > 0:
@@ -203,7 +213,7 @@ class RegistrationWindow(customtkinter.CTkFrame):
             # Obtain username saved earlier to avoid accessing destroyed widgets
             username = getattr(self, "registered_username", "")
             self.destroy()
-            login = MainMenu(self.parent, username)
+            login = MainMenu(self.parent, username, self.Services)
             login.grid(row=0, column=0, sticky="nsew")
             login.FadeIn()
 
@@ -223,7 +233,7 @@ class RegistrationWindow(customtkinter.CTkFrame):
             self.destroy()
             # Use stored username if available
             username = getattr(self, "registered_username", "")
-            login = MainMenu(self.parent, username)
+            login = MainMenu(self.parent, username, self.Services)
             login.place(x=750, y=0)
             login.SlideIn()
 
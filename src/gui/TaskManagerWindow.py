@@ -1,14 +1,16 @@
 import customtkinter
-from core.TaskManager import TaskManager
 from gui.AddTaskWindow import AddTaskWindow
+from gui.VirtualTaskList import VirtualTaskList
+from utils.TaskExecutor import TaskExecutor
 
 
 class TaskManagerWindow(customtkinter.CTkToplevel):
-    def __init__(self, parent, username):
+    def __init__(self, parent, username, services):
         super().__init__(parent)
 
         self.username = username
-        self.TaskManager = TaskManager()
+        self.TaskManager = services.TaskManager
+        self.Executor = TaskExecutor(self)
 
         # Window configuration
         self.title("Task Manager")
@@ -47,9 +49,17 @@ class TaskManagerWindow(customtkinter.CTkToplevel):
         )
         Title.pack(pady=20)
 
-        # Task list frame
-        self.TaskListFrame = customtkinter.CTkScrollableFrame(
-            self, fg_color="white", corner_radius=10
+        # Task list - only the cards in view are built, pages are fetched as you scroll
+        self.TaskListFrame = VirtualTaskList(
+            self,
+            self.Colors,
+            fetch_page=lambda BeforeID, Limit: self.TaskManager.GetTasksPage(
+                self.username, BeforeID, Limit
+            ),
+            on_complete=self._CompleteTask,
+            on_delete=self._DeleteTask,
+            on_complete_subtask=self._CompleteSubtask,
+            empty_text="No tasks found. Click 'Add New Task' to create one!",
         )
         self.TaskListFrame.pack(fill="both", expand=True, padx=20, pady=20)
 
@@ -94,134 +104,7 @@ class TaskManagerWindow(customtkinter.CTkToplevel):
         CloseBtn.pack(side="right", padx=5)
 
     def _LoadTasks(self):
-        for widget in self.TaskListFrame.winfo_children(): #clearing all current tasks
-            widget.destroy()
-
-        Tasks = self.TaskManager.GetTasks(self.username) # retrieving all CURRENT tasks for the user
-
-        if not Tasks:
-            NoTasksLabel = customtkinter.CTkLabel(
-                self.TaskListFrame,
-                text="No tasks found. Click 'Add New Task' to create one!",
-                text_color=self.Colors["TextDark"],
-                font=("Montserrat", 14),
-            )
-            NoTasksLabel.pack(pady=50)
-            return #important to return here as otherwise the code will continue to run and create more tasks which don't exist
-
-        for TaskID, TaskTitle, TaskStatus, TaskDesc in Tasks:
-            self._CreateTaskCard(TaskID, TaskTitle, TaskStatus, TaskDesc)
-
-    def _CreateTaskCard(self, TaskID, TaskTitle, TaskStatus, TaskDesc):
-        # Get subtasks for this task
-        Subtasks = self.TaskManager.GetSubtasks(TaskID)
-
-        # Main task card
-        TaskCard = customtkinter.CTkFrame(
-            self.TaskListFrame,
-            fg_color=self.Colors["Primary"]
-            if TaskStatus == "pending"
-            else self.Colors["Success"],
-            corner_radius=10,
-        )
-        TaskCard.pack(fill="x", padx=10, pady=10)
-
-        # Task header frame
-        TaskHeaderFrame = customtkinter.CTkFrame(TaskCard, fg_color="transparent")
-        TaskHeaderFrame.pack(fill="x", padx=10, pady=10)
-
-        # Task status icon and title
-        StatusIcon = "✓" if TaskStatus == "completed" else "○"
-        TaskLabel = customtkinter.CTkLabel(
-            TaskHeaderFrame,
-            text=f"{StatusIcon} {TaskTitle}",
-            text_color=self.Colors["Text"],
-            font=("Montserrat", 15, "bold"),
-            anchor="w",
-        )
-        TaskLabel.pack(side="left", padx=5, fill="x", expand=True)
-
-        # Task buttons
-        if TaskStatus == "pending":
-            CompleteTaskBtn = customtkinter.CTkButton(
-                TaskHeaderFrame,
-                text="✓ Complete",
-                fg_color=self.Colors["Success"],
-                hover_color="#048A5E",
-                text_color=self.Colors["Text"],
-                font=("Montserrat", 10, "bold"),
-                width=90,
-                height=30,
-                command=lambda: self._CompleteTask(TaskID),
-            )
-            CompleteTaskBtn.pack(side="right", padx=5)
-
-        DeleteBtn = customtkinter.CTkButton(
-            TaskHeaderFrame,
-            text="🗑️ Delete",
-            fg_color=self.Colors["Accent"],
-            hover_color="#D97706",
-            text_color=self.Colors["Text"],
-            font=("Montserrat", 10, "bold"),
-            width=80,
-            height=30,
-            command=lambda: self._DeleteTask(TaskID),
-        )
-        DeleteBtn.pack(side="right", padx=5)
-
-        # Description if exists
-        if TaskDesc:
-            DescLabel = customtkinter.CTkLabel(
-                TaskCard,
-                text=f"📝 {TaskDesc}",
-                text_color=self.Colors["Text"],
-                font=("Montserrat", 11),
-                anchor="w",
-            )
-            DescLabel.pack(anchor="w", padx=15, pady=(0, 5))
-
-        if Subtasks:
-            SubtasksFrame = customtkinter.CTkFrame(
-                TaskCard, fg_color=self.Colors["Dark"], corner_radius=8
-            )
-            SubtasksFrame.pack(fill="x", padx=15, pady=(5, 10))
-
-            for SubtaskID, SubtaskTitle, SubtaskStatus in Subtasks:
-                self._CreateSubtaskItem(
-                    SubtasksFrame, SubtaskID, SubtaskTitle, SubtaskStatus, TaskStatus
-                )
-
-    def _CreateSubtaskItem(
-        self, parent, SubtaskID, SubtaskTitle, SubtaskStatus, ParentTaskStatus
-    ):
-        SubtaskFrame = customtkinter.CTkFrame(parent, fg_color="transparent")
-        SubtaskFrame.pack(fill="x", padx=10, pady=5)
-
-        # Subtask checkbox or icon
-        StatusIcon = "✓" if SubtaskStatus == "completed" else "☐"
-
-        SubtaskLabel = customtkinter.CTkLabel(
-            SubtaskFrame,
-            text=f"  {StatusIcon} {SubtaskTitle}",
-            text_color=self.Colors["Text"],
-            font=("Montserrat", 12),
-            anchor="w",
-        )
-        SubtaskLabel.pack(side="left", padx=5, fill="x", expand=True)
-
-        # Only show complete button if subtask is pending and parent task is pending
-        if SubtaskStatus == "pending" and ParentTaskStatus == "pending":
-            CompleteBtn = customtkinter.CTkButton(
-                SubtaskFrame,
-                text="✓",
-                fg_color=self.Colors["Success"],
-                hover_color="#048A5E",
-                text_color=self.Colors["Text"],
-                width=30,
-                height=25,
-                command=lambda: self._CompleteSubtask(SubtaskID),
-            )
-            CompleteBtn.pack(side="right", padx=5)
+        self.TaskListFrame.Reload() # re-fetches the first page and rebinds the visible cards
 
     def _AddTask(self):
         AddTaskWindow(self, self.username, self.TaskManager, self._LoadTasks)
@@ -246,9 +129,12 @@ class TaskManagerWindow(customtkinter.CTkToplevel):
         BtnFrame.pack(pady=10)
 
         def ConfirmDelete():
-            self.TaskManager.DeleteTask(TaskID)
-            self._LoadTasks()
             ConfirmDialog.destroy()
+            self.Executor.Submit(
+                self.TaskManager.DeleteTask,
+                TaskID,
+                OnSuccess=lambda _: self._LoadTasks(),
+            )
 
         YesBtn = customtkinter.CTkButton(
             BtnFrame,
@@ -273,9 +159,15 @@ class TaskManagerWindow(customtkinter.CTkToplevel):
         NoBtn.pack(side="left", padx=10)
 
     def _CompleteTask(self, TaskID):
-        self.TaskManager.CompleteTask(TaskID)
-        self._LoadTasks()
+        self.Executor.Submit(
+            self.TaskManager.CompleteTask,
+            TaskID,
+            OnSuccess=lambda _: self._LoadTasks(),
+        )
 
     def _CompleteSubtask(self, SubtaskID):
-        self.TaskManager.CompleteSubtask(SubtaskID)
-        self._LoadTasks()
+        self.Executor.Submit(
+            self.TaskManager.CompleteSubtask,
+            SubtaskID,
+            OnSuccess=lambda _: self._LoadTasks(),
+        )
@@ -0,0 +1,375 @@
+import bisect
+import customtkinter
+import tkinter
+from utils.TaskExecutor import TaskExecutor
+
+
+class _SubtaskRow(customtkinter.CTkFrame):
+    """A single subtask line inside a task card, reused between tasks."""
+
+    def __init__(self, parent, colors, on_complete):
+        super().__init__(parent, fg_color="transparent")
+        self.Colors = colors
+        self.OnComplete = on_complete
+        self.SubtaskID = None
+
+        self.Label = customtkinter.CTkLabel(
+            self,
+            text="",
+            text_color=self.Colors["Text"],
+            font=("Montserrat", 12),
+            anchor="w",
+        )
+        self.Label.pack(side="left", padx=5, fill="x", expand=True)
+
+        self.CompleteBtn = customtkinter.CTkButton(
+            self,
+            text="✓",
+            fg_color=self.Colors["Success"],
+            hover_color="#048A5E",
+            text_color=self.Colors["Text"],
+            width=30,
+            height=25,
+            command=lambda: self.OnComplete(self.SubtaskID),
+        )
+
+    def Bind(self, SubtaskID, SubtaskTitle, SubtaskStatus, ParentTaskStatus):
+        self.SubtaskID = SubtaskID
+        StatusIcon = "✓" if SubtaskStatus == "completed" else "☐"
+        self.Label.configure(text=f"  {StatusIcon} {SubtaskTitle}")
+
+        # Only show complete button if subtask is pending and parent task is pending
+        if SubtaskStatus == "pending" and ParentTaskStatus == "pending":
+            self.CompleteBtn.pack(side="right", padx=5)
+        else:
+            self.CompleteBtn.pack_forget()
+
+
+class _TaskRow(customtkinter.CTkFrame):
+    """A task card that can be re-bound to a different task when it scrolls out of view."""
+
+    def __init__(self, parent, colors, on_complete, on_delete, on_complete_subtask):
+        super().__init__(parent, fg_color=colors["Primary"], corner_radius=10)
+        self.Colors = colors
+        self.OnCompleteSubtask = on_complete_subtask
+        self.TaskID = None
+        self.SubtaskRows = []
+
+        self.HeaderFrame = customtkinter.CTkFrame(self, fg_color="transparent")
+        self.HeaderFrame.pack(fill="x", padx=10, pady=10)
+
+        self.TitleLabel = customtkinter.CTkLabel(
+            self.HeaderFrame,
+            text="",
+            text_color=self.Colors["Text"],
+            font=("Montserrat", 15, "bold"),
+            anchor="w",
+        )
+        self.TitleLabel.pack(side="left", padx=5, fill="x", expand=True)
+
+        self.CompleteBtn = customtkinter.CTkButton(
+            self.HeaderFrame,
+            text="✓ Complete",
+            fg_color=self.Colors["Success"],
+            hover_color="#048A5E",
+            text_color=self.Colors["Text"],
+            font=("Montserrat", 10, "bold"),
+            width=90,
+            height=30,
+            command=lambda: on_complete(self.TaskID),
+        )
+
+        self.DeleteBtn = customtkinter.CTkButton(
+            self.HeaderFrame,
+            text="🗑️ Delete",
+            fg_color=self.Colors["Accent"],
+            hover_color="#D97706",
+            text_color=self.Colors["Text"],
+            font=("Montserrat", 10, "bold"),
+            width=80,
+            height=30,
+            command=lambda: on_delete(self.TaskID),
+        )
+        self.DeleteBtn.pack(side="right", padx=5)
+
+        self.DescLabel = customtkinter.CTkLabel(
+            self,
+            text="",
+            text_color=self.Colors["Text"],
+            font=("Montserrat", 11),
+            anchor="w",
+        )
+
+        self.SubtasksFrame = customtkinter.CTkFrame(
+            self, fg_color=self.Colors["Dark"], corner_radius=8
+        )
+
+    def Bind(self, Task):
+        TaskID, TaskTitle, TaskStatus, TaskDesc, Subtasks = Task
+        self.TaskID = TaskID
+
+        self.configure(
+            fg_color=self.Colors["Primary"]
+            if TaskStatus == "pending"
+            else self.Colors["Success"]
+        )
+        StatusIcon = "✓" if TaskStatus == "completed" else "○"
+        self.TitleLabel.configure(text=f"{StatusIcon} {TaskTitle}")
+
+        if TaskStatus == "pending":
+            # before= keeps it to the right of the delete button, as in the original layout
+            self.CompleteBtn.pack(side="right", padx=5, before=self.DeleteBtn)
+        else:
+            self.CompleteBtn.pack_forget()
+
+        if TaskDesc:
+            self.DescLabel.configure(text=f"📝 {TaskDesc}")
+            self.DescLabel.pack(anchor="w", padx=15, pady=(0, 5), after=self.HeaderFrame)
+        else:
+            self.DescLabel.pack_forget()
+
+        if Subtasks:
+            self.SubtasksFrame.pack(fill="x", padx=15, pady=(5, 10))
+            while len(self.SubtaskRows) < len(Subtasks):
+                self.SubtaskRows.append(
+                    _SubtaskRow(self.SubtasksFrame, self.Colors, self.OnCompleteSubtask)
+                )
+            for Index, Row in enumerate(self.SubtaskRows):
+                if Index < len(Subtasks):
+                    Row.Bind(*Subtasks[Index], TaskStatus)
+                    Row.pack(fill="x", padx=10, pady=5)
+                else:
+                    Row.pack_forget()
+        else:
+            self.SubtasksFrame.pack_forget()
+
+
+class VirtualTaskList(customtkinter.CTkFrame):
+    """
+    Scrollable task list that only builds cards for the rows in view (plus a small
+    buffer) and recycles them while scrolling. Tasks are pulled in pages through
+    fetch_page(before_id, limit), which should return (id, title, status,
+    description, subtasks) tuples newest first, e.g. TaskManager.GetTasksPage.
+    Pages are fetched on a worker thread, so fetch_page must not touch widgets.
+    """
+
+    BUFFER_ROWS = 3
+    PAGE_SIZE = 50
+    WHEEL_STEP = 60
+
+    # Estimated card heights in pixels, used to lay out rows without building them
+    BASE_HEIGHT = 72
+    DESC_HEIGHT = 30
+    SUBTASK_FRAME_HEIGHT = 25
+    SUBTASK_HEIGHT = 38
+    ROW_GAP = 20
+
+    def __init__(self, parent, colors, fetch_page, on_complete, on_delete,
+                 on_complete_subtask, empty_text="No tasks found."):
+        super().__init__(parent, fg_color="white", corner_radius=10)
+        self.Colors = colors
+        self.FetchPage = fetch_page
+        self.EmptyText = empty_text
+        self.Executor = TaskExecutor(self)
+        self.OnComplete = on_complete
+        self.OnDelete = on_delete
+        self.OnCompleteSubtask = on_complete_subtask
+
+        self.Tasks = []
+        self.RowTops = []  # y offset of each loaded task
+        self.TotalHeight = 0
+        self.Offset = 0
+        self.HasMore = True
+        self.Loading = False  # a page fetch is in flight
+        self.Loaded = False  # the first page has arrived
+        self.RestoreOffset = None  # scroll position to return to once a reload has caught up
+
+        self.ActiveRows = {}  # task index -> _TaskRow currently placed
+        self.FreeRows = []
+
+        self.Viewport = customtkinter.CTkFrame(self, fg_color="white", corner_radius=0)
+        self.Viewport.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=10)
+
+        self.Scrollbar = customtkinter.CTkScrollbar(self, command=self._OnScrollbar)
+        self.Scrollbar.pack(side="right", fill="y", padx=5, pady=10)
+
+        self.EmptyLabel = customtkinter.CTkLabel(
+            self.Viewport,
+            text=empty_text,
+            text_color=self.Colors["TextDark"],
+            font=("Montserrat", 14),
+        )
+
+        self.Viewport.bind("<Configure>", lambda e: self._Render())
+
+        # The wheel is bound to a bind tag that only this list's widgets carry, rather
+        # than with bind_all, so it never fires for other widgets and goes away with the list
+        self.WheelTag = f"VirtualTaskListWheel{id(self)}"
+        for Sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_class(self.WheelTag, Sequence, self._OnMouseWheel)
+        self._TagWheel(self)
+        # tkinter's own bind, CTk widgets redirect bind() to their inner canvas
+        tkinter.Misc.bind(self, "<Destroy>", self._OnDestroy, add="+")
+
+    # ========= Data =========
+    def Reload(self):
+        """
+        Fetch the newest page again, keeping the scroll position. The loaded rows stay
+        on screen until it arrives.
+        """
+        self.Loading = False  # the Key below supersedes any fetch still running
+        if self.RestoreOffset is None:
+            self.RestoreOffset = self.Offset
+        self._RequestPage(Reset=True)
+
+    def _RequestPage(self, Reset=False):
+        if not Reset and (self.Loading or not self.HasMore):
+            return
+        self.Loading = True
+        BeforeID = self.Tasks[-1][0] if self.Tasks and not Reset else None
+        self.Executor.Submit(
+            self.FetchPage,
+            BeforeID,
+            self.PAGE_SIZE,
+            OnSuccess=lambda Page: self._OnPage(Page, Reset),
+            OnError=self._OnPageError,
+            Key="page",
+        )
+
+    def _OnPage(self, Page, Reset):
+        self.Loading = False
+        self.Loaded = True
+        if Reset:
+            self.Tasks = []
+            self.RowTops = []
+            self.TotalHeight = 0
+            for Row in self.ActiveRows.values():
+                Row.place_forget()
+                self.FreeRows.append(Row)
+            self.ActiveRows.clear()
+        self.HasMore = len(Page) >= self.PAGE_SIZE
+
+        for Task in Page:
+            self.RowTops.append(self.TotalHeight)
+            self.TotalHeight += self._EstimateHeight(Task)
+            self.Tasks.append(Task)
+
+        if self.RestoreOffset is not None:
+            ViewHeight = max(1, self.Viewport.winfo_height())
+            if not self.HasMore or self.TotalHeight >= self.RestoreOffset + ViewHeight:
+                self.Offset, self.RestoreOffset = self.RestoreOffset, None
+        self._Render()
+
+    def _OnPageError(self, Error):
+        self.Loading = False
+        self.HasMore = False  # don't keep retrying from _Render, Reload starts over
+        if not self.Tasks:
+            self.EmptyLabel.configure(text=f"Couldn't load tasks: {Error}")
+            self.EmptyLabel.pack(pady=50)
+
+    def _EstimateHeight(self, Task):
+        _TaskID, _Title, _Status, TaskDesc, Subtasks = Task
+        Height = self.BASE_HEIGHT
+        if TaskDesc:
+            Height += self.DESC_HEIGHT
+        if Subtasks:
+            Height += self.SUBTASK_FRAME_HEIGHT + self.SUBTASK_HEIGHT * len(Subtasks)
+        return Height + self.ROW_GAP
+
+    # ========= Rendering =========
+    def _Render(self):
+        ViewHeight = max(1, self.Viewport.winfo_height())
+
+        # Pull another page when the viewport (plus buffer) reaches past what's loaded,
+        # _OnPage renders again once it arrives
+        Wanted = self.Offset if self.RestoreOffset is None else self.RestoreOffset
+        if self.HasMore and Wanted + ViewHeight * 2 >= self.TotalHeight:
+            self._RequestPage()
+
+        if not self.Tasks:
+            self.EmptyLabel.configure(text=self.EmptyText if self.Loaded else "⏳ Loading tasks...")
+            self.EmptyLabel.pack(pady=50)
+            self.Scrollbar.set(0, 1)
+            return
+        self.EmptyLabel.pack_forget()
+
+        self.Offset = max(0, min(self.Offset, self.TotalHeight - ViewHeight))
+
+        First = max(0, bisect.bisect_right(self.RowTops, self.Offset) - 1 - self.BUFFER_ROWS)
+        Last = min(
+            len(self.Tasks),
+            bisect.bisect_right(self.RowTops, self.Offset + ViewHeight) + self.BUFFER_ROWS,
+        )
+        Visible = range(First, Last)
+
+        # Recycle rows that scrolled out of range
+        for Index in [Index for Index in self.ActiveRows if Index not in Visible]:
+            Row = self.ActiveRows.pop(Index)
+            Row.place_forget()
+            self.FreeRows.append(Row)
+
+        for Index in Visible:
+            Row = self.ActiveRows.get(Index)
+            if Row is None:
+                Row = self.FreeRows.pop() if self.FreeRows else self._CreateRow()
+                Row.Bind(self.Tasks[Index])
+                self._TagWheel(Row)  # Bind may have added subtask rows
+                self.ActiveRows[Index] = Row
+            Row.place(
+                x=0,
+                y=self.RowTops[Index] - self.Offset,
+                relwidth=1.0,
+                height=self._EstimateHeight(self.Tasks[Index]) - self.ROW_GAP,
+            )
+
+        if self.TotalHeight > 0:
+            self.Scrollbar.set(
+                self.Offset / self.TotalHeight,
+                min(1.0, (self.Offset + ViewHeight) / self.TotalHeight),
+            )
+
+    def _CreateRow(self):
+        return _TaskRow(
+            self.Viewport,
+            self.Colors,
+            self.OnComplete,
+            self.OnDelete,
+            self.OnCompleteSubtask,
+        )
+
+    # ========= Scrolling =========
+    def _ScrollTo(self, Offset):
+        self.RestoreOffset = None  # scrolling takes over from a pending restore
+        self.Offset = max(0, Offset)
+        self._Render()
+
+    def _OnScrollbar(self, *Args):
+        ViewHeight = max(1, self.Viewport.winfo_height())
+        if Args[0] == "moveto":
+            self._ScrollTo(float(Args[1]) * self.TotalHeight)
+        elif Args[0] == "scroll":
+            Step = ViewHeight if Args[2] == "pages" else self.WHEEL_STEP
+            self._ScrollTo(self.Offset + int(Args[1]) * Step)
+
+    def _TagWheel(self, Widget):
+        "Give Widget and everything inside it the wheel bind tag."
+        Tags = Widget.bindtags()
+        if self.WheelTag not in Tags:
+            Widget.bindtags((self.WheelTag,) + Tags)
+        for Child in Widget.winfo_children():
+            self._TagWheel(Child)
+
+    def _OnDestroy(self, event):
+        # <Destroy> also fires for every child widget
+        if event.widget is self:
+            for Sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.unbind_class(self.WheelTag, Sequence)
+
+    def _OnMouseWheel(self, event):
+        if getattr(event, "num", None) == 4:
+            Direction = -1
+        elif getattr(event, "num", None) == 5:
+            Direction = 1
+        else:
+            Direction = -1 if event.delta > 0 else 1
+        self._ScrollTo(self.Offset + Direction * self.WHEEL_STEP)
@@ -1,25 +1,34 @@
 import customtkinter
+from core.ServiceContainer import GetServices
 from gui.EntryWindow import EntryWindow
+from utils.TaskExecutor import GetWorkerPool
 from winotify import Notification
 import os
 
 
-base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-icon_path = os.path.join(base_dir, "assets", "QubeLogo.ico")
-    
-notification = Notification(
-    app_id="OrganiseU",
-    title="Welcome to OrganiseU!",
-    msg="Hope you enjoy your time here!",
-    duration="short",
-    icon=icon_path)
+def InitialiseApp():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    icon_path = os.path.join(base_dir, "assets", "QubeLogo.ico")
 
-notification.show()
+    #* Shown here rather than at import - chart render processes re-import this module
+    notification = Notification(
+        app_id="OrganiseU",
+        title="Welcome to OrganiseU!",
+        msg="Hope you enjoy your time here!",
+        duration="short",
+        icon=icon_path)
 
+    notification.show()
 
+    # The managers every window shares. Creating them brings the database schema up
+    # to date once, so opening a window never runs any DDL
+    services = GetServices()
 
+    # Start the chart render processes in the background so the dashboard opens warm
+    services.ChartRenderService.Warmup()
+    # Likewise time bcrypt now, so the first login doesn't pay for the calibration
+    GetWorkerPool().submit(lambda: services.Auth.BcryptCost)
 
-def InitialiseApp():
     app = customtkinter.CTk()
     app.title("OrganiseU")
     app.geometry("750x750")
@@ -27,12 +36,10 @@ def InitialiseApp():
     app.grid_rowconfigure(0, weight=1) 
     app.grid_columnconfigure(0, weight=1)
 
-    entry = EntryWindow(app)
+    entry = EntryWindow(app, services)
     entry.grid(row=0,column=0, sticky="nsew")
    
 
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    icon_path = os.path.join(base_dir, "assets", "QubeLogo.ico")
     app.iconbitmap(icon_path)
     
     app.mainloop()
@@ -1,10 +1,240 @@
+import atexit
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 
+DEFAULT_DB_PATH = "src/core/UsersDatabase.db"
+
+#* PRAGMA profiles applied to every new connection. WAL lets readers (e.g. the
+#* analytics dashboard) keep going while the habit tracker is writing.
+CONNECTION_PROFILES = {
+    "durable": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "FULL"),
+        ("cache_size", -8000),  # negative values are KiB, so ~8MB
+        ("temp_store", "MEMORY"),
+        ("foreign_keys", "ON"),
+        ("busy_timeout", 5000),
+    ],
+    "balanced": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("mmap_size", 64 * 1024 * 1024),
+        ("cache_size", -16000),
+        ("temp_store", "MEMORY"),
+        ("foreign_keys", "ON"),
+        ("busy_timeout", 5000),
+    ],
+    "fast": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "OFF"),
+        ("mmap_size", 256 * 1024 * 1024),
+        ("cache_size", -64000),
+        ("temp_store", "MEMORY"),
+        ("foreign_keys", "ON"),
+        ("busy_timeout", 5000),
+    ],
+}
+
+_ActiveProfile = "balanced"
+_ConnectionHooks = []
+
+
+def ApplyConnectionProfile(Conn, Profile):
+    "Run the PRAGMAs of a named profile on a connection."
+    for Pragma, Value in CONNECTION_PROFILES[Profile]:
+        Conn.execute(f"PRAGMA {Pragma} = {Value}")
+
+
+def SetConnectionProfile(Profile):
+    """
+    Select the PRAGMA profile (durable/balanced/fast) for new connections, or None
+    for SQLite's defaults. Pooled connections are closed so the change applies at once.
+    """
+    global _ActiveProfile
+    if Profile is not None and Profile not in CONNECTION_PROFILES:
+        raise ValueError(f"Unknown connection profile: {Profile}")
+    _ActiveProfile = Profile
+    CloseAllConnections()
+
+
+def GetConnectionProfile():
+    return _ActiveProfile
+
+
+def AddConnectionHook(Hook):
+    "Register Hook(conn) to run on every new connection after the profile is applied."
+    if Hook not in _ConnectionHooks:
+        _ConnectionHooks.append(Hook)
+
+
+def RemoveConnectionHook(Hook):
+    if Hook in _ConnectionHooks:
+        _ConnectionHooks.remove(Hook)
+
+
+def _SetupConnection(Conn):
+    if _ActiveProfile is not None:
+        ApplyConnectionProfile(Conn, _ActiveProfile)
+    for Hook in _ConnectionHooks:
+        Hook(Conn)
+
+
+class ConnectionPool:
+    """
+    Keeps one long-lived sqlite3 connection per thread for a single database file.
+    Connections are health checked when they have been idle for a while and are
+    closed once they exceed IdleTimeout or the pool grows past MaxSize.
+    MaxSize is a soft limit: every thread needs its own connection, so Acquire never
+    blocks or refuses one. Only idle connections are closed to get back under it.
+    """
+
+    def __init__(self, DBPath, MaxSize=8, IdleTimeout=300.0, HealthCheckAfter=30.0):
+        self.DBPath = DBPath
+        self.MaxSize = MaxSize
+        self.IdleTimeout = IdleTimeout
+        self.HealthCheckAfter = HealthCheckAfter
+        self._Lock = threading.Lock()
+        # thread id -> {"conn", "last_used", "depth", "pooled"}. depth counts the nested
+        # checkouts of conn on that thread, pooled is cleared by CloseAll
+        self._Connections = {}
+
+    def _Connect(self):
+        #* check_same_thread is off so idle connections can be evicted from any thread,
+        #* but a connection is only ever handed out to the thread that owns it
+        Conn = sqlite3.connect(self.DBPath, check_same_thread=False)
+        _SetupConnection(Conn)
+        return Conn
+
+    def _IsHealthy(self, Conn):
+        try:
+            Conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _Close(self, Conn):
+        try:
+            Conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _EvictIdle(self, Now):
+        # * Must be called with self._Lock held. Returns connections to close.
+        Evicted = []
+        for ThreadID, Entry in list(self._Connections.items()):
+            if Entry["depth"] == 0 and Now - Entry["last_used"] > self.IdleTimeout:
+                Evicted.append(self._Connections.pop(ThreadID)["conn"])
+
+        # Over capacity - drop the least recently used idle connections first
+        Idle = sorted(
+            (Item for Item in self._Connections.items() if Item[1]["depth"] == 0),
+            key=lambda Item: Item[1]["last_used"],
+        )
+        while len(self._Connections) > self.MaxSize and Idle:
+            ThreadID, Entry = Idle.pop(0)
+            Evicted.append(self._Connections.pop(ThreadID)["conn"])
+        return Evicted
+
+    def Acquire(self):
+        ThreadID = threading.get_ident()
+        Now = time.monotonic()
+        with self._Lock:
+            Evicted = self._EvictIdle(Now)
+            Entry = self._Connections.get(ThreadID)
+            if Entry is not None:
+                Entry["depth"] += 1  # checked out, so it can no longer be evicted
+        for Conn in Evicted:
+            self._Close(Conn)
+
+        if Entry is None:
+            Entry = {"conn": self._Connect(), "last_used": Now, "depth": 1, "pooled": True}
+            with self._Lock:
+                self._Connections[ThreadID] = Entry
+        elif Entry["depth"] == 1 and Now - Entry["last_used"] > self.HealthCheckAfter:
+            if not self._IsHealthy(Entry["conn"]):
+                self._Close(Entry["conn"])
+                Entry["conn"] = self._Connect()
+
+        return Entry["conn"]
+
+    def Release(self, Conn):
+        ThreadID = threading.get_ident()
+        with self._Lock:
+            Entry = self._Connections.get(ThreadID)
+        if Entry is None or Entry["conn"] is not Conn:
+            # Not checked out through this pool, nothing to hand back
+            self._Close(Conn)
+            return
+
+        #? Mirrors the old close() behaviour - uncommitted work is discarded. Done while
+        #? still checked out, so another thread can't evict the connection meanwhile
+        if Entry["depth"] == 1 and Conn.in_transaction:
+            Conn.rollback()
+
+        with self._Lock:
+            Entry["depth"] -= 1
+            Closing = Entry["depth"] == 0 and not Entry["pooled"]
+            if Closing:
+                del self._Connections[ThreadID]
+            elif Entry["depth"] == 0:
+                Entry["last_used"] = time.monotonic()
+        if Closing:
+            self._Close(Conn)
+
+    def CloseAll(self):
+        """
+        Close the idle connections and empty the pool. A connection that is checked out
+        (possibly several times over, by nested GetDBConnection blocks) stays in use by its
+        thread and is closed when its outermost checkout is released.
+        """
+        with self._Lock:
+            Idle = []
+            for ThreadID, Entry in list(self._Connections.items()):
+                if Entry["depth"] == 0:
+                    Idle.append(self._Connections.pop(ThreadID)["conn"])
+                else:
+                    Entry["pooled"] = False
+        for Conn in Idle:
+            self._Close(Conn)
+
+    def Size(self):
+        with self._Lock:
+            return len(self._Connections)
+
+
+_Pools = {}
+_PoolsLock = threading.Lock()
+
+
+def GetConnectionPool(DBPath=DEFAULT_DB_PATH):
+    "Return the shared pool for DBPath, creating it on first use."
+    with _PoolsLock:
+        Pool = _Pools.get(DBPath)
+        if Pool is None:
+            Pool = ConnectionPool(DBPath)
+            _Pools[DBPath] = Pool
+        return Pool
+
+
+def CloseAllConnections():
+    # The pools themselves are kept: a thread still inside a GetDBConnection block must
+    # get its checked out connection back from nested ones, not a new connection
+    with _PoolsLock:
+        Pools = list(_Pools.values())
+    for Pool in Pools:
+        Pool.CloseAll()
+
+
+atexit.register(CloseAllConnections)
+
+
 @contextmanager
-def GetDBConnection(DBPath="src/core/UsersDatabase.db"): #* if DBPath is not passed, it will default to the UsersDatabase.db
-    conn = sqlite3.connect(DBPath)
+def GetDBConnection(DBPath=DEFAULT_DB_PATH): #* if DBPath is not passed, it will default to the UsersDatabase.db
+    Pool = GetConnectionPool(DBPath)
+    conn = Pool.Acquire()
     try:
         yield conn
     finally:
-        conn.close()
+        Pool.Release(conn)
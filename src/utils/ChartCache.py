@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from PIL import Image
+
+#* Content-addressed cache of rendered charts. The key is a hash of everything that
+#* affects the pixels (chart kind, data, labels and the theme), so switching back to a
+#* time range whose data hasn't changed gets the same image back without rendering.
+
+
+def ChartKey(kind, args, style):
+    "sha256 of a chart's kind, arguments and style, as a hex string."
+    payload = json.dumps([kind, args, style], default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _ImageBytes(image):
+    return image.width * image.height * len(image.getbands())
+
+
+class ChartCache:
+    """
+    LRU of rendered PIL images capped at MaxBytes of pixel data, with an optional
+    on-disk PNG tier in DiskDir capped at DiskMaxBytes. Images handed out are shared,
+    so callers must not modify them.
+    """
+
+    def __init__(self, MaxBytes=64 * 1024 * 1024, DiskDir=None, DiskMaxBytes=256 * 1024 * 1024):
+        self.MaxBytes = MaxBytes
+        self.DiskDir = DiskDir
+        self.DiskMaxBytes = DiskMaxBytes
+        self._Images = OrderedDict()  # key -> (image, bytes)
+        self._Bytes = 0
+        self._Lock = threading.Lock()
+        self.MemoryHits = 0
+        self.DiskHits = 0
+        self.Misses = 0
+        if DiskDir:
+            os.makedirs(DiskDir, exist_ok=True)
+
+    def Get(self, Key):
+        "Return the cached image for Key, or None."
+        with self._Lock:
+            Entry = self._Images.get(Key)
+            if Entry is not None:
+                self._Images.move_to_end(Key)
+                self.MemoryHits += 1
+                return Entry[0]
+
+        Chart = self._ReadDisk(Key)
+        with self._Lock:
+            if Chart is None:
+                self.Misses += 1
+                return None
+            self.DiskHits += 1
+            self._Store(Key, Chart)
+        return Chart
+
+    def Put(self, Key, Chart):
+        with self._Lock:
+            self._Store(Key, Chart)
+        self._WriteDisk(Key, Chart)
+
+    def Clear(self):
+        with self._Lock:
+            self._Images.clear()
+            self._Bytes = 0
+
+    def GetStats(self):
+        with self._Lock:
+            Hits = self.MemoryHits + self.DiskHits
+            Total = Hits + self.Misses
+            return {
+                "memory_hits": self.MemoryHits,
+                "disk_hits": self.DiskHits,
+                "misses": self.Misses,
+                "hit_ratio": round(Hits / Total * 100, 1) if Total else 0,
+                "entries": len(self._Images),
+                "bytes": self._Bytes,
+            }
+
+    def _Store(self, Key, Chart):
+        # Must be called with self._Lock held
+        Size = _ImageBytes(Chart)
+        if Size > self.MaxBytes:
+            return  # would evict everything else and still not fit
+        Old = self._Images.pop(Key, None)
+        if Old is not None:
+            self._Bytes -= Old[1]
+        self._Images[Key] = (Chart, Size)
+        self._Bytes += Size
+        while self._Bytes > self.MaxBytes:
+            _Key, (_Image, Evicted) = self._Images.popitem(last=False)
+            self._Bytes -= Evicted
+
+    # ========= Disk tier =========
+    def _DiskPath(self, Key):
+        return os.path.join(self.DiskDir, f"{Key}.png")
+
+    def _ReadDisk(self, Key):
+        if not self.DiskDir:
+            return None
+        Path = self._DiskPath(Key)
+        try:
+            with Image.open(Path) as File:
+                Loaded = File.copy()
+            os.utime(Path)  # mtime doubles as the LRU order on disk
+            return Loaded
+        except (OSError, ValueError):
+            return None
+
+    def _WriteDisk(self, Key, Chart):
+        if not self.DiskDir:
+            return
+        Path = self._DiskPath(Key)
+        Temp = f"{Path}.{threading.get_ident()}.tmp"
+        try:
+            Chart.save(Temp, format="PNG")
+            os.replace(Temp, Path)  # never leave a half written PNG under the real name
+        except OSError:
+            return
+        self._TrimDisk()
+
+    def _TrimDisk(self):
+        try:
+            Entries = [
+                Entry for Entry in os.scandir(self.DiskDir)
+                if Entry.is_file() and Entry.name.endswith(".png")
+            ]
+            Files = sorted(
+                ((Entry.stat().st_mtime, Entry.stat().st_size, Entry.path) for Entry in Entries)
+            )
+        except OSError:
+            return
+        Total = sum(Size for _, Size, _ in Files)
+        for _, Size, Path in Files:
+            if Total <= self.DiskMaxBytes:
+                break
+            try:
+                os.remove(Path)
+                Total -= Size
+            except OSError:
+                pass
@@ -1,9 +1,14 @@
 import matplotlib
 matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import os
-import tempfile
+import matplotlib.style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+import threading
+import numpy as np
 from datetime import datetime
+from PIL import Image
+from utils.Downsampling import lttb_indices
 
 
 
@@ -17,128 +22,270 @@ COLORS = {
     "Warning": "#F18F01",
 }
 
+# Line charts are downsampled to this many points per horizontal pixel of the figure,
+# None plots every point
+POINTS_PER_PIXEL = 0.5
+# Longer series are drawn without point markers, they would just overlap
+MAX_MARKERS = 90
+# Upper bound on the number of date labels along the x axis
+MAX_DATE_TICKS = 12
+
+# Part of every chart's cache key (see ChartCache), bump it when the look of the charts
+# changes so previously cached images aren't reused
+STYLE_VERSION = 2
+
+
+def get_style_key():
+    return [STYLE_VERSION, COLORS, POINTS_PER_PIXEL, MAX_MARKERS, MAX_DATE_TICKS]
+
 
 def _setup_style():
-    plt.style.use('dark_background')
-    plt.rcParams['figure.facecolor'] = COLORS["Dark"]
-    plt.rcParams['axes.facecolor'] = COLORS["Dark"]
-    plt.rcParams['axes.edgecolor'] = COLORS["Light"]
-    plt.rcParams['axes.labelcolor'] = COLORS["Light"]
-    plt.rcParams['xtick.color'] = COLORS["Light"]
-    plt.rcParams['ytick.color'] = COLORS["Light"]
-    plt.rcParams['text.color'] = COLORS["Light"]
-    plt.rcParams['font.size'] = 10
-    plt.rcParams['font.family'] = 'sans-serif'
-
-
-def create_line_chart(data, title, xlabel, ylabel, save_path, dates=None):
-    _setup_style() # configure graph to fit a certain pre-defined style
-    fig, ax = plt.subplots(figsize=(10, 6), facecolor=COLORS["Dark"])
-    
-    if dates:
-        x_labels = [datetime.strptime(d[:10], "%Y-%m-%d").strftime("%m/%d") for d in dates]
-        ax.plot(range(len(data)), data, color=COLORS["Secondary"], linewidth=2, marker='o', markersize=4)
-        ax.set_xticks(range(len(data)))
-        ax.set_xticklabels(x_labels, rotation=45, ha='right')
-    else:
-        ax.plot(data, color=COLORS["Secondary"], linewidth=2, marker='o', markersize=4)
-    
-    ax.set_title(title, color=COLORS["Light"], fontsize=14, fontweight='bold', pad=20)
-    ax.set_xlabel(xlabel, color=COLORS["Light"], fontsize=11)
-    ax.set_ylabel(ylabel, color=COLORS["Light"], fontsize=11)
-    ax.grid(True, alpha=0.3, color=COLORS["Light"])
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=100, bbox_inches='tight', facecolor=COLORS["Dark"])
-    plt.close()
-    return save_path
-
-
-def create_bar_chart(data_dict, title, xlabel, ylabel, save_path):
-    _setup_style()
-    fig, ax = plt.subplots(figsize=(10, 6), facecolor=COLORS["Dark"])
-    
-    labels = list(data_dict.keys())
-    values = list(data_dict.values())
-    
-    bars = ax.bar(labels, values, color=COLORS["Primary"], edgecolor=COLORS["Light"], linewidth=1.5)
-    
-    # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{height:.1f}',
-                ha='center', va='bottom', color=COLORS["Light"], fontweight='bold')
-    
+    matplotlib.style.use('dark_background')
+    matplotlib.rcParams['figure.facecolor'] = COLORS["Dark"]
+    matplotlib.rcParams['axes.facecolor'] = COLORS["Dark"]
+    matplotlib.rcParams['axes.edgecolor'] = COLORS["Light"]
+    matplotlib.rcParams['axes.labelcolor'] = COLORS["Light"]
+    matplotlib.rcParams['xtick.color'] = COLORS["Light"]
+    matplotlib.rcParams['ytick.color'] = COLORS["Light"]
+    matplotlib.rcParams['text.color'] = COLORS["Light"]
+    matplotlib.rcParams['font.size'] = 10
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+
+
+# Set once here rather than per chart - figures only read rcParams when they are
+# created, so charts can then be rendered from worker threads
+_setup_style()
+
+
+_DEFAULT_SUBPLOT_PARAMS = {
+    side: matplotlib.rcParams[f"figure.subplot.{side}"]
+    for side in ("left", "right", "bottom", "top", "wspace", "hspace")
+}
+
+
+def _new_figure(figsize):
+    # A standalone Figure instead of pyplot, so there is no global figure state to share
+    fig = Figure(figsize=figsize, facecolor=COLORS["Dark"], dpi=100)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _render(fig):
+    """Draw the figure on its Agg canvas and return it as a PIL image"""
+    # tight_layout starts from the current subplot position, so reset it first or a
+    # reused figure comes out slightly different to a new one
+    fig.subplots_adjust(**_DEFAULT_SUBPLOT_PARAMS)
+    fig.tight_layout()
+    canvas = fig.canvas
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    # copy() so the image doesn't keep the canvas buffer (and the figure) alive
+    return Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1).copy()
+
+
+def _date_axis(ax, dates):
+    """
+    Label x positions 0..n-1 with dates, letting the locator pick how many ticks fit
+    rather than labelling every day
+    """
+    parsed = [datetime.strptime(d[:10], "%Y-%m-%d") for d in dates]
+    # Show the year once the range is long enough for the same day to repeat
+    long_range = parsed and (parsed[-1] - parsed[0]).days > 366
+    date_format = "%m/%d/%y" if long_range else "%m/%d"
+
+    def format_tick(x, pos):
+        index = int(round(x))
+        return parsed[index].strftime(date_format) if 0 <= index < len(parsed) else ''
+
+    ax.xaxis.set_major_locator(MaxNLocator(nbins=MAX_DATE_TICKS, integer=True, min_n_ticks=1))
+    ax.xaxis.set_major_formatter(FuncFormatter(format_tick))
+    ax.tick_params(axis='x', labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+
+
+def _set_labels(ax, title, xlabel, ylabel):
     ax.set_title(title, color=COLORS["Light"], fontsize=14, fontweight='bold', pad=20)
     ax.set_xlabel(xlabel, color=COLORS["Light"], fontsize=11)
     ax.set_ylabel(ylabel, color=COLORS["Light"], fontsize=11)
-    ax.grid(True, alpha=0.3, color=COLORS["Light"], axis='y')
-    
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=100, bbox_inches='tight', facecolor=COLORS["Dark"])
-    plt.close()
-    return save_path
-
-
-def create_pie_chart(data_dict, title, save_path):
-    _setup_style()
-    fig, ax = plt.subplots(figsize=(8, 8), facecolor=COLORS["Dark"])
-    
-    labels = list(data_dict.keys())
-    sizes = list(data_dict.values())
-    
-    colors_list = [COLORS["Primary"], COLORS["Secondary"], COLORS["Accent"], COLORS["Success"]]
-    
-    wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
-                                      colors=colors_list[:len(labels)],
-                                      startangle=90, textprops={'color': COLORS["Light"], 'fontsize': 11})
-    
-    for autotext in autotexts:
-        autotext.set_color(COLORS["Light"])
-        autotext.set_fontweight('bold')
-    
-    ax.set_title(title, color=COLORS["Light"], fontsize=14, fontweight='bold', pad=20)
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=100, bbox_inches='tight', facecolor=COLORS["Dark"])
-    plt.close()
-    return save_path
-
-
-def create_multi_line_chart(data_dict, title, xlabel, ylabel, save_path, dates=None):
-    _setup_style()
-    fig, ax = plt.subplots(figsize=(10, 6), facecolor=COLORS["Dark"])
-    
-    colors_list = [COLORS["Secondary"], COLORS["Primary"], COLORS["Accent"], COLORS["Success"]]
-    
-    for idx, (series_name, data) in enumerate(data_dict.items()):
-        color = colors_list[idx % len(colors_list)]
+
+
+def _autoscale(ax):
+    # Data limits don't follow set_data/set_height by themselves
+    ax.relim()
+    ax.autoscale_view()
+
+
+class ChartRenderer:
+    """
+    Keeps one figure per chart kind and redraws it with new data instead of building
+    a new figure for every chart. When a chart has the same shape as the last one of
+    its kind (same number of bars / series, dates or not) its artists are updated in
+    place with set_data / set_height, otherwise the axes are cleared and rebuilt.
+    Line series longer than the pixel budget (points_per_pixel times the figure width)
+    are downsampled with LTTB before plotting.
+    Not thread-safe - use one renderer per thread, as the create_* functions do.
+    """
+
+    FIGSIZES = {"line": (10, 6), "bar": (10, 6), "pie": (8, 8), "multi_line": (10, 6)}
+
+    def __init__(self, points_per_pixel=POINTS_PER_PIXEL):
+        self.points_per_pixel = points_per_pixel
+        self._figures = {}  # kind -> (fig, ax)
+        self._artists = {}  # kind -> (shape, artists) from the last chart of that kind
+
+    def render(self, kind, *args):
+        return getattr(self, f"{kind}_chart")(*args)
+
+    def _figure(self, kind):
+        if kind not in self._figures:
+            self._figures[kind] = _new_figure(self.FIGSIZES[kind])
+        return self._figures[kind]
+
+    def _reusable(self, kind, shape):
+        """Artists of the last chart of this kind if it had the same shape, else None"""
+        last = self._artists.get(kind)
+        if last is not None and last[0] == shape:
+            return last[1]
+        return None
+
+    def _set_series(self, line, fig, data):
+        """Point the line at data, downsampled to the figure's pixel budget"""
+        values = np.asarray(data, dtype=np.float64)
+        indices = np.arange(len(values))
+        if self.points_per_pixel is not None:
+            budget = max(3, int(fig.get_figwidth() * fig.dpi * self.points_per_pixel))
+            indices = lttb_indices(values, budget)
+        line.set_data(indices, values[indices])
+        line.set_marker('o' if len(indices) <= MAX_MARKERS else 'None')
+
+    def line_chart(self, data, title, xlabel, ylabel, dates=None):
+        fig, ax = self._figure("line")
+        shape = bool(dates)
+
+        line = self._reusable("line", shape)
+        if line is None:
+            ax.clear()
+            line, = ax.plot([], [], color=COLORS["Secondary"], linewidth=2, marker='o', markersize=4)
+            ax.grid(True, alpha=0.3, color=COLORS["Light"])
+            self._artists["line"] = (shape, line)
+
+        self._set_series(line, fig, data)
+        _autoscale(ax)
         if dates:
-            x_labels = [datetime.strptime(d[:10], "%Y-%m-%d").strftime("%m/%d") for d in dates]
-            ax.plot(range(len(data)), data, label=series_name, color=color, 
-                   linewidth=2, marker='o', markersize=4)
-            if idx == 0:  # Set x-axis labels only once
-                ax.set_xticks(range(len(data)))
-                ax.set_xticklabels(x_labels, rotation=45, ha='right')
-        else:
-            ax.plot(data, label=series_name, color=color, linewidth=2, marker='o', markersize=4)
-    
-    ax.set_title(title, color=COLORS["Light"], fontsize=14, fontweight='bold', pad=20)
-    ax.set_xlabel(xlabel, color=COLORS["Light"], fontsize=11)
-    ax.set_ylabel(ylabel, color=COLORS["Light"], fontsize=11)
-    ax.legend(loc='best', facecolor=COLORS["Dark"], edgecolor=COLORS["Light"], 
-             labelcolor=COLORS["Light"])
-    ax.grid(True, alpha=0.3, color=COLORS["Light"])
-    
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=100, bbox_inches='tight', facecolor=COLORS["Dark"])
-    plt.close()
-    return save_path
+            _date_axis(ax, dates[:len(data)])
+        _set_labels(ax, title, xlabel, ylabel)
+
+        return _render(fig)
+
+    def bar_chart(self, data_dict, title, xlabel, ylabel):
+        fig, ax = self._figure("bar")
+        labels = list(data_dict.keys())
+        values = list(data_dict.values())
+        shape = len(values)
+
+        artists = self._reusable("bar", shape)
+        if artists is None:
+            ax.clear()
+            bars = ax.bar(range(len(values)), values, color=COLORS["Primary"],
+                          edgecolor=COLORS["Light"], linewidth=1.5)
+            # Value labels on bars, text and position are filled in below
+            texts = [ax.text(bar.get_x() + bar.get_width()/2., 0, '',
+                             ha='center', va='bottom', color=COLORS["Light"], fontweight='bold')
+                     for bar in bars]
+            ax.grid(True, alpha=0.3, color=COLORS["Light"], axis='y')
+            artists = (bars, texts)
+            self._artists["bar"] = (shape, artists)
+
+        bars, texts = artists
+        for bar, text, value in zip(bars, texts, values):
+            bar.set_height(value)
+            height = bar.get_height()
+            text.set_y(height)
+            text.set_text(f'{height:.1f}')
+        _autoscale(ax)
+
+        ax.set_xticks(range(len(labels)))
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        _set_labels(ax, title, xlabel, ylabel)
+        return _render(fig)
+
+    def pie_chart(self, data_dict, title):
+        # Wedges can't be reshaped in place, so only the figure is reused here
+        fig, ax = self._figure("pie")
+        ax.clear()
+
+        labels = list(data_dict.keys())
+        sizes = list(data_dict.values())
+
+        colors_list = [COLORS["Primary"], COLORS["Secondary"], COLORS["Accent"], COLORS["Success"]]
+
+        wedges, texts, autotexts = ax.pie(sizes, labels=labels, autopct='%1.1f%%',
+                                          colors=colors_list[:len(labels)],
+                                          startangle=90, textprops={'color': COLORS["Light"], 'fontsize': 11})
+
+        for autotext in autotexts:
+            autotext.set_color(COLORS["Light"])
+            autotext.set_fontweight('bold')
+
+        ax.set_title(title, color=COLORS["Light"], fontsize=14, fontweight='bold', pad=20)
+
+        return _render(fig)
+
+    def multi_line_chart(self, data_dict, title, xlabel, ylabel, dates=None):
+        fig, ax = self._figure("multi_line")
+        shape = (len(data_dict), bool(dates))
+
+        lines = self._reusable("multi_line", shape)
+        if lines is None:
+            ax.clear()
+            colors_list = [COLORS["Secondary"], COLORS["Primary"], COLORS["Accent"], COLORS["Success"]]
+            lines = [
+                ax.plot([], [], color=colors_list[idx % len(colors_list)],
+                        linewidth=2, marker='o', markersize=4)[0]
+                for idx in range(len(data_dict))
+            ]
+            ax.grid(True, alpha=0.3, color=COLORS["Light"])
+            self._artists["multi_line"] = (shape, lines)
+
+        for line, (series_name, data) in zip(lines, data_dict.items()):
+            self._set_series(line, fig, data)
+            line.set_label(series_name)
+        _autoscale(ax)
+        if dates and data_dict:
+            # x-axis labels follow the first series
+            _date_axis(ax, dates[:len(next(iter(data_dict.values())))])
+
+        _set_labels(ax, title, xlabel, ylabel)
+        # Replaces the previous legend, so it picks up renamed series
+        ax.legend(loc='best', facecolor=COLORS["Dark"], edgecolor=COLORS["Light"],
+                  labelcolor=COLORS["Light"])
+
+        return _render(fig)
+
+
+_local = threading.local()
+
+
+def get_renderer():
+    """The calling thread's ChartRenderer"""
+    renderer = getattr(_local, "renderer", None)
+    if renderer is None:
+        renderer = _local.renderer = ChartRenderer()
+    return renderer
+
+
+def create_line_chart(data, title, xlabel, ylabel, dates=None):
+    return get_renderer().line_chart(data, title, xlabel, ylabel, dates)
+
+
+def create_bar_chart(data_dict, title, xlabel, ylabel):
+    return get_renderer().bar_chart(data_dict, title, xlabel, ylabel)
+
 
+def create_pie_chart(data_dict, title):
+    return get_renderer().pie_chart(data_dict, title)
 
-def get_temp_chart_path(filename):
-    temp_dir = tempfile.gettempdir()
-    return os.path.join(temp_dir, f"organiseu_chart_{filename}.png")
 
+def create_multi_line_chart(data_dict, title, xlabel, ylabel, dates=None):
+    return get_renderer().multi_line_chart(data_dict, title, xlabel, ylabel, dates)
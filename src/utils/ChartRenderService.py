@@ -0,0 +1,122 @@
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from utils import ChartGenerator
+from utils.ChartCache import ChartCache, ChartKey
+
+#* Renders charts in a pool of worker processes so the dashboard's figures are drawn
+#* in parallel instead of one after another. Callers describe each chart as a spec
+#* (plain data, so it can be pickled), e.g.
+#*   {"name": "task_trends", "title": "Task Completion Trends", "kind": "line", "args": [...]}
+#* and get a future per chart resolving to (spec, PIL image). Rendered images are
+#* cached by content, so an unchanged chart comes back without touching the pool.
+
+# Leave a core for the Tk main thread
+MAX_PROCESSES = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+CHART_KINDS = {
+    "line": ChartGenerator.create_line_chart,
+    "bar": ChartGenerator.create_bar_chart,
+    "pie": ChartGenerator.create_pie_chart,
+    "multi_line": ChartGenerator.create_multi_line_chart,
+}
+
+
+def _Warm():
+    # Unpickling this in a new worker imports this module, and with it matplotlib
+    return os.getpid()
+
+
+def RenderChartSpec(spec):
+    "Render one chart spec. Runs in a worker process, but works in-process too."
+    return spec, CHART_KINDS[spec["kind"]](*spec["args"])
+
+
+class ChartRenderService:
+    """
+    Owns a process pool that is started ahead of time (Warmup) and reused for every
+    dashboard. A broken pool (e.g. a worker was killed) is replaced on the next Submit.
+    """
+
+    def __init__(self, MaxProcesses=MAX_PROCESSES, Cache=None):
+        self.MaxProcesses = MaxProcesses
+        self.Cache = Cache if Cache is not None else ChartCache()
+        self._Pool = None
+        self._Lock = threading.Lock()
+
+    def _GetPool(self):
+        with self._Lock:
+            if self._Pool is None:
+                # spawn rather than fork - the GUI process has Tk and worker threads running
+                self._Pool = ProcessPoolExecutor(
+                    max_workers=self.MaxProcesses,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._Pool
+
+    def Warmup(self):
+        "Start the worker processes now so the first dashboard doesn't wait for them."
+        Pool = self._GetPool()
+        return [Pool.submit(_Warm) for _ in range(self.MaxProcesses)]
+
+    def Submit(self, spec):
+        "Queue one chart spec, returns a future of (spec, image)."
+        Key = ChartKey(spec["kind"], spec["args"], ChartGenerator.get_style_key())
+        Cached = self.Cache.Get(Key)
+        if Cached is not None:
+            Done = Future()
+            Done.set_result((spec, Cached))
+            return Done
+
+        try:
+            Rendering = self._GetPool().submit(RenderChartSpec, spec)
+        except BrokenProcessPool:
+            self._Reset()
+            Rendering = self._GetPool().submit(RenderChartSpec, spec)
+
+        def OnRendered(Finished):
+            if not Finished.cancelled() and Finished.exception() is None:
+                self.Cache.Put(Key, Finished.result()[1])
+
+        Rendering.add_done_callback(OnRendered)
+        return Rendering
+
+    def SubmitAll(self, specs):
+        return [self.Submit(spec) for spec in specs]
+
+    def _Reset(self):
+        with self._Lock:
+            Pool, self._Pool = self._Pool, None
+        if Pool is not None:
+            Pool.shutdown(wait=False, cancel_futures=True)
+
+    def Shutdown(self):
+        self._Reset()
+
+
+_Service = None
+_ServiceLock = threading.Lock()
+
+
+def GetChartRenderService():
+    "Return the shared render service, creating it on first use."
+    global _Service
+    with _ServiceLock:
+        if _Service is None:
+            _Service = ChartRenderService()
+        return _Service
+
+
+def ShutdownChartRenderService():
+    global _Service
+    with _ServiceLock:
+        Service, _Service = _Service, None
+    if Service is not None:
+        Service.Shutdown()
+
+
+atexit.register(ShutdownChartRenderService)
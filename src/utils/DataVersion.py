@@ -0,0 +1,28 @@
+import threading
+
+#* Per-user counters bumped by every write to a user's tasks or habits.
+#* Caches key their entries on the version, so a write makes older entries unreachable.
+
+_Versions = {}
+_GlobalVersion = 0
+_Lock = threading.Lock()
+
+
+def BumpDataVersion(Username):
+    "Mark a user's data as changed. A None username (e.g. a row that didn't exist) is ignored."
+    if Username is None:
+        return
+    with _Lock:
+        _Versions[Username] = _Versions.get(Username, 0) + 1
+
+
+def BumpAllDataVersions():
+    "Invalidate every user's data, e.g. after a bulk rebuild or schema change."
+    global _GlobalVersion
+    with _Lock:
+        _GlobalVersion += 1
+
+
+def GetDataVersion(Username):
+    with _Lock:
+        return (_GlobalVersion, _Versions.get(Username, 0))
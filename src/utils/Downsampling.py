@@ -0,0 +1,42 @@
+import numpy as np
+
+#* Largest-Triangle-Three-Buckets downsampling for line charts. Picks the points that
+#* keep the visual shape of a series (peaks and dips survive, unlike plain striding),
+#* so years of daily values can be drawn with a few hundred points.
+
+
+def lttb_indices(values, threshold):
+    """
+    Indices of the points to keep out of values (y, with x = 0..n-1), at most
+    threshold of them. The first and last points are always kept. Returns every
+    index when the series is already short enough.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    count = len(values)
+    if threshold >= count or threshold < 3:
+        return np.arange(count)
+
+    # The points between the first and last are split into threshold - 2 buckets
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.int64)
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, count - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # The third corner of the triangle is the average of the next bucket
+        if bucket + 2 < len(edges):
+            next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_end = count - 1, count
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = values[next_start:next_end].mean()
+
+        xs = np.arange(start, end)
+        ys = values[start:end]
+        # Twice the triangle area, the constant factor doesn't change the argmax
+        areas = np.abs((previous - avg_x) * (ys - values[previous]) - (previous - xs) * (avg_y - values[previous]))
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+
+    return selected
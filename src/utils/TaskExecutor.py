@@ -0,0 +1,157 @@
+import atexit
+import logging
+import queue
+import threading
+import tkinter
+from concurrent.futures import ThreadPoolExecutor
+
+#* Runs database/analytics work off the Tk main thread. Jobs go to a shared thread pool,
+#* results come back through a per-widget queue that is drained with widget.after, so
+#* callbacks always run on the main thread where it is safe to touch widgets.
+
+MAX_WORKERS = 4
+
+_Logger = logging.getLogger(__name__)
+
+_Pool = None
+_PoolLock = threading.Lock()
+
+
+def GetWorkerPool():
+    "Return the shared worker pool, creating it on first use."
+    global _Pool
+    with _PoolLock:
+        if _Pool is None:
+            _Pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="OrganiseUWorker")
+        return _Pool
+
+
+def ShutdownWorkerPool():
+    global _Pool
+    with _PoolLock:
+        Pool, _Pool = _Pool, None
+    if Pool is not None:
+        Pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(ShutdownWorkerPool)
+
+
+class TaskExecutor:
+    """
+    Submit work for a widget and get OnSuccess(result) / OnError(exception) called back
+    on the Tk main thread. Jobs submitted with the same Key replace each other: an older
+    job that hasn't started is cancelled, and its result is dropped if it already ran.
+    Nothing is called back once the widget has been destroyed.
+    """
+
+    POLL_INTERVAL = 25  # ms between checks of the result queue while jobs are pending
+
+    def __init__(self, Widget):
+        self.Widget = Widget
+        self._Results = queue.Queue()
+        self._Generations = {}  # key -> generation of the latest job submitted with it
+        self._Futures = {}  # key -> future of the latest job submitted with it
+        self._Pending = 0
+        self._Polling = False
+        self._Closed = False
+        # tkinter's own bind, CTk widgets redirect bind() to their inner canvas
+        tkinter.Misc.bind(Widget, "<Destroy>", self._OnDestroy, add="+")
+
+    def Submit(self, Func, *Args, OnSuccess=None, OnError=None, Key=None):
+        if self._Closed:
+            return None
+        Future = GetWorkerPool().submit(Func, *Args)
+        return self.Watch(Future, OnSuccess=OnSuccess, OnError=OnError, Key=Key)
+
+    def Watch(self, Future, OnSuccess=None, OnError=None, Key=None):
+        """
+        Call back when a future from any executor (e.g. a process pool) finishes.
+        Submit uses this for the shared thread pool.
+        """
+        if self._Closed:
+            Future.cancel()
+            return None
+
+        Generation = None
+        if Key is not None:
+            self.Cancel(Key)
+            Generation = self._Generations[Key]
+            self._Futures[Key] = Future
+        self._Pending += 1
+
+        def OnDone(Done):
+            # Runs on whichever thread finished the future, so only hand the result over
+            if Done.cancelled():
+                self._Results.put((Key, Generation, None, None))  # still counts as finished
+                return
+            Error = Done.exception()
+            if Error is not None:
+                self._Results.put((Key, Generation, OnError or self._DefaultOnError, Error))
+            else:
+                self._Results.put((Key, Generation, OnSuccess, Done.result()))
+
+        Future.add_done_callback(OnDone)
+        self._StartPolling()
+        return Future
+
+    def Cancel(self, Key):
+        "Drop the job running under Key, if any. Returns True if it hadn't started yet."
+        self._Generations[Key] = self._Generations.get(Key, 0) + 1
+        Future = self._Futures.pop(Key, None)
+        return Future is not None and Future.cancel()
+
+    def CancelAll(self, Prefix=""):
+        "Cancel every keyed job, or only those whose key starts with Prefix."
+        for Key in list(self._Futures):
+            if str(Key).startswith(Prefix):
+                self.Cancel(Key)
+
+    def IsBusy(self, Key=None):
+        if Key is None:
+            return self._Pending > 0
+        return Key in self._Futures
+
+    # ========= Main thread side =========
+    def _StartPolling(self):
+        if not self._Polling:
+            self._Polling = True
+            self.Widget.after(self.POLL_INTERVAL, self._Poll)
+
+    def _Poll(self):
+        self._Polling = False
+        if self._Closed:
+            return
+
+        while True:
+            try:
+                Key, Generation, Callback, Value = self._Results.get_nowait()
+            except queue.Empty:
+                break
+            self._Pending -= 1
+
+            if Key is not None:
+                if self._Generations.get(Key) != Generation:
+                    continue  # superseded by a newer job with the same key
+                self._Futures.pop(Key, None)
+            if Callback is None:
+                continue
+            try:
+                Callback(Value)
+            except Exception:
+                _Logger.exception("Background task callback failed")
+            if self._Closed:  # the callback may have destroyed the widget
+                return
+
+        if self._Pending > 0:
+            self._StartPolling()
+
+    def _DefaultOnError(self, Error):
+        # Jobs with a placeholder to show the failure in pass their own OnError
+        _Logger.warning("Background task failed: %s", Error, exc_info=Error)
+
+    def _OnDestroy(self, event):
+        # <Destroy> is also delivered for every child widget
+        if event.widget is self.Widget:
+            self._Closed = True
+            self.CancelAll()
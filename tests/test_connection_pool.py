@@ -0,0 +1,49 @@
+import sqlite3
+import pytest
+from utils.AuthenticationWrapper import CloseAllConnections, ConnectionPool, GetDBConnection
+
+
+@pytest.fixture
+def DBPath(tmp_path):
+    Path = str(tmp_path / "pool.db")
+    with sqlite3.connect(Path) as Conn:
+        Conn.execute("CREATE TABLE t (x INTEGER)")
+    yield Path
+    CloseAllConnections()
+
+
+def test_nested_checkout_shares_connection(DBPath):
+    with GetDBConnection(DBPath) as Outer:
+        with GetDBConnection(DBPath) as Inner:
+            assert Inner is Outer
+        # The inner release must not hand back or close the outer block's connection
+        Outer.execute("SELECT 1").fetchone()
+
+
+def test_close_all_inside_nested_checkout(DBPath):
+    with GetDBConnection(DBPath) as Outer:
+        Outer.execute("INSERT INTO t VALUES (1)")
+        with GetDBConnection(DBPath) as Inner:
+            CloseAllConnections()
+            assert Inner is Outer
+            Inner.execute("SELECT count(*) FROM t").fetchone()
+        # Still checked out by this block, so still open after the inner release
+        Outer.execute("INSERT INTO t VALUES (2)")
+        Outer.commit()
+
+    # Closed once the outermost checkout was released
+    with pytest.raises(sqlite3.ProgrammingError):
+        Outer.execute("SELECT 1")
+    with GetDBConnection(DBPath) as Conn:
+        assert Conn is not Outer
+        assert Conn.execute("SELECT count(*) FROM t").fetchone()[0] == 2
+
+
+def test_close_all_closes_idle_connections(DBPath):
+    Pool = ConnectionPool(DBPath)
+    Conn = Pool.Acquire()
+    Pool.Release(Conn)
+    Pool.CloseAll()
+    assert Pool.Size() == 0
+    with pytest.raises(sqlite3.ProgrammingError):
+        Conn.execute("SELECT 1")
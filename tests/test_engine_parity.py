@@ -0,0 +1,74 @@
+import datetime
+import os
+import random
+import sqlite3
+import sys
+import pytest
+from core.HabitManager import HabitManager
+from core.TaskManager import TaskManager
+from utils.AuthenticationWrapper import CloseAllConnections
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tools"))
+
+from CheckEngineParity import CompareEngines  # noqa: E402
+
+USERNAMES = ("alice", "bobby", "carol")
+
+
+@pytest.fixture
+def DBPath(tmp_path):
+    "Several users' tasks and habits with gaps in the history, deletions and rows for today."
+    Path = str(tmp_path / "parity.db")
+    Tasks = TaskManager(Path)
+    Habits = HabitManager(Path)
+    Rand = random.Random(7)
+    Today = datetime.date.today()
+
+    Conn = sqlite3.connect(Path)
+    for Username in USERNAMES:
+        TaskIDs = []
+        for Index in range(120):
+            Day = Today - datetime.timedelta(days=Rand.choice([0, 1, 2, 5, 9, 30, 45, 90, 200]))
+            Cursor = Conn.execute(
+                "INSERT INTO tasks (username, title, status, created_at) VALUES (?, ?, ?, ?)",
+                (Username, f"task {Index}", Rand.choice(["pending", "completed"]),
+                 f"{Day.isoformat()} {Rand.randint(0, 23):02d}:15:00"),
+            )
+            TaskIDs.append(Cursor.lastrowid)
+        Conn.commit()
+
+        HabitIDs = []
+        for Index in range(4):
+            HabitID = Habits.AddHabit(
+                Username, f"habit {Index}", 1, Rand.choice(["increase", "decrease"]), 2, 8,
+                (Today + datetime.timedelta(days=30)).isoformat(),
+            )
+            HabitIDs.append(HabitID)
+            for Back in range(1, 100):
+                if Rand.random() < 0.7:  # leave gaps in the tracking history
+                    Day = Today - datetime.timedelta(days=Back)
+                    Conn.execute(
+                        "INSERT OR REPLACE INTO habit_tracking (habit_id, date, count, suggested_target) VALUES (?, ?, ?, ?)",
+                        (HabitID, Day.isoformat(), Rand.randint(0, 9), Rand.randint(0, 8)),
+                    )
+            Conn.commit()
+
+        # Today's rows go through the increment buffer like clicks in the app
+        for HabitID in HabitIDs[:3]:
+            for _ in range(Rand.randint(1, 4)):
+                Habits.IncrementHabit(HabitID)
+        Habits.FlushIncrements()
+
+        for TaskID in TaskIDs[:10]:
+            Tasks.CompleteTask(TaskID)
+        for TaskID in TaskIDs[-15:]:
+            Tasks.DeleteTask(TaskID)
+        Habits.DeleteHabit(HabitIDs[-1])
+    Conn.close()
+
+    yield Path
+    CloseAllConnections()
+
+
+def test_numpy_and_python_engines_agree(DBPath):
+    assert CompareEngines(DBPath, USERNAMES) == []
@@ -0,0 +1,158 @@
+"""
+Run EXPLAIN QUERY PLAN on every query TaskManager, HabitManager and AnalyticsProcessor issue.
+
+Works on a temporary copy of the database: a throwaway user gets a task, subtasks
+and a habit, then every manager and analytics method is called while a trace
+callback records the SQL each one runs (schema migrations are skipped).
+Full table/index scans are flagged, --verbose prints every plan. Exits with status 1 if any were found.
+
+Run from the repository root:
+    python tools/AuditQueryPlans.py [--db src/core/UsersDatabase.db] [--verbose]
+"""
+
+import argparse
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import traceback
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.AnalyticsProcessor import AnalyticsProcessor  # noqa: E402
+from core.AuditLog import CloseAuditLogWriters  # noqa: E402
+from core.Auth import Auth  # noqa: E402
+from core.HabitManager import HabitManager  # noqa: E402
+from core.TaskManager import TaskManager  # noqa: E402
+from utils.AuthenticationWrapper import AddConnectionHook, CloseAllConnections, RemoveConnectionHook  # noqa: E402
+
+AUDITED_MODULES = ("TaskManager", "HabitManager", "HabitIncrementBuffer", "AnalyticsProcessor")
+AUDIT_USER = "plan_audit"
+TIME_RANGES = ("today", "this_week", "this_month", "all_time")
+
+# "SCAN tasks" reads the whole table, "SCAN tasks USING INDEX ..." the whole index
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?: USING (?:COVERING )?INDEX \w+)?$")
+
+
+def _Caller():
+    "Module.method of the innermost audited frame on the stack, or None."
+    for Frame in reversed(traceback.extract_stack()):
+        Module = os.path.splitext(os.path.basename(Frame.filename))[0]
+        if Module == "Migrations":
+            return None  # schema setup (and its one-off rollup backfill) scans by design
+        if Module in AUDITED_MODULES:
+            return f"{Module}.{Frame.name}"
+    return None
+
+
+def _RunWorkload(DBPath):
+    "Call every public manager and analytics method for AUDIT_USER."
+    Auth(DBPath).RegisterUser(AUDIT_USER, "Audit-Passw0rd!", 5, 5, 5, 5)
+    Tasks = TaskManager(DBPath)
+    Habits = HabitManager(DBPath)
+    Analytics = AnalyticsProcessor(DBPath)
+
+    TaskID = Tasks.AddTask(AUDIT_USER, "Audit task", "Audit description", ["First step", "Second step"])
+    SubtaskID = Tasks.AddSubtask(TaskID, "Third step")
+    Tasks.GetTasks(AUDIT_USER)
+    Tasks.GetSubtasks(TaskID)
+    Tasks.GetTasksWithSubtasks(AUDIT_USER)
+    Tasks.GetTasksPage(AUDIT_USER, Limit=1)
+    Tasks.GetTasksPage(AUDIT_USER, BeforeID=TaskID + 1, Limit=1)
+    Tasks.GetTaskWithSubtasks(TaskID)
+    Tasks.CountTasks(AUDIT_USER)
+    Tasks.CompleteSubtask(SubtaskID)
+    Tasks.CompleteTask(TaskID)
+
+    HabitID = Habits.AddHabit(AUDIT_USER, "Audit habit", 1, "increase", 2, 10, "2099-01-01")
+    Habits.CheckAndGenerateDailyGoals(AUDIT_USER)
+    Habits.GetUserHabits(AUDIT_USER)
+    Habits.GetTodayData(HabitID)
+    Habits.IncrementHabit(HabitID)
+    Habits.FlushIncrements()
+
+    for TimeRange in TIME_RANGES:
+        Analytics.get_task_stats(AUDIT_USER, TimeRange)
+        Analytics.get_task_trends(AUDIT_USER, TimeRange)
+        Analytics.get_habit_stats(AUDIT_USER, TimeRange)
+        Analytics.get_habit_trends(AUDIT_USER, TimeRange)
+        Analytics.get_productivity_score(AUDIT_USER, TimeRange)
+        Analytics.get_overall_trends(AUDIT_USER, TimeRange)
+    Analytics.get_task_summary(AUDIT_USER)
+    Analytics.get_task_comparison(AUDIT_USER)
+    Analytics.get_task_forecast(AUDIT_USER)
+    Analytics.get_habit_streaks(AUDIT_USER)
+    Analytics.get_habit_comparison(AUDIT_USER)
+    Analytics.get_habit_forecast(AUDIT_USER)
+
+    Habits.DeleteHabit(HabitID)
+    Tasks.DeleteTask(TaskID)
+
+
+def CaptureQueries(DBPath):
+    "Run the workload against DBPath, returning [(caller, sql)] in first-seen order."
+    Captured = {}
+
+    def Trace(Statement):
+        Caller = _Caller()
+        if Caller is not None:
+            Captured.setdefault((Caller, " ".join(Statement.split())), None)
+
+    def Hook(Conn):
+        Conn.set_trace_callback(Trace)
+
+    AddConnectionHook(Hook)
+    try:
+        _RunWorkload(DBPath)
+    finally:
+        RemoveConnectionHook(Hook)
+        CloseAuditLogWriters()  # write queued audit events before the copy is deleted
+        CloseAllConnections()
+    return list(Captured)
+
+
+def ExplainQueries(DBPath, Queries):
+    "Return [(caller, sql, plan details, full scans)] for the DML statements in Queries."
+    Results = []
+    Conn = sqlite3.connect(DBPath)
+    try:
+        for Caller, Sql in Queries:
+            if Sql.split(" ", 1)[0].upper() not in ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE"):
+                continue
+            Plan = [Row[3] for Row in Conn.execute(f"EXPLAIN QUERY PLAN {Sql}")]
+            Scans = [Detail for Detail in Plan if FULL_SCAN.match(Detail)]
+            Results.append((Caller, Sql, Plan, Scans))
+    finally:
+        Conn.close()
+    return Results
+
+
+def main():
+    Parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    Parser.add_argument("--db", default="src/core/UsersDatabase.db")
+    Parser.add_argument("--verbose", action="store_true", help="print the plan of every query, not just the flagged ones")
+    Args = Parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as TempDir:
+        DBPath = os.path.join(TempDir, "Audit.db")
+        if os.path.exists(Args.db):
+            shutil.copyfile(Args.db, DBPath)
+        Results = ExplainQueries(DBPath, CaptureQueries(DBPath))
+
+    Flagged = 0
+    for Caller, Sql, Plan, Scans in Results:
+        if not Scans and not Args.verbose:
+            continue
+        Flagged += bool(Scans)
+        print(f"{'FULL SCAN' if Scans else 'ok':<10}{Caller}")
+        print(f"    {Sql}")
+        for Detail in Plan:
+            print(f"      {'!' if Detail in Scans else '-'} {Detail}")
+    print(f"Audited {len(Results)} queries, {Flagged} with full scans")
+    sys.exit(1 if Flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Time bcrypt at each work factor on this machine and show the cost Auth would pick.
+
+Auth hashes new and reset passwords with the highest cost that fits its latency
+budget (HASH_LATENCY_BUDGET), never below MIN_BCRYPT_COST, and rehashes passwords
+stored with a lower cost on login. This prints the measured time per cost so the
+budget can be chosen for the hardware it runs on.
+
+Run from the repository root:
+    python tools/CalibrateBcrypt.py [--budget 0.25] [--max-cost 14]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bcrypt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.Auth import HASH_LATENCY_BUDGET, MAX_BCRYPT_COST, MIN_BCRYPT_COST, CalibrateBcryptCost  # noqa: E402
+
+
+def TimeCost(Cost, Repeats=2):
+    "Best of Repeats hashes at Cost, in seconds."
+    Best = None
+    for _ in range(Repeats):
+        Start = time.perf_counter()
+        bcrypt.hashpw(b"calibration-Passw0rd!", bcrypt.gensalt(rounds=Cost))
+        Elapsed = time.perf_counter() - Start
+        Best = Elapsed if Best is None else min(Best, Elapsed)
+    return Best
+
+
+def main():
+    Parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    Parser.add_argument("--budget", type=float, default=HASH_LATENCY_BUDGET, help="seconds per hash")
+    Parser.add_argument("--max-cost", type=int, default=14, help="highest cost to time (each step doubles)")
+    Args = Parser.parse_args()
+
+    print(f"{'cost':>4}  {'time':>9}")
+    for Cost in range(MIN_BCRYPT_COST, Args.max_cost + 1):
+        Elapsed = TimeCost(Cost)
+        print(f"{Cost:>4}  {Elapsed * 1000:>7.0f}ms{'  over budget' if Elapsed > Args.budget else ''}")
+
+    Chosen = CalibrateBcryptCost(Args.budget, MIN_BCRYPT_COST, MAX_BCRYPT_COST)
+    print(f"Calibrated cost for a {Args.budget * 1000:.0f}ms budget: {Chosen}")
+
+
+if __name__ == "__main__":
+    main()
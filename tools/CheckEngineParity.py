@@ -0,0 +1,64 @@
+"""
+Compare the python and numpy analytics engines on an existing database.
+
+Runs every trend-based AnalyticsProcessor method for each user and time range with
+both engines and reports any output that differs. Exits with status 1 on a mismatch.
+
+Run from the repository root:
+    python tools/CheckEngineParity.py [--db src/core/UsersDatabase.db] [--user USERNAME]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.AnalyticsProcessor import AnalyticsProcessor  # noqa: E402
+from utils.AuthenticationWrapper import GetDBConnection  # noqa: E402
+
+TIME_RANGES = ("today", "this_week", "this_month", "all_time")
+METHODS = (
+    "get_task_trends",
+    "get_habit_trends",
+    "get_overall_trends",
+    "get_productivity_score",
+)
+
+
+def _Usernames(DBPath):
+    with GetDBConnection(DBPath) as Conn:
+        Cursor = Conn.cursor()
+        Cursor.execute("SELECT username FROM tasks UNION SELECT username FROM habits")
+        return sorted(Row[0] for Row in Cursor.fetchall())
+
+
+def CompareEngines(DBPath, Usernames):
+    "Return a list of (username, method, time_range) whose outputs differ between engines."
+    Python = AnalyticsProcessor(DBPath, engine="python")
+    Numpy = AnalyticsProcessor(DBPath, engine="numpy")
+    Mismatches = []
+    for Username in Usernames:
+        for Method in METHODS:
+            for TimeRange in TIME_RANGES:
+                if getattr(Python, Method)(Username, TimeRange) != getattr(Numpy, Method)(Username, TimeRange):
+                    Mismatches.append((Username, Method, TimeRange))
+    return Mismatches
+
+
+def main():
+    Parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    Parser.add_argument("--db", default="src/core/UsersDatabase.db")
+    Parser.add_argument("--user", default=None, help="only check this user")
+    Args = Parser.parse_args()
+
+    Usernames = [Args.user] if Args.user else _Usernames(Args.db)
+    Mismatches = CompareEngines(Args.db, Usernames)
+    for Username, Method, TimeRange in Mismatches:
+        print(f"MISMATCH {Method}({Username!r}, {TimeRange!r})")
+    print(f"Checked {len(Usernames)} user(s), {len(Mismatches)} mismatch(es)")
+    sys.exit(1 if Mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Recompute the daily_task_rollup and daily_habit_rollup tables from raw data.
+
+The rollups are created and backfilled by a schema migration the first time the app
+opens a database, and triggers keep them current after that. Use this if a database was
+edited outside the app or the rollups are suspected to have drifted.
+
+Run from the repository root:
+    python tools/RebuildRollups.py [--db src/core/UsersDatabase.db] [--user USERNAME]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.Migrations import EnsureMigrated  # noqa: E402
+from core.RollupManager import RollupManager  # noqa: E402
+
+
+def main():
+    Parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    Parser.add_argument("--db", default="src/core/UsersDatabase.db")
+    Parser.add_argument("--user", default=None, help="only rebuild this user's rows")
+    Args = Parser.parse_args()
+
+    # Make sure the tables and triggers exist before rebuilding
+    EnsureMigrated(Args.db)
+
+    RollupManager(Args.db).Rebuild(Args.user)
+    print(f"Rebuilt rollups for {Args.user or 'all users'} in {Args.db}")
+
+
+if __name__ == "__main__":
+    main()